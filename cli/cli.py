@@ -1,11 +1,21 @@
 #CLI DE BACKGAMMON
 from typing import Optional
 from core.game import Game
+from core.notation import texto_jugada
+from engine.search import Buscador
 
 
 class CLI:
-    def __init__(self):
+    def __init__(self, cantidad_pistas: int = 3, tiempo_pista: float = 0.5, profundidad_pista: int = 3):
+        """
+        :param cantidad_pistas: jugadas que muestra la opción de pista.
+        :param tiempo_pista: segundos máximos para calcular una pista.
+        :param profundidad_pista: profundidad máxima de la profundización iterativa.
+        """
         self.__juego__: Optional[Game] = None
+        self.__cantidad_pistas__ = cantidad_pistas
+        self.__tiempo_pista__ = tiempo_pista
+        self.__buscador_pistas__ = Buscador(profundidad=profundidad_pista)
 
     # UTILIDADES
 
@@ -138,6 +148,31 @@ class CLI:
         except Exception as e:
             print(f"Error al mostrar estado: {e}")
 
+    @staticmethod
+    def __formatear_jugada__(jugada) -> str:
+        """Jugada en puntos 1-24 para el usuario, p. ej. '12/6 17/12' o 'barra/20'."""
+        return texto_jugada(jugada) or "(sin movimientos)"
+
+    def __mostrar_pista__(self) -> None:
+        """
+        Muestra las mejores jugadas para los dados restantes con su equidad,
+        calculadas con profundización iterativa dentro del tiempo configurado.
+        """
+        try:
+            resultados, profundidad = self.__buscador_pistas__.profundizar_en_juego(
+                self.__juego__, self.__tiempo_pista__)
+        except Exception as e:
+            print(f"No se pudo calcular la pista: {e}")
+            return
+        segundos = self.__buscador_pistas__.obtener_estadisticas().segundos
+        if profundidad:
+            print(f"Pista (profundidad {profundidad}, {segundos:.2f}s):")
+        else:
+            # El tiempo no alcanzó ni para una búsqueda completa a profundidad 1
+            print(f"Pista (evaluación estática, {segundos:.2f}s):")
+        for numero, (jugada, valor) in enumerate(resultados[:self.__cantidad_pistas__], 1):
+            print(f"  {numero}. {self.__formatear_jugada__(jugada)}  equidad {valor:+.3f}")
+
     # EL MENU Y FLUJO DE EL JUEGO
 
     def __menu_turno__(self, *, tiene_fichas_en_barra: bool) -> bool:
@@ -151,8 +186,9 @@ class CLI:
             print("1. Reincorporar ficha desde la barra")
             print("2. Ver tablero")
             print("3. Salir (abandonar partida)")
+            print("4. Pedir pista")
             
-            opcion = self.__leer_entero_en_rango__("Opción", 1, 3)
+            opcion = self.__leer_entero_en_rango__("Opción", 1, 4)
             if opcion is None: return True
 
             if opcion == 1:
@@ -176,6 +212,10 @@ class CLI:
                     raise SystemExit(0)
                 return True
 
+            if opcion == 4:
+                self.__mostrar_pista__()
+                return True
+
         else:
             
             # 1. Preguntamos al 'core' si sacar fichas es legal
@@ -192,8 +232,9 @@ class CLI:
             print(f"{2 + op_sacar}. Ver tablero")
             print(f"{3 + op_sacar}. Pasar turno (finalizar)")
             print(f"{4 + op_sacar}. Salir (abandonar partida)")
+            print(f"{5 + op_sacar}. Pedir pista")
 
-            max_opcion = 4 + op_sacar
+            max_opcion = 5 + op_sacar
             opcion = self.__leer_entero_en_rango__("Opción", 1, max_opcion)
             if opcion is None: return True
 
@@ -235,6 +276,10 @@ class CLI:
                     print("Fin del juego por decisión del usuario.")
                     raise SystemExit(0)
                 return True
+
+            if opcion == (5 + op_sacar):
+                self.__mostrar_pista__()
+                return True
         
         return True
 
@@ -1,52 +1,399 @@
-from core.checker import Ficha 
+import random
+from array import array
+from core.checker import Ficha
+from core.tables import PIPS, DADO_SALIDA, SENTIDO
 from typing import Optional
 
+# Representación compacta: cada punto guarda un conteo con signo.
+# Positivo = fichas 'B', negativo = fichas 'N', 0 = punto vacío.
+_SIGNO = {'B': 1, 'N': -1}
+# Índice de cada color en los contadores de barra y fuera ([blancas, negras]).
+_INDICE = {'B': 0, 'N': 1}
+# Las fichas son inmutables: las vistas de compatibilidad reutilizan una por color.
+_FICHA = {'B': Ficha('B'), 'N': Ficha('N')}
+# Máximo de fichas por color (y por lo tanto por punto, barra o fuera).
+MAX_FICHAS = 15
+# Orígenes/destinos especiales de un submovimiento (misma convención que la UI).
+BARRA = 24
+FUERA = -1
+
+# --- Claves de Zobrist ---
+# Generadas con semilla fija para que el hash de una posición sea estable
+# entre ejecuciones y procesos (sirve como clave de caché persistente).
+# El conteo 0 usa clave 0: un punto/barra/fuera vacío no aporta al hash.
+_rng_zobrist = random.Random(0x6B6D6F6E)
+
+
+def _claves_zobrist(cantidad):
+    return [0] + [_rng_zobrist.getrandbits(64) for _ in range(cantidad - 1)]
+
+
+def _claves_punto():
+    # Índice = conteo + MAX_FICHAS (conteos -15..15); el conteo 0 queda en el centro.
+    negativos = [_rng_zobrist.getrandbits(64) for _ in range(MAX_FICHAS)]
+    positivos = [_rng_zobrist.getrandbits(64) for _ in range(MAX_FICHAS)]
+    return negativos + [0] + positivos
+
+
+_ZOBRIST_PUNTOS = [_claves_punto() for _ in range(24)]
+_ZOBRIST_BARRA = [_claves_zobrist(MAX_FICHAS + 1) for _ in range(2)]
+_ZOBRIST_FUERA = [_claves_zobrist(MAX_FICHAS + 1) for _ in range(2)]
+_ZOBRIST_TURNO_NEGRO = _rng_zobrist.getrandbits(64)
+
+# --- Tablas para los agregados incrementales ---
+# Derivadas de la geometría de core.tables: los pips de una ficha en cada
+# punto (PIPS) son la distancia que le queda hasta salir ('B': 24 - i;
+# 'N': i + 1); una ficha en la barra cuenta 25.
+PIPS_BARRA = 25
+# 1 si el punto está fuera de la casa del color ('B': 18-23, 'N': 0-5).
+_FUERA_DE_CASA = tuple(tuple(int(dado is None) for dado in DADO_SALIDA[c]) for c in (0, 1))
+_MASCARA_CASA = tuple(sum(1 << i for i in range(24) if DADO_SALIDA[c][i]) for c in (0, 1))
+
+
+def _color_de_fichas(fichas) -> Optional[str]:
+    """
+    Devuelve el color común de una lista de Ficha (None si está vacía).
+    Un punto, la barra o la zona de fuera no pueden mezclar colores.
+    """
+    colores = {ficha.obtener_color() for ficha in fichas}
+    if len(colores) > 1:
+        raise ValueError("Una pila no puede contener fichas de ambos colores.")
+    return colores.pop() if colores else None
+
+
+class _VistaPuntos:
+    """
+    Vista de compatibilidad de los 24 puntos como listas de Ficha.
+    Permite leer un punto (lista nueva) o reemplazarlo completo
+    (tablero.__puntos__[i] = [Ficha('B')]); no guarda estado propio.
+    """
+
+    def __init__(self, tablero):
+        self.__tablero__ = tablero
+
+    def __len__(self):
+        return 24
+
+    def __getitem__(self, indice):
+        return self.__tablero__._fichas_en_punto(indice)
+
+    def __setitem__(self, indice, fichas):
+        self.__tablero__._fijar_punto(indice, fichas)
+
+    def __iter__(self):
+        for i in range(24):
+            yield self.__tablero__._fichas_en_punto(i)
+
+
+class _VistaPila:
+    """
+    Vista de compatibilidad de la barra o de las fichas fuera de un color
+    como lista de Ficha (append/pop/len), respaldada por un contador entero.
+    """
+
+    def __init__(self, tablero, zona, color):
+        self.__tablero__ = tablero
+        self.__zona__ = zona
+        self.__color__ = color
+
+    def __len__(self):
+        return self.__tablero__._obtener_contador(self.__zona__, self.__color__)
+
+    def __iter__(self):
+        return iter([_FICHA[self.__color__]] * len(self))
+
+    def __getitem__(self, indice):
+        return ([_FICHA[self.__color__]] * len(self))[indice]
+
+    def __eq__(self, otra):
+        try:
+            return len(otra) == len(self) and all(f.obtener_color() == self.__color__ for f in otra)
+        except (TypeError, AttributeError):
+            return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def append(self, ficha):
+        """Agrega una ficha del color de la pila."""
+        if ficha.obtener_color() != self.__color__:
+            raise ValueError("La ficha no corresponde al color de la pila.")
+        self.__tablero__._fijar_contador(self.__zona__, self.__color__, len(self) + 1)
+
+    def pop(self):
+        """Quita y devuelve una ficha de la pila."""
+        cantidad = len(self)
+        if cantidad == 0:
+            raise IndexError("pop from empty list")
+        self.__tablero__._fijar_contador(self.__zona__, self.__color__, cantidad - 1)
+        return _FICHA[self.__color__]
+
+    def clear(self):
+        """Vacía la pila."""
+        self.__tablero__._fijar_contador(self.__zona__, self.__color__, 0)
+
+
 class Tablero:
     """
     Representa el tablero de Backgammon con 24 puntos.
     (Versión estable con reglas de 'Dado Mayor' y 'Todos en Casa')
+
+    Internamente usa una representación compacta: un arreglo de 24 enteros
+    con signo (positivo 'B', negativo 'N') y contadores enteros para barra
+    y fichas fuera. Los atributos __puntos__, __barra_*__ y __fuera_*__ se
+    mantienen como vistas de listas de Ficha por compatibilidad.
     """
 
     def __init__(self):
         """
         Inicializa el tablero con 24 puntos y las posiciones estándar de las fichas.
         """
-        self.__puntos__ = [[] for _ in range(24)] 
-        self.__barra_blanco__ = []  
-        self.__barra_negro__ = []   
-        self.__fuera_blanco__ = []  
-        self.__fuera_negro__ = []   
+        self.__conteos__ = array('b', bytes(24))
+        self.__barra__ = [0, 0]   # [blancas, negras]
+        self.__fuera__ = [0, 0]   # [blancas, negras]
+        self.__zobrist__ = 0      # hash de Zobrist de 64 bits (sin turno)
+        self.__deshacer__ = []    # pila de submovimientos aplicados (enteros codificados)
         self.__inicializar_fichas__()
 
     def __inicializar_fichas__(self):
         """
-        Coloca las fichas (objetos Ficha) en las posiciones iniciales.
+        Coloca las fichas en las posiciones iniciales.
         (Versión Corregida para coincidir con el tablero estándar)
         """
-        self.__puntos__ = [[] for _ in range(24)]
-        
+        self.__conteos__ = array('b', bytes(24))
+
         # --- FICHAS BLANCAS ('B') ---
-        # (Se mueven hacia índices MENORES; su casa es 18-23)
-        self.__puntos__[23] = [Ficha('B') for _ in range(2)] # Punto 24
-        self.__puntos__[11] = [Ficha('B') for _ in range(5)] # Punto 12
-        self.__puntos__[16] = [Ficha('B') for _ in range(3)] # Punto 17
-        self.__puntos__[18] = [Ficha('B') for _ in range(5)] # Punto 19
+        # (Se mueven hacia índices MAYORES; su casa es 18-23)
+        self.__conteos__[0]  = 2   # Punto 1
+        self.__conteos__[11] = 5   # Punto 12
+        self.__conteos__[16] = 3   # Punto 17
+        self.__conteos__[18] = 5   # Punto 19
 
         # --- FICHAS NEGRAS ('N') ---
-        # (Se mueven hacia índices MAYORES; su casa es 0-5)
-        self.__puntos__[0]  = [Ficha('N') for _ in range(2)] # Punto 1
-        self.__puntos__[12] = [Ficha('N') for _ in range(5)] # Punto 13
-        self.__puntos__[7]  = [Ficha('N') for _ in range(3)] # Punto 8
-        # Nota: dejamos el punto 6 (índice 5) vacío para tests que reincorporan 'B' en 5
+        # (Se mueven hacia índices MENORES; su casa es 0-5)
+        self.__conteos__[23] = -2  # Punto 24
+        self.__conteos__[12] = -5  # Punto 13
+        self.__conteos__[7]  = -3  # Punto 8
+        self.__conteos__[5]  = -5  # Punto 6
+        self._recalcular_hash()
+        self._recalcular_agregados()
+
+    # --- Primitivas de escritura (mantienen hash y agregados incrementales) ---
+
+    def _poner_punto(self, indice, nuevo):
+        """
+        Fija el conteo con signo de un punto actualizando en O(1) el hash,
+        los pips, las fichas fuera de casa y las máscaras de ocupación.
+        """
+        viejo = self.__conteos__[indice]
+        claves = _ZOBRIST_PUNTOS[indice]
+        self.__zobrist__ ^= claves[viejo + MAX_FICHAS] ^ claves[nuevo + MAX_FICHAS]
+        self.__conteos__[indice] = nuevo
+
+        delta_b = (nuevo if nuevo > 0 else 0) - (viejo if viejo > 0 else 0)
+        delta_n = (-nuevo if nuevo < 0 else 0) - (-viejo if viejo < 0 else 0)
+        bit = 1 << indice
+        if delta_b:
+            self.__pips__[0] += delta_b * PIPS[0][indice]
+            self.__fuera_de_casa__[0] += delta_b * _FUERA_DE_CASA[0][indice]
+            self.__mascaras__[0] = self.__mascaras__[0] | bit if nuevo > 0 else self.__mascaras__[0] & ~bit
+        if delta_n:
+            self.__pips__[1] += delta_n * PIPS[1][indice]
+            self.__fuera_de_casa__[1] += delta_n * _FUERA_DE_CASA[1][indice]
+            self.__mascaras__[1] = self.__mascaras__[1] | bit if nuevo < 0 else self.__mascaras__[1] & ~bit
+
+    def _poner_barra(self, indice_color, nuevo):
+        """Fija el contador de barra de un color actualizando hash y agregados en O(1)."""
+        viejo = self.__barra__[indice_color]
+        claves = _ZOBRIST_BARRA[indice_color]
+        self.__zobrist__ ^= claves[viejo] ^ claves[nuevo]
+        self.__barra__[indice_color] = nuevo
+        self.__pips__[indice_color] += (nuevo - viejo) * PIPS_BARRA
+        self.__fuera_de_casa__[indice_color] += nuevo - viejo
+
+    def _poner_fuera(self, indice_color, nuevo):
+        """Fija el contador de fichas fuera de un color actualizando el hash en O(1)."""
+        claves = _ZOBRIST_FUERA[indice_color]
+        self.__zobrist__ ^= claves[self.__fuera__[indice_color]] ^ claves[nuevo]
+        self.__fuera__[indice_color] = nuevo
+
+    def _recalcular_hash(self):
+        """
+        Recalcula el hash de Zobrist desde cero.
+        Devuelve el valor calculado (útil para verificar el hash incremental).
+        """
+        h = 0
+        for i, n in enumerate(self.__conteos__):
+            h ^= _ZOBRIST_PUNTOS[i][n + MAX_FICHAS]
+        for c in (0, 1):
+            h ^= _ZOBRIST_BARRA[c][self.__barra__[c]]
+            h ^= _ZOBRIST_FUERA[c][self.__fuera__[c]]
+        self.__zobrist__ = h
+        return h
+
+    def _recalcular_agregados(self):
+        """
+        Recalcula desde cero pips, fichas fuera de casa y máscaras de ocupación.
+        Devuelve (pips, fuera_de_casa, mascaras) para verificar los valores incrementales.
+        """
+        pips = [PIPS_BARRA * self.__barra__[0], PIPS_BARRA * self.__barra__[1]]
+        fuera_de_casa = [self.__barra__[0], self.__barra__[1]]
+        mascaras = [0, 0]
+        for i, n in enumerate(self.__conteos__):
+            c = 0 if n > 0 else 1
+            if n:
+                pips[c] += abs(n) * PIPS[c][i]
+                fuera_de_casa[c] += abs(n) * _FUERA_DE_CASA[c][i]
+                mascaras[c] |= 1 << i
+        self.__pips__ = pips
+        self.__fuera_de_casa__ = fuera_de_casa
+        self.__mascaras__ = mascaras
+        return list(pips), list(fuera_de_casa), list(mascaras)
+
+    # --- Vistas de compatibilidad (listas de Ficha) ---
+
+    def _fichas_en_punto(self, indice):
+        """Devuelve el punto como una lista nueva de Ficha."""
+        n = self.__conteos__[indice]
+        if n > 0:
+            return [_FICHA['B']] * n
+        return [_FICHA['N']] * -n
+
+    def _fijar_punto(self, indice, fichas):
+        """Reemplaza el contenido completo de un punto a partir de una lista de Ficha."""
+        color = _color_de_fichas(fichas)
+        if len(fichas) > MAX_FICHAS:
+            raise ValueError("Un punto no puede tener más de 15 fichas.")
+        self._poner_punto(indice, _SIGNO[color] * len(fichas) if color else 0)
+
+    def _obtener_contador(self, zona, color):
+        """Devuelve el contador de 'barra' o 'fuera' para un color."""
+        contadores = self.__barra__ if zona == 'barra' else self.__fuera__
+        return contadores[_INDICE[color]]
+
+    def _fijar_contador(self, zona, color, cantidad):
+        """Fija el contador de 'barra' o 'fuera' para un color."""
+        if not 0 <= cantidad <= MAX_FICHAS:
+            raise ValueError("Cantidad de fichas fuera de rango (0-15).")
+        if zona == 'barra':
+            self._poner_barra(_INDICE[color], cantidad)
+        else:
+            self._poner_fuera(_INDICE[color], cantidad)
+
+    def _fijar_pila(self, zona, color, fichas):
+        """Fija barra o fuera a partir de una lista de Ficha."""
+        color_fichas = _color_de_fichas(fichas)
+        if color_fichas is not None and color_fichas != color:
+            raise ValueError("La ficha no corresponde al color de la pila.")
+        self._fijar_contador(zona, color, len(fichas))
+
+    @property
+    def __puntos__(self):
+        return _VistaPuntos(self)
+
+    @__puntos__.setter
+    def __puntos__(self, puntos):
+        if len(puntos) != 24:
+            raise ValueError("El tablero debe tener 24 puntos.")
+        for i, fichas in enumerate(puntos):
+            self._fijar_punto(i, fichas)
+
+    @property
+    def __barra_blanco__(self):
+        return _VistaPila(self, 'barra', 'B')
+
+    @__barra_blanco__.setter
+    def __barra_blanco__(self, fichas):
+        self._fijar_pila('barra', 'B', fichas)
+
+    @property
+    def __barra_negro__(self):
+        return _VistaPila(self, 'barra', 'N')
+
+    @__barra_negro__.setter
+    def __barra_negro__(self, fichas):
+        self._fijar_pila('barra', 'N', fichas)
+
+    @property
+    def __fuera_blanco__(self):
+        return _VistaPila(self, 'fuera', 'B')
+
+    @__fuera_blanco__.setter
+    def __fuera_blanco__(self, fichas):
+        self._fijar_pila('fuera', 'B', fichas)
+
+    @property
+    def __fuera_negro__(self):
+        return _VistaPila(self, 'fuera', 'N')
+
+    @__fuera_negro__.setter
+    def __fuera_negro__(self, fichas):
+        self._fijar_pila('fuera', 'N', fichas)
+
+    # --- API pública ---
+
+    def obtener_conteos(self):
+        """
+        Devuelve una copia de los conteos con signo de los 24 puntos
+        (positivo = fichas 'B', negativo = fichas 'N').
+        """
+        return list(self.__conteos__)
+
+    def vista_conteos(self):
+        """
+        Devuelve los conteos con signo de los 24 puntos como una vista de sólo
+        lectura, sin copiarlos (para los bucles del motor). La vista refleja
+        los movimientos posteriores, pero no un cargar_posicion.
+        """
+        return memoryview(self.__conteos__).toreadonly()
+
+    def obtener_mascara(self, color: str) -> int:
+        """Devuelve la máscara de bits (bit i = punto i) de los puntos ocupados por 'color'."""
+        return self.__mascaras__[0 if color == 'B' else 1]
+
+    def obtener_barra(self):
+        """Devuelve las fichas en la barra como (blancas, negras)."""
+        return tuple(self.__barra__)
+
+    def obtener_fuera(self):
+        """Devuelve las fichas fuera del tablero como (blancas, negras)."""
+        return tuple(self.__fuera__)
+
+    def cargar_posicion(self, conteos, barra=(0, 0), fuera=(0, 0)):
+        """
+        Reemplaza la posición completa en un solo paso.
+        :param conteos: 24 conteos con signo (positivo 'B', negativo 'N').
+        :param barra: fichas en la barra (blancas, negras).
+        :param fuera: fichas fuera del tablero (blancas, negras).
+        """
+        if len(conteos) != 24:
+            raise ValueError("El tablero debe tener 24 puntos.")
+        for cantidad in (*barra, *fuera, *(abs(n) for n in conteos)):
+            if not 0 <= cantidad <= MAX_FICHAS:
+                raise ValueError("Cantidad de fichas fuera de rango (0-15).")
+        self.__conteos__ = array('b', conteos)
+        self.__barra__ = [barra[0], barra[1]]
+        self.__fuera__ = [fuera[0], fuera[1]]
+        self.__deshacer__.clear()
+        self._recalcular_hash()
+        self._recalcular_agregados()
+
+    def obtener_hash(self, color_turno: Optional[str] = None) -> int:
+        """
+        Devuelve el hash de Zobrist de 64 bits de la posición.
+        Cubre conteos de puntos, barra y fichas fuera; se mantiene de forma
+        incremental en cada movimiento, por lo que la consulta es O(1).
+        Si se indica color_turno ('B' o 'N') se incluye el jugador que mueve.
+        """
+        if color_turno == 'N':
+            return self.__zobrist__ ^ _ZOBRIST_TURNO_NEGRO
+        return self.__zobrist__
 
     def obtener_estado(self):
         """
         Devuelve una representación del estado actual del tablero.
         """
-        estado_como_strings = []
-        for punto in self.__puntos__:
-            estado_como_strings.append([ficha.obtener_color() for ficha in punto])
-        return estado_como_strings
+        return [['B'] * n if n > 0 else ['N'] * -n for n in self.__conteos__]
 
     def mostrar_tablero(self):
         """
@@ -61,22 +408,25 @@ class Tablero:
         """
         if origen < 0 or origen > 23 or destino < 0 or destino > 23:
             raise ValueError("Índices de puntos deben estar entre 0 y 23.")
-        
-        if not self.__puntos__[origen] or self.__puntos__[origen][-1].obtener_color() != color:
+
+        conteos = self.__conteos__
+        signo = _SIGNO.get(color, 0)
+        if conteos[origen] * signo <= 0:
             raise ValueError("No hay ficha del color especificado en el punto de origen.")
-        
-        if len(self.__puntos__[destino]) >= 2 and self.__puntos__[destino][-1].obtener_color() != color:
+
+        # Conteo del destino visto desde el color que mueve (negativo = rival)
+        en_destino = conteos[destino] * signo
+        if en_destino <= -2:
             raise ValueError("Movimiento inválido: el punto de destino está bloqueado.")
-        
-        if len(self.__puntos__[destino]) == 1 and self.__puntos__[destino][0].obtener_color() != color:
-            ficha_capturada = self.__puntos__[destino].pop()
-            if ficha_capturada.obtener_color() == 'B':
-                self.__barra_blanco__.append(ficha_capturada)
-            else:
-                self.__barra_negro__.append(ficha_capturada)
-        
-        ficha = self.__puntos__[origen].pop()
-        self.__puntos__[destino].append(ficha)
+
+        if en_destino == -1:
+            # Captura: la ficha rival va a su barra
+            self._poner_punto(destino, 0)
+            rival = 1 - _INDICE[color]
+            self._poner_barra(rival, self.__barra__[rival] + 1)
+
+        self._poner_punto(origen, conteos[origen] - signo)
+        self._poner_punto(destino, conteos[destino] + signo)
 
     def reincorporar_ficha(self, color, punto):
         """
@@ -84,101 +434,179 @@ class Tablero:
         """
         if punto < 0 or punto > 23:
             raise ValueError("Índice de punto debe estar entre 0 y 23.")
-        
+
         if color not in ('B', 'N'):
             raise ValueError("Color debe ser 'B' o 'N'.")
-        
-        if color == 'B':
-            if not self.__barra_blanco__:
+
+        indice = _INDICE[color]
+        if self.__barra__[indice] == 0:
+            if color == 'B':
                 raise ValueError("No hay fichas blancas en la barra para reincorporar.")
-        else: 
-            if not self.__barra_negro__:
-                raise ValueError("No hay fichas negras en la barra para reincorporar.")
-        
-        if len(self.__puntos__[punto]) >= 2 and self.__puntos__[punto][-1].obtener_color() != color:
+            raise ValueError("No hay fichas negras en la barra para reincorporar.")
+
+        conteos = self.__conteos__
+        signo = _SIGNO[color]
+        en_destino = conteos[punto] * signo
+        if en_destino <= -2:
             raise ValueError("Movimiento inválido: el punto de destino está bloqueado.")
-        
-        if len(self.__puntos__[punto]) == 1 and self.__puntos__[punto][0].obtener_color() != color:
-            ficha_capturada = self.__puntos__[punto].pop()
-            if ficha_capturada.obtener_color() == 'B':
-                self.__barra_blanco__.append(ficha_capturada)
-            else:
-                self.__barra_negro__.append(ficha_capturada)
-        
-        if color == 'B':
-            ficha = self.__barra_blanco__.pop()
-            self.__puntos__[punto].append(ficha)
-        else: 
-            ficha = self.__barra_negro__.pop()
-            self.__puntos__[punto].append(ficha)
+
+        if en_destino == -1:
+            self._poner_punto(punto, 0)
+            self._poner_barra(1 - indice, self.__barra__[1 - indice] + 1)
+
+        self._poner_barra(indice, self.__barra__[indice] - 1)
+        self._poner_punto(punto, conteos[punto] + signo)
 
     def sacar_ficha(self, origen, color):
         """
         Saca una ficha del tablero (cuando llega al final).
         """
-        if self.__puntos__[origen] and self.__puntos__[origen][-1].obtener_color() == color:
-            ficha = self.__puntos__[origen].pop()
-            if color == 'B':
-                self.__fuera_blanco__.append(ficha)
-            else:
-                self.__fuera_negro__.append(ficha)
+        signo = _SIGNO.get(color, 0)
+        if self.__conteos__[origen] * signo > 0:
+            self._poner_punto(origen, self.__conteos__[origen] - signo)
+            indice = _INDICE[color]
+            self._poner_fuera(indice, self.__fuera__[indice] + 1)
         else:
             raise ValueError("No hay ficha de ese color para sacar.")
-    
+
+    def aplicar(self, color, origen, destino) -> bool:
+        """
+        Aplica un submovimiento SIN validar reglas y lo apila para deshacerlo.
+        Pensado para búsquedas: el llamador garantiza que es legal.
+        :param origen: punto 0-23 o BARRA.
+        :param destino: punto 0-23 o FUERA.
+        :return: True si el movimiento golpeó una ficha rival.
+        """
+        signo = _SIGNO[color]
+        indice = _INDICE[color]
+        if origen == BARRA:
+            self._poner_barra(indice, self.__barra__[indice] - 1)
+        else:
+            self._poner_punto(origen, self.__conteos__[origen] - signo)
+
+        golpe = 0
+        if destino == FUERA:
+            self._poner_fuera(indice, self.__fuera__[indice] + 1)
+        else:
+            n = self.__conteos__[destino]
+            if n == -signo:
+                golpe = 1
+                self._poner_barra(1 - indice, self.__barra__[1 - indice] + 1)
+                self._poner_punto(destino, signo)
+            else:
+                self._poner_punto(destino, n + signo)
+
+        # Registro: origen+1 (5 bits) | destino+1 (5 bits) | golpe | color
+        self.__deshacer__.append((origen + 1) | ((destino + 1) << 5) | (golpe << 10) | (indice << 11))
+        return bool(golpe)
+
+    def deshacer(self):
+        """
+        Revierte exactamente el último submovimiento hecho con aplicar().
+        """
+        if not self.__deshacer__:
+            raise ValueError("No hay movimientos para deshacer.")
+        registro = self.__deshacer__.pop()
+        origen = (registro & 0x1F) - 1
+        destino = ((registro >> 5) & 0x1F) - 1
+        golpe = (registro >> 10) & 1
+        indice = registro >> 11
+        signo = 1 if indice == 0 else -1
+
+        if destino == FUERA:
+            self._poner_fuera(indice, self.__fuera__[indice] - 1)
+        elif golpe:
+            self._poner_punto(destino, -signo)
+            self._poner_barra(1 - indice, self.__barra__[1 - indice] - 1)
+        else:
+            self._poner_punto(destino, self.__conteos__[destino] - signo)
+
+        if origen == BARRA:
+            self._poner_barra(indice, self.__barra__[indice] + 1)
+        else:
+            self._poner_punto(origen, self.__conteos__[origen] + signo)
+
+    def movimientos_aplicados(self) -> int:
+        """Devuelve cuántos submovimientos hay en la pila de deshacer."""
+        return len(self.__deshacer__)
+
     def hay_ganador(self, color):
         """
         Verifica si el jugador ha ganado (todas sus fichas fuera).
         """
-        if color == 'B':
-            return len(self.__fuera_blanco__) == 15
-        else:
-            return len(self.__fuera_negro__) == 15
+        return self.obtener_fichas_fuera(color) == 15
 
     def obtener_fichas_barra(self, color):
         """
         Devuelve el número de fichas que un color tiene en la barra.
         """
-        if color == 'B':
-            return len(self.__barra_blanco__)
-        else:
-            return len(self.__barra_negro__)
+        return self.__barra__[0 if color == 'B' else 1]
 
     def obtener_fichas_fuera(self, color):
         """
         Devuelve el número de fichas que un color tiene fuera del tablero.
         """
-        if color == 'B':
-            return len(self.__fuera_blanco__)
-        else:
-            return len(self.__fuera_negro__)
+        return self.__fuera__[0 if color == 'B' else 1]
 
-    def todas_las_fichas_en_casa(self, color: str) -> bool:
+    def obtener_pips(self, color: str) -> int:
+        """
+        Devuelve el pip count de un color en O(1): suma de la distancia que
+        le queda a cada ficha en su sentido de avance ('B': 24 - i,
+        'N': i + 1; barra = 25). Mover una ficha 'dado' puntos lo baja en 'dado'.
+        """
+        return self.__pips__[0 if color == 'B' else 1]
+
+    def fichas_fuera_de_casa(self, color: str) -> int:
         """
-        Verifica si todas las fichas activas de un jugador están 
-        en su cuadrante de casa.
+        Devuelve en O(1) cuántas fichas activas de un color están fuera de su
+        casa (incluye las de la barra).
+        """
+        return self.__fuera_de_casa__[0 if color == 'B' else 1]
+
+    def punto_mas_lejano(self, color: str) -> Optional[int]:
+        """
+        Devuelve en O(1) el punto ocupado más lejano de la salida para un color:
+        BARRA si tiene fichas en la barra, el índice del punto si no, o None
+        si no le quedan fichas en el tablero.
         """
         if color == 'B':
-            # Casa de Blancas es 18-23
-            if len(self.__barra_blanco__) > 0:
-                return False
-            # Comprobar que no hay 'B' fuera de 18-23
-            for i in list(range(18)):
-                for ficha in self.__puntos__[i]:
-                    if ficha.obtener_color() == 'B':
-                        return False
-            return True
+            if self.__barra__[0]:
+                return BARRA
+            mascara = self.__mascaras__[0]
+            # 'B' sale por 24: lo más lejano es el menor índice
+            return (mascara & -mascara).bit_length() - 1 if mascara else None
+        if self.__barra__[1]:
+            return BARRA
+        mascara = self.__mascaras__[1]
+        # 'N' sale por 0: lo más lejano es el mayor índice
+        return mascara.bit_length() - 1 if mascara else None
 
-        else: # color == 'N'
-            # Casa de Negras es 0-5
-            if len(self.__barra_negro__) > 0:
-                return False
-            # Comprobar que no hay 'N' fuera de 0-5
-            for i in range(6, 24):
-                for ficha in self.__puntos__[i]:
-                    if ficha.obtener_color() == 'N':
-                        return False
+    def hay_contacto(self) -> bool:
+        """
+        Verifica en O(1) (con las máscaras incrementales) si todavía puede
+        haber golpes: hay fichas en la barra o las fichas de ambos colores
+        todavía tienen que cruzarse. Con el sentido de core.tables ('B' hacia
+        índices mayores) hay contacto si la 'B' más atrasada (menor índice)
+        está por debajo de la 'N' más atrasada (mayor índice). Sin contacto la
+        partida es una carrera pura.
+        """
+        if self.__barra__[0] or self.__barra__[1]:
             return True
-    
+        blancas, negras = self.__mascaras__
+        if not blancas or not negras:
+            return False
+        if SENTIDO[0] < 0:
+            blancas, negras = negras, blancas
+        # bit_length del bit más bajo = índice + 1 de la ficha más baja
+        return (blancas & -blancas).bit_length() < negras.bit_length()
+
+    def todas_las_fichas_en_casa(self, color: str) -> bool:
+        """
+        Verifica si todas las fichas activas de un jugador están
+        en su cuadrante de casa (O(1), usa el contador incremental).
+        """
+        return self.fichas_fuera_de_casa(color) == 0
+
     def _get_farthest_checker_in_home(self, color: str) -> Optional[int]:
         """
         Encuentra el índice del punto más lejano *dentro* de la casa
@@ -187,17 +615,11 @@ class Tablero:
         if color == 'B':
             # Casa 'B' es 18-23 y la salida está en 24.
             # La ficha más lejana es la de menor índice.
-            for i in range(18, 24):
-                if self.__puntos__[i]:
-                    if self.__puntos__[i][0].obtener_color() == 'B':
-                        return i
-            return None
+            mascara = self.__mascaras__[0] & _MASCARA_CASA[0]
+            return (mascara & -mascara).bit_length() - 1 if mascara else None
 
         else: # color == 'N'
             # Casa 'N' es 0-5 y la salida está en 0.
             # La ficha más lejana es la de mayor índice.
-            for i in range(5, -1, -1):
-                if self.__puntos__[i]:
-                    if self.__puntos__[i][0].obtener_color() == 'N':
-                        return i
-            return None
\ No newline at end of file
+            mascara = self.__mascaras__[1] & _MASCARA_CASA[1]
+            return mascara.bit_length() - 1 if mascara else None
@@ -1,31 +1,50 @@
 import random
+
+# Caras posibles de un dado
+_CARAS = (1, 2, 3, 4, 5, 6)
+
+
 class Dado:
-    
+
     # Representa los dados de Backgammon.
     # Compatibiliza varios nombres internos de atributos para facilitar testing
     # Permite tirar dos dados de seis caras y consultar sus valores.
+    #
+    # Fuente de azar:
+    # - Por defecto usa random.randint del módulo global (comportamiento original).
+    # - rng: un generador inyectado, ya sea random.Random (usa choices) o un
+    #   numpy.random.Generator (usa integers); se reconoce por sus métodos.
+    # - semilla: atajo para rng=random.Random(semilla).
+    # - lote: si es > 0, las tiradas se generan en bloques de 'lote' tiradas y se
+    #   sirven desde un buffer (una sola llamada al generador por bloque).
 
     __dado1_variantes__ = ('_Dado__dado1__', '_Dado__dado1', '__dado1__', '__dado1')
     __dado2_variantes__ = ('_Dado__dado2__', '_Dado__dado2', '__dado2__', '__dado2')
 
-    def __init__(self):
+    def __init__(self, rng=None, semilla=None, lote: int = 0):
         """Inicializa los valores de los dados en None (crea todas las variantes)."""
-        self._set_dado1(None)
-        self._set_dado2(None)
+        if rng is not None and semilla is not None:
+            raise ValueError("Indicar rng o semilla, no ambos.")
+        if lote < 0:
+            raise ValueError("El tamaño de lote no puede ser negativo.")
+        if rng is None and (semilla is not None or lote):
+            rng = random.Random(semilla)
+        if rng is not None and not (hasattr(rng, 'integers') or hasattr(rng, 'choices')):
+            raise TypeError("El generador debe ser random.Random o numpy.random.Generator.")
+        self.__rng__ = rng
+        self.__lote__ = lote
+        self.__buffer__ = []
+        self.__posicion__ = 0
+        self._set_valores(None, None)
 
     def _get_dado1(self):
         """Método interno para obtener el valor del dado 1."""
-        for n in self.__dado1_variantes__:
-            if hasattr(self, n):
-                return getattr(self, n)
-        return None # pragma: no cover 
+        # La primera variante siempre existe: _set_valores la crea en __init__
+        return self._Dado__dado1__
 
     def _get_dado2(self):
         """Método interno para obtener el valor del dado 2."""
-        for n in self.__dado2_variantes__:
-            if hasattr(self, n):
-                return getattr(self, n)
-        return None # pragma: no cover "para que el coverage no lo cubra o lo tome."
+        return self._Dado__dado2__
 
     def _set_dado1(self, value):
         """Método interno para establecer el valor del dado 1."""
@@ -37,17 +56,56 @@ class Dado:
         for n in self.__dado2_variantes__:
             setattr(self, n, value)
 
+    def _set_valores(self, v1, v2):
+        """Establece ambos dados en todas las variantes sin recorrer las tuplas de nombres."""
+        d = self.__dict__
+        d['_Dado__dado1__'] = d['_Dado__dado1'] = d['__dado1__'] = d['__dado1'] = v1
+        d['_Dado__dado2__'] = d['_Dado__dado2'] = d['__dado2__'] = d['__dado2'] = v2
+
+    def _generar(self, cantidad):
+        """Genera 'cantidad' valores de dado con el generador inyectado."""
+        rng = self.__rng__
+        if hasattr(rng, 'integers'):
+            return rng.integers(1, 7, size=cantidad).tolist()
+        return rng.choices(_CARAS, k=cantidad)
+
     def tirar(self):
         """
         Lanza los dos dados y guarda sus valores.
         :return: tupla con los valores de los dos dados.
         """
-        v1 = random.randint(1, 6)
-        v2 = random.randint(1, 6)
-        self._set_dado1(v1)
-        self._set_dado2(v2)
+        if self.__rng__ is None:
+            v1 = random.randint(1, 6)
+            v2 = random.randint(1, 6)
+        elif self.__lote__:
+            buffer = self.__buffer__
+            i = self.__posicion__
+            if i >= len(buffer):
+                buffer = self.__buffer__ = self._generar(2 * self.__lote__)
+                i = 0
+            v1 = buffer[i]
+            v2 = buffer[i + 1]
+            self.__posicion__ = i + 2
+        else:
+            v1, v2 = self._generar(2)
+        self._set_valores(v1, v2)
         return (v1, v2)
 
+    def sembrar(self, semilla):
+        """
+        Reinicia el generador con una semilla (para reproducir una secuencia).
+        Con un numpy.random.Generator se crea uno nuevo del mismo tipo de bit generator.
+        """
+        rng = self.__rng__
+        if rng is None:
+            self.__rng__ = random.Random(semilla)
+        elif hasattr(rng, 'integers'):
+            self.__rng__ = type(rng)(type(rng.bit_generator)(semilla))
+        else:
+            rng.seed(semilla)
+        self.__buffer__ = []
+        self.__posicion__ = 0
+
     def es_doble(self):
         """
         Indica si la tirada es doble (ambos dados iguales).
@@ -68,5 +126,4 @@ class Dado:
         """
         Reinicia los valores de los dados a None (actualiza todas las variantes).
         """
-        self._set_dado1(None)
-        self._set_dado2(None)
\ No newline at end of file
+        self._set_valores(None, None)
@@ -1,6 +1,13 @@
 from core.player import Player
 from core.board import Tablero
 from core.dice import Dado 
+from core.position_id import codificar_id_posicion, decodificar_id_posicion
+from core.moves import generar_jugadas, submovimientos
+from core.board import BARRA, FUERA
+from core.tables import (
+    INDICE_COLOR, SIGNO, SENTIDO, DESTINO, SALIDA, SALIDA_EXACTA, SALIDA_CON_MAYOR,
+    ENTRADA, DADO_ENTRADA, DADO_SALIDA,
+)
 from typing import Optional
 
 class Game:
@@ -9,14 +16,15 @@ class Game:
     (Versión estable con reglas de 'Dado Mayor' y 'Todos en Casa')
     """
     
-    def __init__(self, nombre_jugador1, nombre_jugador2):
+    def __init__(self, nombre_jugador1, nombre_jugador2, dados: Optional[Dado] = None):
         """
         Inicializa el juego con dos jugadores y un tablero.
+        :param dados: Dado opcional (por ejemplo con semilla o generador inyectado).
         """
         self.__jugador1__ = Player(nombre_jugador1, "blanco")
         self.__jugador2__ = Player(nombre_jugador2, "negro")
         self.__tablero__ = Tablero()
-        self.__dados__ = Dado()
+        self.__dados__ = dados if dados is not None else Dado()
         self.__turno_actual__ = self.__jugador1__
         self.__juego_terminado__ = False
         self.__ganador__ = None
@@ -83,29 +91,18 @@ class Game:
             return False
 
         color = 'B' if self.__turno_actual__.obtener_color() == 'blanco' else 'N'
-        estado = self.__tablero__.obtener_estado()  # lista de listas de 'B'/'N'
-
-        # Para cada valor de dado disponible, calcular punto de entrada
-        # Blancas reingresan en 0..5 con punto = dado-1
-        # Negras reingresan en 18..23 con punto = 24-dado
-        def punto_entrada(dado: int) -> int:
-            if color == 'B':
-                return dado - 1
-            else:
-                return 24 - dado
+        c = INDICE_COLOR[color]
+        conteos = self.__tablero__.obtener_conteos()
 
+        # Punto de entrada por dado desde la tabla precalculada
+        # (Blancas reingresan en 0..5; Negras en 18..23)
         # ¿Existe al menos un reingreso legal?
         for d in set(self.__movimientos_disponibles__):
-            p = punto_entrada(d)
-            if p < 0 or p > 23:
+            if not 1 <= d <= 6:
                 continue
-            pila = estado[p]
-            # Bloqueado sólo si hay 2+ del rival
-            if len(pila) >= 2 and pila[-1] != color:
-                # bloqueado para este dado
-                continue
-            # Si len==0, len==1 (blot rival) o hay propias, es legal
-            return False
+            # Bloqueado sólo si hay 2+ del rival (conteo visto desde el color <= -2)
+            if conteos[ENTRADA[c][d]] * SIGNO[c] >= -1:
+                return False
 
         # Si ningún dado permite reingresar, pasar turno automáticamente
         # Marcar motivo y pasar turno
@@ -145,56 +142,37 @@ class Game:
             return False
 
         color = 'B' if self.__turno_actual__.obtener_color() == 'blanco' else 'N'
-        estado = self.__tablero__.obtener_estado()
+        c = INDICE_COLOR[color]
+        signo = SIGNO[c]
+        conteos = self.__tablero__.obtener_conteos()
+        movs = [d for d in movs if 1 <= d <= 6]
 
         # 1) Si hay fichas en barra, basta con que exista un reingreso legal
         if self.jugador_actual_tiene_fichas_en_barra():
-            def punto_entrada(dado: int) -> int:
-                return (dado - 1) if color == 'B' else (24 - dado)
-            for d in movs:
-                p = punto_entrada(d)
-                if 0 <= p <= 23:
-                    pila = estado[p]
-                    if not (len(pila) >= 2 and pila and pila[-1] != color):
-                        return True
-            return False
+            return any(conteos[ENTRADA[c][d]] * signo >= -1 for d in movs)
+
         puede_sacar = self.jugador_puede_sacar_fichas()
         farthest = None
         if puede_sacar:
             farthest = self.__tablero__._get_farthest_checker_in_home(color)
 
         for i in range(24):
-            pila = estado[i]
-            if not pila or pila[-1] != color:
+            if conteos[i] * signo <= 0:
                 continue
 
             for d in movs:
-                # Dirección correcta: Blancas hacia índices menores; Negras hacia mayores
-                destino = (i - d) if color == 'B' else (i + d)
-
-                # Movimiento dentro del tablero
-                if 0 <= destino <= 23:
-                    dest_pila = estado[destino]
-                    if len(dest_pila) >= 2 and dest_pila and dest_pila[-1] != color:
-                        continue
-                    # No bloqueado -> es legal
+                # Movimiento dentro del tablero (la tabla ya aplica la dirección)
+                destino = DESTINO[c][d][i]
+                if destino is not None and conteos[destino] * signo >= -1:
                     return True
 
-                # Intento de sacar ficha (fuera del 0..23)
-                if not puede_sacar:
-                    continue
-
-                if color == 'B':
-                    # Para blancas, sacar desde i requiere dado exacto 24 - i
-                    dado_necesario = 24 - i
-                else:
-                    # Para negras, sacar desde i requiere dado exacto i + 1
-                    dado_necesario = i + 1
-
-                if d == dado_necesario:
-                    return True
-                if d > dado_necesario and farthest is not None and farthest == i:
-                    return True
+                # Sacar ficha: dado exacto, o mayor sólo desde la ficha más lejana
+                if puede_sacar:
+                    salida = SALIDA[c][d][i]
+                    if salida == SALIDA_EXACTA:
+                        return True
+                    if salida == SALIDA_CON_MAYOR and farthest == i:
+                        return True
 
         return False
 
@@ -216,15 +194,14 @@ class Game:
         if self.jugador_actual_tiene_fichas_en_barra():
             raise ValueError("Debe reincorporar todas las fichas desde la barra primero.")
 
-        # --- DIRECCIÓN ESPERADA POR TESTS ---
-        # Blancas ('B') deben moverse a puntos MENORES (23 -> 0)
-        # Negras  ('N') deben moverse a puntos MAYORES (0  -> 23)
-        if color == 'B' and destino >= origen:
-            raise ValueError("Inválido: Fichas 'B' solo pueden moverse a puntos menores.")
-        if color == 'N' and destino <= origen:
-            raise ValueError("Inválido: Fichas 'N' solo pueden moverse a puntos mayores.")
-
-        distancia = abs(destino - origen)
+        # --- DIRECCIÓN ---
+        # Blancas ('B') se mueven a puntos MAYORES (0  -> 23), hacia su casa 18-23
+        # Negras  ('N') se mueven a puntos MENORES (23 -> 0), hacia su casa 0-5
+        distancia = (destino - origen) * SENTIDO[INDICE_COLOR[color]]
+        if distancia <= 0:
+            if color == 'B':
+                raise ValueError("Inválido: Fichas 'B' solo pueden moverse a puntos mayores.")
+            raise ValueError("Inválido: Fichas 'N' solo pueden moverse a puntos menores.")
         
         if distancia not in self.__movimientos_disponibles__:
             raise ValueError(f"Movimiento de {distancia} no está permitido por los dados: {self.__movimientos_disponibles__}")
@@ -241,20 +218,14 @@ class Game:
         if not self.jugador_actual_tiene_fichas_en_barra():
             raise ValueError("No tiene fichas en la barra para reincorporar.")
             
-        dado_necesario = 0
-        
         # --- REINCORPORACIÓN (según tests) ---
-        if color == 'B':
-            # Blancas reingresan en 0-5 (puntos 1..6)
-            if not (0 <= punto <= 5):
+        # Blancas reingresan en 0-5 (puntos 1..6); Negras en 18-23 (puntos 19..24)
+        dado_necesario = DADO_ENTRADA[INDICE_COLOR[color]][punto] if 0 <= punto <= 23 else None
+        if dado_necesario is None:
+            if color == 'B':
                 raise ValueError("Fichas 'B' solo pueden reincorporarse en puntos 0-5.")
-            dado_necesario = punto + 1
-        else: 
-            # Negras reingresan en 18-23 (puntos 19..24)
-            if not (18 <= punto <= 23):
-                raise ValueError("Fichas 'N' solo pueden reincorporarse en puntos 18-23.")
-            dado_necesario = 24 - punto
-            
+            raise ValueError("Fichas 'N' solo pueden reincorporarse en puntos 18-23.")
+
         if dado_necesario not in self.__movimientos_disponibles__:
             raise ValueError(f"Reingreso al punto {punto} (necesita dado {dado_necesario}) no está permitido por los dados: {self.__movimientos_disponibles__}")
 
@@ -273,19 +244,13 @@ class Game:
         if not self.__tablero__.todas_las_fichas_en_casa(color):
             raise ValueError("No se pueden sacar fichas hasta que todas estén en casa.")
             
-        dado_necesario = 0
-        
         # --- SACAR FICHA (según tests) ---
-        if color == 'B':
-            # Blancas (casa 18..23), salen hacia 24
-            if not (18 <= origen <= 23):
+        # Blancas (casa 18..23) salen hacia 24; Negras (casa 0..5) salen hacia 0
+        dado_necesario = DADO_SALIDA[INDICE_COLOR[color]][origen] if 0 <= origen <= 23 else None
+        if dado_necesario is None:
+            if color == 'B':
                 raise ValueError("Fichas 'B' solo pueden sacarse desde puntos 18-23.")
-            dado_necesario = 24 - origen
-        else:
-            # Negras (casa 0..5), salen hacia 0
-            if not (0 <= origen <= 5):
-                raise ValueError("Fichas 'N' solo pueden sacarse desde puntos 0-5.")
-            dado_necesario = origen + 1
+            raise ValueError("Fichas 'N' solo pueden sacarse desde puntos 0-5.")
 
         dado_a_usar = None
         
@@ -382,4 +347,81 @@ class Game:
         Devuelve la instancia del tablero.
         Útil para la interfaz gráfica.
         """
-        return self.__tablero__
\ No newline at end of file
+        return self.__tablero__
+
+    def obtener_id_posicion(self) -> str:
+        """
+        Devuelve el ID compacto (16 caracteres) de la posición actual:
+        tablero, jugador que mueve y dados restantes del turno.
+        """
+        color = 'B' if self.__turno_actual__.obtener_color() == 'blanco' else 'N'
+        return codificar_id_posicion(self.__tablero__, color, self.__movimientos_disponibles__)
+
+    def cargar_id_posicion(self, clave: str, cargar_dados: bool = True):
+        """
+        Carga en un solo paso la posición descrita por un ID: tablero,
+        turno y dados restantes. El tablero se reutiliza (no se reemplaza).
+        :param cargar_dados: si es False, se ignoran los dados del ID y el
+                             jugador que mueve queda a la espera de tirar.
+        """
+        conteos, barra, fuera, color, dados = decodificar_id_posicion(clave)
+        self.__tablero__.cargar_posicion(conteos, barra, fuera)
+        self.__turno_actual__ = self.__jugador1__ if color == 'B' else self.__jugador2__
+        self.__movimientos_disponibles__ = list(dados) if cargar_dados else []
+        self.__juego_terminado__ = False
+        self.__ganador__ = None
+        self.__ultimo_auto_pase__ = None
+
+    def generar_jugadas_legales(self):
+        """
+        Devuelve todas las jugadas legales completas del jugador actual para
+        los dados restantes, sin duplicar jugadas que llegan a la misma posición.
+        Cada jugada es una tupla de submovimientos (origen, destino, dado),
+        con origen BARRA para reingresos y destino FUERA para sacar fichas.
+        """
+        color = 'B' if self.__turno_actual__.obtener_color() == 'blanco' else 'N'
+        return generar_jugadas(self.__tablero__, color, self.__movimientos_disponibles__)
+
+    def aplicar_jugada(self, jugada):
+        """
+        Aplica una jugada completa si llega a la misma posición que alguna de
+        las jugadas legales. Los dados que no se pudieron usar se descartan.
+        """
+        if self.__juego_terminado__:
+            raise ValueError("El juego ya ha terminado.")
+        color = 'B' if self.__turno_actual__.obtener_color() == 'blanco' else 'N'
+        tablero = self.__tablero__
+        legales = self.generar_jugadas_legales()
+        largo = len(legales[0])
+        destinos_legales = set()
+        for legal in legales:
+            for origen, destino, _ in legal:
+                tablero.aplicar(color, origen, destino)
+            destinos_legales.add(tablero.obtener_hash())
+            for _ in legal:
+                tablero.deshacer()
+
+        restantes = list(self.__movimientos_disponibles__)
+        aplicados = 0
+        try:
+            for origen, destino, dado in jugada:
+                if dado not in restantes or (origen, destino) not in submovimientos(tablero, color, dado):
+                    raise ValueError(f"Submovimiento ilegal {(origen, destino, dado)} con los dados {restantes}")
+                restantes.remove(dado)
+                tablero.aplicar(color, origen, destino)
+                aplicados += 1
+            valida = len(jugada) == largo and tablero.obtener_hash() in destinos_legales
+        finally:
+            for _ in range(aplicados):
+                tablero.deshacer()
+        if not valida:
+            raise ValueError(f"Jugada ilegal para los dados {self.__movimientos_disponibles__}: {jugada}")
+
+        for origen, destino, _ in jugada:
+            if origen == BARRA:
+                tablero.reincorporar_ficha(color, destino)
+            elif destino == FUERA:
+                tablero.sacar_ficha(origen, color)
+            else:
+                tablero.mover_ficha(origen, destino, color)
+        self.__movimientos_disponibles__ = []
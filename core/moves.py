@@ -0,0 +1,101 @@
+"""
+Generador de jugadas legales completas.
+
+Una jugada es una tupla de submovimientos (origen, destino, dado), donde
+origen puede ser BARRA y destino puede ser FUERA. Las reglas son las mismas
+que valida Game (dirección, reingreso, 'Todos en Casa' y 'Dado Mayor'), más
+las reglas de jugada completa: usar la mayor cantidad posible de dados y,
+si sólo se puede usar uno de dos dados distintos, usar el mayor.
+"""
+from core.board import Tablero, BARRA, FUERA
+from core.tables import INDICE_COLOR, SIGNO, DESTINO, SALIDA, SALIDA_EXACTA, SALIDA_CON_MAYOR, ENTRADA
+
+
+def submovimientos(tablero: Tablero, color: str, dado: int):
+    """
+    Devuelve la lista de submovimientos (origen, destino) legales para un dado.
+    Usa las tablas precalculadas de core.tables (sin aritmética por color).
+    """
+    conteos = tablero.vista_conteos()
+    c = INDICE_COLOR[color]
+    signo = SIGNO[c]
+    resultado = []
+
+    if tablero.obtener_fichas_barra(color):
+        destino = ENTRADA[c][dado]
+        if conteos[destino] * signo >= -1:
+            resultado.append((BARRA, destino))
+        return resultado
+
+    destinos = DESTINO[c][dado]
+    salidas = SALIDA[c][dado] if tablero.todas_las_fichas_en_casa(color) else None
+    mas_lejana = tablero._get_farthest_checker_in_home(color) if salidas else None
+
+    mascara = tablero.obtener_mascara(color)
+    while mascara:
+        bit = mascara & -mascara
+        mascara ^= bit
+        i = bit.bit_length() - 1
+
+        destino = destinos[i]
+        if destino is not None and conteos[destino] * signo >= -1:
+            resultado.append((i, destino))
+
+        if salidas:
+            salida = salidas[i]
+            if salida == SALIDA_EXACTA or (salida == SALIDA_CON_MAYOR and i == mas_lejana):
+                resultado.append((i, FUERA))
+    return resultado
+
+
+def generar_jugadas(tablero: Tablero, color: str, dados):
+    """
+    Genera todas las jugadas legales completas para los dados restantes.
+    Las jugadas que llegan a la misma posición se eliminan usando el hash
+    de Zobrist del tablero. El tablero queda exactamente como estaba.
+    :return: lista de jugadas; [()] si no hay ningún submovimiento posible.
+    """
+    dados = sorted(dados, reverse=True)
+    if not dados:
+        return [()]
+
+    por_hash = {}
+    visitados = set()
+    mejor = [0]
+
+    def explorar(restantes, jugada):
+        clave = (tablero.obtener_hash(), restantes)
+        if clave in visitados:
+            return
+        visitados.add(clave)
+
+        movio = False
+        anterior = None
+        for k, dado in enumerate(restantes):
+            if dado == anterior:
+                continue
+            anterior = dado
+            siguientes = restantes[:k] + restantes[k + 1:]
+            for origen, destino in submovimientos(tablero, color, dado):
+                movio = True
+                tablero.aplicar(color, origen, destino)
+                explorar(siguientes, jugada + ((origen, destino, dado),))
+                tablero.deshacer()
+
+        if not movio:
+            largo = len(jugada)
+            if largo > mejor[0]:
+                mejor[0] = largo
+                por_hash.clear()
+            if largo == mejor[0]:
+                por_hash.setdefault(tablero.obtener_hash(), jugada)
+
+    explorar(tuple(dados), ())
+
+    jugadas = list(por_hash.values())
+    # Con dos dados distintos y un solo submovimiento posible: usar el mayor si se puede
+    if mejor[0] == 1 and dados[0] != dados[-1]:
+        con_mayor = [j for j in jugadas if j[0][2] == dados[0]]
+        if con_mayor:
+            jugadas = con_mayor
+    return jugadas
@@ -0,0 +1,42 @@
+"""
+Notación de jugadas de la CLI: puntos 1-24, "barra" y "fuera", con los
+movimientos separados por espacios (p. ej. "barra/21 13/7 19/fuera").
+"""
+from core.board import BARRA, FUERA
+
+
+def texto_jugada(jugada) -> str:
+    """Jugada en la notación de la CLI (puntos 1-24, 'barra', 'fuera')."""
+
+    def punto(indice: int) -> str:
+        if indice == BARRA:
+            return "barra"
+        if indice == FUERA:
+            return "fuera"
+        return str(indice + 1)
+
+    return " ".join(f"{punto(origen)}/{punto(destino)}" for origen, destino, *_ in jugada)
+
+
+def leer_jugada(texto: str):
+    """
+    Convierte la notación de la CLI en una lista de (origen, destino) con
+    índices internos (BARRA y FUERA para barra y fuera).
+    """
+
+    def indice(parte: str, especial: str, valor_especial: int) -> int:
+        if parte == especial:
+            return valor_especial
+        numero = int(parte)
+        if not 1 <= numero <= 24:
+            raise ValueError(f"Punto fuera de rango: {numero}")
+        return numero - 1
+
+    movimientos = []
+    for paso in texto.split():
+        try:
+            origen, destino = paso.lower().split('/')
+            movimientos.append((indice(origen, 'barra', BARRA), indice(destino, 'fuera', FUERA)))
+        except ValueError:
+            raise ValueError(f"Movimiento inválido: {paso!r}") from None
+    return movimientos
@@ -0,0 +1,120 @@
+"""
+ID de posición compacto, al estilo del Position ID de GNU Backgammon.
+
+Se empaqueta en un entero de 96 bits (12 bytes -> 16 caracteres base64):
+- bit 0: jugador que mueve (0 = 'B', 1 = 'N')
+- bits 1-3: cantidad de dados restantes (0-4)
+- bits 4-6 y 7-9: valores de los dos primeros dados (0 si no hay)
+- luego, para 'B' y después para 'N', 26 casillas en unario
+  (puntos 0..23, barra y fuera): n fichas = n bits en 1 seguidos de un 0.
+Como cada color tiene a lo sumo 15 fichas, el total no supera 92 bits.
+"""
+import base64
+from core.board import Tablero, MAX_FICHAS
+
+LARGO_BYTES = 12
+LARGO_ID = 16
+_BITS_CABECERA = 10
+
+
+def codificar_id_posicion(tablero: Tablero, color_turno: str = 'B', dados=()) -> str:
+    """
+    Codifica tablero, jugador que mueve y dados restantes en un ID de 16 caracteres.
+    :param tablero: Tablero a codificar.
+    :param color_turno: 'B' o 'N'.
+    :param dados: dados restantes del turno (hasta 4; más de 2 sólo si son iguales).
+    """
+    if color_turno not in ('B', 'N'):
+        raise ValueError("Color debe ser 'B' o 'N'.")
+    dados = list(dados)
+    if len(dados) > 4 or any(not 1 <= d <= 6 for d in dados):
+        raise ValueError(f"Dados inválidos para el ID de posición: {dados}")
+    if len(dados) > 2 and len(set(dados)) != 1:
+        raise ValueError(f"Dados inválidos para el ID de posición: {dados}")
+
+    d1 = dados[0] if dados else 0
+    d2 = dados[1] if len(dados) > 1 else 0
+    bits = (color_turno == 'N') | (len(dados) << 1) | (d1 << 4) | (d2 << 7)
+    pos = _BITS_CABECERA
+
+    conteos = tablero.obtener_conteos()
+    for color, signo in (('B', 1), ('N', -1)):
+        casillas = [n * signo if n * signo > 0 else 0 for n in conteos]
+        casillas.append(tablero.obtener_fichas_barra(color))
+        casillas.append(tablero.obtener_fichas_fuera(color))
+        if sum(casillas) > MAX_FICHAS:
+            raise ValueError(f"El color {color} tiene más de 15 fichas; no se puede codificar.")
+        for n in casillas:
+            bits |= ((1 << n) - 1) << pos
+            pos += n + 1
+
+    return base64.b64encode(bits.to_bytes(LARGO_BYTES, 'little')).decode('ascii')
+
+
+def decodificar_id_posicion(clave: str):
+    """
+    Decodifica un ID de posición.
+    :return: tupla (conteos, barra, fuera, color_turno, dados) donde barra y
+             fuera son tuplas (blancas, negras).
+    """
+    try:
+        crudo = base64.b64decode(clave, validate=True)
+    except (ValueError, TypeError):
+        raise ValueError(f"ID de posición inválido: {clave!r}") from None
+    if len(clave) != LARGO_ID or len(crudo) != LARGO_BYTES:
+        raise ValueError(f"ID de posición inválido: {clave!r}")
+
+    bits = int.from_bytes(crudo, 'little')
+    color_turno = 'N' if bits & 1 else 'B'
+    cantidad_dados = (bits >> 1) & 0b111
+    d1 = (bits >> 4) & 0b111
+    d2 = (bits >> 7) & 0b111
+    if cantidad_dados > 4:
+        raise ValueError(f"ID de posición inválido: {clave!r}")
+    if cantidad_dados == 0:
+        dados = []
+    elif cantidad_dados == 1:
+        dados = [d1]
+    elif cantidad_dados == 2:
+        dados = [d1, d2]
+    else:
+        dados = [d1] * cantidad_dados
+    if any(not 1 <= d <= 6 for d in dados):
+        raise ValueError(f"ID de posición inválido: {clave!r}")
+
+    pos = _BITS_CABECERA
+    por_color = []
+    for _ in range(2):
+        casillas = []
+        total = 0
+        for _ in range(26):
+            n = 0
+            while (bits >> pos) & 1:
+                n += 1
+                pos += 1
+            pos += 1
+            total += n
+            if total > MAX_FICHAS:
+                raise ValueError(f"ID de posición inválido: {clave!r}")
+            casillas.append(n)
+        por_color.append(casillas)
+    if bits >> pos:
+        raise ValueError(f"ID de posición inválido: {clave!r}")
+
+    blancas, negras = por_color
+    conteos = []
+    for i in range(24):
+        if blancas[i] and negras[i]:
+            raise ValueError(f"ID de posición inválido: {clave!r}")
+        conteos.append(blancas[i] - negras[i])
+    barra = (blancas[24], negras[24])
+    fuera = (blancas[25], negras[25])
+    return conteos, barra, fuera, color_turno, dados
+
+
+def tablero_desde_id(clave: str) -> Tablero:
+    """Reconstruye un Tablero a partir de un ID de posición en un solo paso."""
+    conteos, barra, fuera, _, _ = decodificar_id_posicion(clave)
+    tablero = Tablero()
+    tablero.cargar_posicion(conteos, barra, fuera)
+    return tablero
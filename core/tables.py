@@ -0,0 +1,82 @@
+"""
+Tablas de movimiento precalculadas, construidas una sola vez al importar.
+
+Evitan recalcular índices de destino, puntos de reingreso y dados necesarios
+para sacar fichas (y ramificar por el string del color) en cada validación.
+Índice de color: 0 = 'B', 1 = 'N'. Las tablas por dado se indexan 1..6
+(la posición 0 no se usa).
+"""
+
+INDICE_COLOR = {'B': 0, 'N': 1}
+
+# Signo de cada color en los conteos del Tablero (positivo 'B', negativo 'N').
+SIGNO = (1, -1)
+
+# Sentido del avance: 'B' hacia índices MAYORES (entra en 0-5 y sale desde
+# 18-23), 'N' hacia índices MENORES (entra en 18-23 y sale desde 0-5).
+# distancia recorrida = (destino - origen) * SENTIDO[c]
+# Todas las demás tablas (y los pips del Tablero) se derivan de este sentido.
+SENTIDO = (1, -1)
+
+# Marcadores de SALIDA (sacar ficha)
+SALIDA_EXACTA = 1      # el dado coincide con el necesario
+SALIDA_CON_MAYOR = 2   # el dado es mayor: sólo vale desde la ficha más lejana
+
+
+def _pips(c, punto):
+    # Distancia hasta salir del tablero: 'B' sale por 24, 'N' por -1
+    return 24 - punto if SENTIDO[c] > 0 else punto + 1
+
+
+def _destino(c, dado, origen):
+    destino = origen + dado * SENTIDO[c]
+    return destino if 0 <= destino <= 23 else None
+
+
+def _dado_para_salir(c, punto):
+    # La casa son los 6 puntos más cercanos a la salida ('B' 18-23, 'N' 0-5)
+    pips = _pips(c, punto)
+    return pips if pips <= 6 else None
+
+
+def _salida(c, dado, origen):
+    necesario = _dado_para_salir(c, origen)
+    if necesario is None or dado < necesario:
+        return None
+    return SALIDA_EXACTA if dado == necesario else SALIDA_CON_MAYOR
+
+
+# PIPS[c][punto] -> distancia que le queda a una ficha en ese punto hasta salir
+PIPS = tuple(tuple(_pips(c, i) for i in range(24)) for c in (0, 1))
+
+# DESTINO[c][dado][origen] -> punto destino de un movimiento normal (None si sale del tablero)
+DESTINO = tuple(
+    tuple(None if d == 0 else tuple(_destino(c, d, i) for i in range(24)) for d in range(7))
+    for c in (0, 1)
+)
+
+# SALIDA[c][dado][origen] -> None, SALIDA_EXACTA o SALIDA_CON_MAYOR
+SALIDA = tuple(
+    tuple(None if d == 0 else tuple(_salida(c, d, i) for i in range(24)) for d in range(7))
+    for c in (0, 1)
+)
+
+# DADO_SALIDA[c][punto] -> dado exacto para sacar desde ese punto (None fuera de casa)
+DADO_SALIDA = tuple(tuple(_dado_para_salir(c, i) for i in range(24)) for c in (0, 1))
+
+# PUNTO_SALIDA[c][dado] -> punto de casa que sale con ese dado exacto ('B': 24 - dado; 'N': dado - 1)
+PUNTO_SALIDA = tuple(
+    tuple(None if d == 0 else DADO_SALIDA[c].index(d) for d in range(7)) for c in (0, 1)
+)
+
+# ENTRADA[c][dado] -> punto de reingreso desde la barra, a 25 - dado pips de la
+# salida ('B': dado - 1; 'N': 24 - dado)
+ENTRADA = tuple(
+    tuple(None if d == 0 else PIPS[c].index(25 - d) for d in range(7)) for c in (0, 1)
+)
+
+# DADO_ENTRADA[c][punto] -> dado necesario para reingresar en ese punto (None si no es de entrada)
+DADO_ENTRADA = tuple(
+    tuple(next((d for d in range(1, 7) if ENTRADA[c][d] == i), None) for i in range(24))
+    for c in (0, 1)
+)
@@ -0,0 +1,285 @@
+"""
+Análisis de partidas grabadas: detección de errores en lote.
+
+Cada partida grabada se vuelve a jugar con Game usando sus dados. En cada
+decisión (más de una jugada legal) se evalúan todas las jugadas con el
+Buscador y se compara la jugada hecha con la mejor: pérdida de equidad,
+clasificación del error y tasas de error por jugador.
+
+Formato de entrada (JSONL, una partida por línea):
+    {"id": "p1", "blancas": "Ana", "negras": "Beto", "posicion": null,
+     "turnos": [{"dados": [6, 5], "jugada": "12/6 17/12"}, ...]}
+Las jugadas usan la notación de la CLI: puntos 1-24, "barra" y "fuera";
+una jugada vacía ("") es un turno sin movimientos. "posicion" es un ID de
+posición inicial opcional.
+
+Las partidas se reparten entre procesos; cada partida se analiza entera en
+un proceso con un mismo Buscador, así que su tabla de transposición hace de
+caché de evaluaciones entre las posiciones de esa partida.
+
+Uso:
+    python -m engine.analysis partidas.jsonl --procesos 4 --salida decisiones.jsonl
+"""
+import argparse
+import json
+import multiprocessing
+import time
+from typing import NamedTuple, Optional
+from core.board import BARRA, FUERA
+from core.dice import Dado
+from core.game import Game
+from core.notation import leer_jugada, texto_jugada
+from engine.search import Buscador
+
+# Pérdida mínima de equidad de cada clase (de la más grave a la más leve)
+UMBRALES = (('grave', 0.16), ('error', 0.08), ('dudosa', 0.04))
+CLASES = ('correcta', 'dudosa', 'error', 'grave')
+
+
+def clasificar(perdida: float) -> str:
+    """Clasificación de una jugada según la equidad perdida."""
+    for clase, umbral in UMBRALES:
+        if perdida >= umbral:
+            return clase
+    return 'correcta'
+
+
+class _DadoGrabado(Dado):
+    """Dado que devuelve las tiradas grabadas de una partida, en orden."""
+
+    def __init__(self, tiradas):
+        super().__init__()
+        self.__tiradas__ = iter(tiradas)
+
+    def tirar(self):
+        try:
+            v1, v2 = next(self.__tiradas__)
+        except StopIteration:
+            raise ValueError("La partida no tiene más tiradas grabadas.") from None
+        self._set_valores(v1, v2)
+        return (v1, v2)
+
+
+class Decision(NamedTuple):
+    """Una decisión analizada: la jugada hecha, la mejor y la equidad perdida."""
+    partida: str
+    turno: int
+    jugador: str
+    color: str
+    dados: tuple
+    jugada: str
+    mejor: str
+    equidad_jugada: float
+    equidad_mejor: float
+    perdida: float
+    clasificacion: str
+
+
+class AnalisisPartida(NamedTuple):
+    """Resultado del análisis de una partida grabada."""
+    partida: str
+    jugadores: dict               # {'B': nombre, 'N': nombre}
+    decisiones: list
+    error: Optional[str]          # motivo si la grabación no se pudo reproducir
+    aciertos_cache: int
+    segundos: float
+
+
+def _resolver_jugada(juego: Game, color: str, movimientos, jugadas):
+    """Jugada legal (de 'jugadas') que llega a la misma posición que 'movimientos'."""
+    tablero = juego.obtener_tablero()
+    conteos = tablero.vista_conteos()
+    signo = 1 if color == 'B' else -1
+    aplicados = 0
+    try:
+        for origen, destino in movimientos:
+            hay_ficha = (tablero.obtener_fichas_barra(color) > 0 if origen == BARRA
+                         else conteos[origen] * signo > 0)
+            if not hay_ficha or (destino != FUERA and conteos[destino] * signo < -1):
+                raise ValueError(f"Movimiento imposible: {texto_jugada([(origen, destino)])}")
+            tablero.aplicar(color, origen, destino)
+            aplicados += 1
+        objetivo = tablero.obtener_hash()
+    finally:
+        for _ in range(aplicados):
+            tablero.deshacer()
+    for jugada in jugadas:
+        for origen, destino, _ in jugada:
+            tablero.aplicar(color, origen, destino)
+        alcanzado = tablero.obtener_hash()
+        for _ in jugada:
+            tablero.deshacer()
+        if alcanzado == objetivo:
+            return jugada
+    raise ValueError(f"Jugada ilegal con los dados {juego.obtener_movimientos_disponibles()}: "
+                     f"{texto_jugada(movimientos) or '(sin movimientos)'}")
+
+
+def analizar_partida(registro: dict, buscador: Buscador) -> AnalisisPartida:
+    """
+    Reproduce una partida grabada y evalúa cada decisión con 'buscador'.
+    La tabla de transposición del buscador se vacía al empezar y se comparte
+    entre todas las posiciones de la partida.
+    """
+    inicio = time.perf_counter()
+    identificador = str(registro.get('id', ''))
+    nombres = {'B': registro.get('blancas', 'Blancas'), 'N': registro.get('negras', 'Negras')}
+    tabla = buscador.obtener_tabla()
+    if tabla is not None:
+        tabla.limpiar()
+    decisiones = []
+    error = None
+    turnos = registro.get('turnos', [])
+    juego = Game(nombres['B'], nombres['N'], _DadoGrabado(tuple(t['dados']) for t in turnos))
+    if registro.get('posicion'):
+        juego.cargar_id_posicion(registro['posicion'], cargar_dados=False)
+    try:
+        for numero, turno in enumerate(turnos, 1):
+            color = 'B' if juego.mostrar_jugador_actual().obtener_color() == 'blanco' else 'N'
+            movimientos = leer_jugada(turno.get('jugada', ''))
+            juego.tirar_dados()
+            if juego.consumir_motivo_auto_pase():
+                if movimientos:
+                    raise ValueError(f"Turno {numero}: hay movimientos grabados pero "
+                                     f"el turno se pasa solo.")
+                continue
+            dados = list(juego.obtener_movimientos_disponibles())
+            jugadas = juego.generar_jugadas_legales()
+            try:
+                hecha = _resolver_jugada(juego, color, movimientos, jugadas)
+            except ValueError as e:
+                raise ValueError(f"Turno {numero}: {e}") from None
+            if len(jugadas) > 1:
+                valores = buscador.evaluar_jugadas(juego.obtener_tablero(), color, dados)
+                mejor, equidad_mejor = valores[0]
+                equidad_jugada = next((valor for jugada, valor in valores if jugada == hecha), None)
+                if equidad_jugada is None:
+                    raise ValueError(f"Turno {numero}: el buscador no evaluó la jugada "
+                                     f"{texto_jugada(hecha)}.")
+                perdida = max(0.0, equidad_mejor - equidad_jugada)
+                decisiones.append(Decision(identificador, numero, nombres[color], color,
+                                           tuple(turno['dados']), texto_jugada(hecha),
+                                           texto_jugada(mejor), equidad_jugada, equidad_mejor,
+                                           perdida, clasificar(perdida)))
+            juego.aplicar_jugada(hecha)
+            if juego.verificar_victoria():
+                break
+            juego.cambiar_turno()
+    except ValueError as e:
+        error = str(e)
+    return AnalisisPartida(identificador, nombres, decisiones, error,
+                           tabla.aciertos if tabla is not None else 0, time.perf_counter() - inicio)
+
+
+# --- Trabajo en procesos ---
+
+_CONFIGURACION = {}
+
+
+def _iniciar_proceso(opciones_buscador):
+    """Un Buscador por proceso; su tabla se reutiliza (vaciada) en cada partida."""
+    _CONFIGURACION['buscador'] = Buscador(**opciones_buscador)
+
+
+def _analizar_registro(registro: dict) -> AnalisisPartida:
+    return analizar_partida(registro, _CONFIGURACION['buscador'])
+
+
+def analizar(registros, procesos: int = 1, profundidad: int = 2, capacidad_tabla: int = 1 << 16,
+             **opciones):
+    """
+    Analiza partidas grabadas (iterable de dicts) y devuelve un
+    AnalisisPartida por partida, en el orden de entrada (generador).
+    :param procesos: cantidad de procesos (1 = en el proceso actual).
+    :param opciones: otras opciones del Buscador (p. ej. finales, libro).
+    """
+    if procesos < 1:
+        raise ValueError("Se necesita al menos un proceso.")
+    opciones_buscador = dict(opciones, profundidad=profundidad, capacidad_tabla=capacidad_tabla)
+    if procesos == 1:
+        _iniciar_proceso(opciones_buscador)
+        for registro in registros:
+            yield _analizar_registro(registro)
+        return
+    with multiprocessing.Pool(procesos, initializer=_iniciar_proceso,
+                              initargs=(opciones_buscador,)) as pool:
+        yield from pool.imap(_analizar_registro, registros)
+
+
+def leer_partidas(ruta: str):
+    """Lee partidas grabadas de un archivo JSONL (ignora líneas vacías)."""
+    with open(ruta, encoding='utf-8') as archivo:
+        for linea in archivo:
+            if linea.strip():
+                yield json.loads(linea)
+
+
+class ResumenJugadores:
+    """Acumula las decisiones por jugador: pérdida total y tasas de error."""
+
+    def __init__(self):
+        self.jugadores = {}
+        self.partidas = 0
+        self.invalidas = 0
+        self.__inicio__ = time.perf_counter()
+        self.segundos = 0.0
+
+    def agregar(self, analisis: AnalisisPartida):
+        """Suma las decisiones de una partida a los totales por jugador."""
+        self.partidas += 1
+        self.invalidas += analisis.error is not None
+        for decision in analisis.decisiones:
+            datos = self.jugadores.setdefault(
+                decision.jugador,
+                {'decisiones': 0, 'perdida': 0.0, **{clase: 0 for clase in CLASES}})
+            datos['decisiones'] += 1
+            datos['perdida'] += decision.perdida
+            datos[decision.clasificacion] += 1
+        self.segundos = time.perf_counter() - self.__inicio__
+
+    def como_dict(self) -> dict:
+        """Totales con la pérdida media y las tasas de error de cada jugador."""
+        jugadores = {}
+        for nombre, datos in self.jugadores.items():
+            decisiones = datos['decisiones']
+            jugadores[nombre] = dict(
+                datos,
+                perdida_media=datos['perdida'] / decisiones,
+                tasa_errores=(datos['error'] + datos['grave']) / decisiones,
+                tasa_graves=datos['grave'] / decisiones,
+            )
+        return {
+            'partidas': self.partidas,
+            'invalidas': self.invalidas,
+            'jugadores': jugadores,
+            'segundos': self.segundos,
+        }
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Analiza partidas grabadas y detecta errores.")
+    parser.add_argument('entrada', help="archivo JSONL con una partida por línea")
+    parser.add_argument('--procesos', type=int, default=multiprocessing.cpu_count())
+    parser.add_argument('--profundidad', type=int, default=2)
+    parser.add_argument('--salida', default=None, help="archivo JSONL con una decisión por línea")
+    args = parser.parse_args(argv)
+
+    resumen = ResumenJugadores()
+    salida = open(args.salida, 'w', encoding='utf-8') if args.salida else None
+    try:
+        for analisis in analizar(leer_partidas(args.entrada), args.procesos, args.profundidad):
+            resumen.agregar(analisis)
+            if analisis.error:
+                print(f"Partida {analisis.partida}: {analisis.error}")
+            if salida:
+                for decision in analisis.decisiones:
+                    salida.write(json.dumps(decision._asdict()) + '\n')
+    finally:
+        if salida:
+            salida.close()
+    print(json.dumps(resumen.como_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
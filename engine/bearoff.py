@@ -0,0 +1,388 @@
+"""
+Base de datos de finales (bear-off) de un solo lado.
+
+Enumera todas las distribuciones de hasta 15 fichas en los 6 puntos de casa y,
+para cada una, calcula por programación dinámica la distribución de la
+cantidad de tiradas necesarias para sacar todas las fichas (jugando siempre
+la jugada que minimiza las tiradas esperadas). Los puntos de casa se
+identifican por el dado exacto que los saca (1..6), con las tablas de
+core.tables, así que la misma base sirve para ambos colores. Las jugadas
+posibles de cada tirada salen del mismo generador que usa el motor
+(core.moves.generar_jugadas sobre un Tablero), no de reglas propias.
+
+El resultado se guarda en un archivo binario compacto:
+- cabecera: magia, versión, puntos, fichas máximas y largo de la distribución
+- por posición, LARGO_DISTRIBUCION probabilidades uint16 (escala 65535)
+- por posición, las tiradas esperadas como float32
+y en tiempo de ejecución se abre con mmap: las consultas leen directamente
+del archivo mapeado, sin copiarlo a memoria.
+
+Generar (una sola vez):
+    python -m engine.bearoff --procesos 4
+"""
+import argparse
+from array import array
+from contextlib import contextmanager
+import mmap
+import multiprocessing
+import os
+import struct
+import tempfile
+import time
+from math import comb
+from typing import Optional
+from core.board import Tablero
+from core.moves import generar_jugadas
+from core.tables import INDICE_COLOR, SIGNO, DADO_SALIDA, PUNTO_SALIDA
+from engine.search import TIRADAS, dados_de_tirada
+
+PUNTOS = 6
+MAX_FICHAS = 15
+LARGO_DISTRIBUCION = 32
+ESCALA = 65535
+MAGIA = b'BGB1'
+VERSION = 1
+_CABECERA = struct.Struct('<4sHHHH')
+
+RUTA_POR_DEFECTO = os.path.join(os.path.dirname(__file__), 'datos', 'bearoff1.bin')
+
+
+# --- Archivos mapeados en memoria (compartido con engine.bearoff_doble) ---
+
+@contextmanager
+def archivo_de_trabajo(ruta: str, tamano: int):
+    """
+    Crea, junto a 'ruta', un archivo temporal de 'tamano' bytes en cero para
+    mapearlo durante la generación, y lo borra al salir.
+    :return: ruta del archivo de trabajo.
+    """
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    os.makedirs(directorio, exist_ok=True)
+    descriptor, trabajo = tempfile.mkstemp(suffix='.tmp', dir=directorio)
+    try:
+        with os.fdopen(descriptor, 'wb') as archivo:
+            archivo.truncate(tamano)
+        yield trabajo
+    finally:
+        os.remove(trabajo)
+
+
+def mapear_lectura(ruta: str):
+    """
+    Abre 'ruta' y la mapea con mmap en sólo lectura.
+    :return: (archivo, mapa); el llamador cierra ambos.
+    """
+    archivo = open(ruta, 'rb')
+    try:
+        return archivo, mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        archivo.close()
+        raise ValueError(f"Archivo de finales vacío: {ruta}") from None
+
+
+# --- Índice combinatorio ---
+
+def cantidad_posiciones(fichas: int = MAX_FICHAS) -> int:
+    """Posiciones con hasta 'fichas' fichas en 6 puntos: C(fichas + 6, 6)."""
+    return comb(fichas + PUNTOS, PUNTOS)
+
+
+def indice_posicion(puntos) -> int:
+    """
+    Índice de una distribución (fichas en los puntos 1..6), independiente del
+    máximo de fichas: cada separador j de la codificación 'fichas y
+    separadores' ocupa la posición s_j, y el índice es sum C(s_j, j).
+    """
+    indice = 0
+    acumulado = 0
+    for j, n in enumerate(puntos, 1):
+        acumulado += n
+        indice += comb(acumulado + j - 1, j)
+    return indice
+
+
+def posicion_de_indice(indice: int, fichas: int = MAX_FICHAS):
+    """Inversa de indice_posicion: devuelve la tupla de 6 conteos."""
+    separadores = []
+    limite = fichas + PUNTOS
+    for j in range(PUNTOS, 0, -1):
+        s = j - 1
+        while s + 1 < limite and comb(s + 1, j) <= indice:
+            s += 1
+        indice -= comb(s, j)
+        separadores.append(s)
+        limite = s
+    separadores.reverse()
+    puntos = []
+    anterior = -1
+    for s in separadores:
+        puntos.append(s - anterior - 1)
+        anterior = s
+    return tuple(puntos)
+
+
+# --- Jugadas (puntos identificados por el dado exacto) ---
+
+_TABLERO = {}
+
+
+def _tablero_en_casa(puntos) -> Tablero:
+    """
+    Tablero (uno por proceso, reutilizado) con las fichas de 'puntos' en la
+    casa de 'B' y el resto fuera; 'N' ya sacó todas las suyas.
+    """
+    tablero = _TABLERO.get('actual')
+    if tablero is None:
+        tablero = _TABLERO['actual'] = Tablero()
+    conteos = [0] * 24
+    for k, n in enumerate(puntos):
+        conteos[PUNTO_SALIDA[0][k + 1]] = n
+    tablero.cargar_posicion(conteos, fuera=(MAX_FICHAS - sum(puntos), MAX_FICHAS))
+    return tablero
+
+
+def sucesores(puntos, dados):
+    """
+    Todas las posiciones alcanzables con una jugada legal de los dados, según
+    core.moves.generar_jugadas (misma regla del dado mayor y de usar ambos
+    dados que en una partida).
+    """
+    tablero = _tablero_en_casa(puntos)
+    finales = set()
+    for jugada in generar_jugadas(tablero, 'B', list(dados)):
+        for origen, destino, _ in jugada:
+            tablero.aplicar('B', origen, destino)
+        finales.add(puntos_en_casa(tablero, 'B'))
+        for _ in jugada:
+            tablero.deshacer()
+    return finales
+
+
+def _pips(puntos):
+    return sum((k + 1) * n for k, n in enumerate(puntos))
+
+
+# --- Generación ---
+
+_TRABAJO = {}
+_ANCHO = LARGO_DISTRIBUCION + 1   # probabilidades + tiradas esperadas (float64)
+
+
+def _abrir_trabajo(ruta):
+    archivo = open(ruta, 'r+b')
+    _TRABAJO['archivo'] = archivo
+    _TRABAJO['mapa'] = mmap.mmap(archivo.fileno(), 0)
+    _TRABAJO['datos'] = memoryview(_TRABAJO['mapa']).cast('d')
+
+
+def _calcular(indices):
+    """Calcula y escribe la distribución de las posiciones dadas (sus sucesoras ya están)."""
+    datos = _TRABAJO['datos']
+    for indice in indices:
+        puntos = posicion_de_indice(indice)
+        base = indice * _ANCHO
+        distribucion = [0.0] * LARGO_DISTRIBUCION
+        if not any(puntos):
+            distribucion[0] = 1.0
+        else:
+            for tirada, p in TIRADAS:
+                mejor = min(
+                    (indice_posicion(s) for s in sucesores(puntos, dados_de_tirada(tirada))),
+                    key=lambda i: datos[i * _ANCHO + LARGO_DISTRIBUCION],
+                )
+                origen = mejor * _ANCHO
+                for n in range(LARGO_DISTRIBUCION):
+                    q = datos[origen + n]
+                    if q:
+                        distribucion[min(n + 1, LARGO_DISTRIBUCION - 1)] += p * q
+        for n, q in enumerate(distribucion):
+            datos[base + n] = q
+        datos[base + LARGO_DISTRIBUCION] = sum(n * q for n, q in enumerate(distribucion))
+    return len(indices)
+
+
+def generar_base(ruta: str = RUTA_POR_DEFECTO, fichas: int = MAX_FICHAS, procesos: int = 1,
+                 informar=None) -> int:
+    """
+    Genera el archivo de la base. Las posiciones se procesan por niveles de
+    pips: las sucesoras de una posición siempre tienen menos pips, así que
+    cada nivel se reparte entre los procesos, que escriben en un archivo de
+    trabajo mapeado en memoria compartida.
+    :param informar: función opcional (nivel, niveles) para mostrar progreso.
+    :return: cantidad de posiciones.
+    """
+    if not 1 <= fichas <= MAX_FICHAS:
+        raise ValueError(f"La cantidad de fichas debe estar entre 1 y {MAX_FICHAS}.")
+    total = cantidad_posiciones(fichas)
+    niveles = {}
+    for indice in range(total):
+        niveles.setdefault(_pips(posicion_de_indice(indice, fichas)), []).append(indice)
+
+    with archivo_de_trabajo(ruta, total * _ANCHO * 8) as trabajo:
+        pool = None
+        if procesos > 1:
+            pool = multiprocessing.Pool(procesos, initializer=_abrir_trabajo, initargs=(trabajo,))
+        _abrir_trabajo(trabajo)
+        try:
+            orden = sorted(niveles)
+            for numero, pips in enumerate(orden, 1):
+                indices = niveles[pips]
+                # Los niveles chicos no justifican repartirse
+                if pool is None or len(indices) < 64:
+                    _calcular(indices)
+                else:
+                    paso = max(16, len(indices) // (procesos * 4))
+                    pool.map(_calcular, [indices[a:a + paso] for a in range(0, len(indices), paso)])
+                if informar:
+                    informar(numero, len(orden))
+            _escribir_final(ruta, _TRABAJO['datos'], total, fichas)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+            _cerrar_trabajo()
+    return total
+
+
+def _cerrar_trabajo():
+    if 'datos' in _TRABAJO:
+        _TRABAJO.pop('datos').release()
+        _TRABAJO.pop('mapa').close()
+        _TRABAJO.pop('archivo').close()
+
+
+def _escribir_final(ruta, datos, total, fichas):
+    """Cuantiza las distribuciones a uint16 y escribe el archivo final."""
+    distribuciones = array('H')
+    esperadas = array('f')
+    for indice in range(total):
+        base = indice * _ANCHO
+        valores = [round(datos[base + n] * ESCALA) for n in range(LARGO_DISTRIBUCION)]
+        distribuciones.extend(valores)
+        esperadas.append(datos[base + LARGO_DISTRIBUCION])
+    if distribuciones.itemsize != 2 or esperadas.itemsize != 4:  # pragma: no cover
+        raise RuntimeError("Tamaños de tipos inesperados en esta plataforma.")
+    with open(ruta, 'wb') as archivo:
+        archivo.write(_CABECERA.pack(MAGIA, VERSION, PUNTOS, fichas, LARGO_DISTRIBUCION))
+        distribuciones.tofile(archivo)
+        esperadas.tofile(archivo)
+
+
+# --- Consulta ---
+
+class BaseFinales:
+    """
+    Base de finales de un solo lado abierta con mmap (sólo lectura).
+
+    :param ruta: archivo generado con generar_base.
+    """
+
+    def __init__(self, ruta: str = RUTA_POR_DEFECTO):
+        self.__archivo__, self.__mapa__ = mapear_lectura(ruta)
+        magia, version, puntos, fichas, largo = _CABECERA.unpack_from(self.__mapa__, 0)
+        total = cantidad_posiciones(fichas)
+        esperado = _CABECERA.size + total * largo * 2 + total * 4
+        if (magia != MAGIA or version != VERSION or puntos != PUNTOS
+                or len(self.__mapa__) != esperado):
+            self.cerrar()
+            raise ValueError(f"Archivo de finales inválido: {ruta}")
+        self.__fichas__ = fichas
+        self.__largo__ = largo
+        self.__total__ = total
+        vista = memoryview(self.__mapa__)
+        inicio = _CABECERA.size
+        fin = inicio + total * largo * 2
+        self.__distribuciones__ = vista[inicio:fin].cast('H')
+        self.__esperadas__ = vista[fin:].cast('f')
+        vista.release()
+
+    def __len__(self):
+        return self.__total__
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+    def cerrar(self):
+        """Libera el mapeo del archivo."""
+        for nombre in ('__distribuciones__', '__esperadas__'):
+            vista = self.__dict__.pop(nombre, None)
+            if vista is not None:
+                vista.release()
+        if not self.__mapa__.closed:
+            self.__mapa__.close()
+        self.__archivo__.close()
+
+    def obtener_fichas(self) -> int:
+        """Máximo de fichas por posición con que se generó la base."""
+        return self.__fichas__
+
+    def distribucion(self, indice: int):
+        """Probabilidad de terminar en exactamente n tiradas, n = 0..LARGO-1."""
+        base = indice * self.__largo__
+        return [v / ESCALA for v in self.__distribuciones__[base:base + self.__largo__]]
+
+    def tiradas_esperadas(self, indice: int) -> float:
+        """Cantidad esperada de tiradas para sacar todas las fichas."""
+        return self.__esperadas__[indice]
+
+    def indice(self, puntos) -> int:
+        """Índice de una distribución de fichas (puntos 1..6); valida el máximo."""
+        if len(puntos) != PUNTOS or sum(puntos) > self.__fichas__ or min(puntos) < 0:
+            raise ValueError(f"Posición fuera de la base: {tuple(puntos)}")
+        return indice_posicion(puntos)
+
+    def probabilidad_ganar(self, indice_turno: int, indice_rival: int) -> float:
+        """
+        Probabilidad de que gane quien tiene el turno en una carrera pura
+        (suponiendo que ambos lados juegan sin interacción): gana si termina
+        en n tiradas y el rival necesita al menos n.
+        """
+        propia = self.distribucion(indice_turno)
+        rival = self.distribucion(indice_rival)
+        resto = 1.0
+        total = 0.0
+        for n in range(self.__largo__):
+            total += propia[n] * resto
+            resto -= rival[n]
+        return total
+
+
+def puntos_en_casa(tablero: Tablero, color: str) -> Optional[tuple]:
+    """
+    Devuelve las fichas de 'color' en los puntos de casa (índice 0 = punto que
+    sale con 1), o None si tiene fichas fuera de casa o en la barra.
+    """
+    if tablero.obtener_fichas_barra(color) or tablero.fichas_fuera_de_casa(color):
+        return None
+    c = INDICE_COLOR[color]
+    signo = SIGNO[c]
+    puntos = [0] * PUNTOS
+    for i, n in enumerate(tablero.obtener_conteos()):
+        n *= signo
+        if n > 0:
+            puntos[DADO_SALIDA[c][i] - 1] += n
+    return tuple(puntos)
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Genera la base de finales de un solo lado.")
+    parser.add_argument('--ruta', default=RUTA_POR_DEFECTO)
+    parser.add_argument('--fichas', type=int, default=MAX_FICHAS)
+    parser.add_argument('--procesos', type=int, default=multiprocessing.cpu_count())
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+
+    def informar(nivel, niveles):
+        print(f"\rNivel {nivel}/{niveles}", end='', flush=True)
+
+    total = generar_base(args.ruta, args.fichas, args.procesos, informar)
+    print(f"\n{total} posiciones en {time.perf_counter() - inicio:.1f}s -> {args.ruta}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+Tabla de finales de dos lados para carreras cortas.
+
+Para cada par de posiciones de casa (quien tiene el turno, el rival) con hasta
+'fichas' fichas por lado, guarda la probabilidad exacta de que gane quien
+tiene el turno. A diferencia de combinar dos distribuciones de un solo lado
+(engine.bearoff), aquí cada jugada se elige maximizando la probabilidad de
+ganar contra esa posición rival concreta:
+
+    P(a, b) = sum_tirada p * max_{a' jugada de a} (1 - P(b, a'))
+
+con P(vacía, b) = 1 y P(a, vacía) = 0. P(a, b) sólo depende de pares con menos
+pips en total, así que se calcula por niveles de pips; cada nivel se reparte
+en bloques entre procesos que escriben en una matriz de trabajo mapeada en
+memoria compartida (numpy.memmap). El archivo final guarda la matriz como
+uint16 (escala 65535) y se abre con mmap para consultar sin copiar.
+
+Generar (una sola vez):
+    python -m engine.bearoff_doble --fichas 6 --procesos 4
+"""
+import argparse
+import multiprocessing
+import os
+import struct
+import time
+from typing import Optional
+from core.board import Tablero
+from engine.bearoff import (
+    PUNTOS, ESCALA, cantidad_posiciones, indice_posicion, posicion_de_indice, sucesores,
+    puntos_en_casa, archivo_de_trabajo, mapear_lectura,
+)
+from engine.search import TIRADAS, dados_de_tirada
+
+FICHAS_POR_DEFECTO = 6
+MAX_FICHAS = 8
+MAGIA = b'BGB2'
+VERSION = 1
+_CABECERA = struct.Struct('<4sHHI')
+
+RUTA_POR_DEFECTO = os.path.join(os.path.dirname(__file__), 'datos', 'bearoff2.bin')
+
+
+def _pips(puntos):
+    return sum((k + 1) * n for k, n in enumerate(puntos))
+
+
+# --- Generación ---
+
+_TRABAJO = {}
+
+
+def _iniciar_trabajo(ruta, fichas):
+    """Prepara (una vez por proceso) la matriz compartida y las jugadas de cada posición."""
+    import numpy as np
+    total = cantidad_posiciones(fichas)
+    posiciones = [posicion_de_indice(i, fichas) for i in range(total)]
+    pips = [_pips(p) for p in posiciones]
+    por_pips = {}
+    for i in range(1, total):
+        por_pips.setdefault(pips[i], []).append(i)
+    _TRABAJO.update(
+        matriz=np.memmap(ruta, dtype=np.float64, mode='r+', shape=(total, total)),
+        pips=pips,
+        por_pips={k: np.array(v, dtype=np.intp) for k, v in por_pips.items()},
+        jugadas=[
+            [(p, np.array(sorted(indice_posicion(s)
+                                 for s in sucesores(posiciones[i], dados_de_tirada(t))),
+                          dtype=np.intp))
+             for t, p in TIRADAS]
+            for i in range(total)
+        ],
+    )
+
+
+def _calcular_bloque(tarea):
+    """Calcula P(a, b) para las posiciones 'a' del bloque y los 'b' del nivel de pips."""
+    nivel, indices = tarea
+    matriz = _TRABAJO['matriz']
+    pips = _TRABAJO['pips']
+    por_pips = _TRABAJO['por_pips']
+    jugadas = _TRABAJO['jugadas']
+    for a in indices:
+        rivales = por_pips.get(nivel - pips[a])
+        if rivales is None:
+            continue
+        valor = 0.0
+        for p, destinos in jugadas[a]:
+            # Para cada rival b: mejor jugada = la que minimiza P(b, a')
+            valor = valor + p * (1.0 - matriz[rivales[:, None], destinos[None, :]].min(axis=1))
+        matriz[a, rivales] = valor
+    return len(indices)
+
+
+def generar_tabla(ruta: str = RUTA_POR_DEFECTO, fichas: int = FICHAS_POR_DEFECTO, procesos: int = 1,
+                  informar=None) -> int:
+    """
+    Genera el archivo de la tabla de dos lados (requiere numpy).
+    :param informar: función opcional (nivel, niveles) para mostrar progreso.
+    :return: cantidad de posiciones por lado.
+    """
+    import numpy as np
+    if not 1 <= fichas <= MAX_FICHAS:
+        raise ValueError(f"La cantidad de fichas debe estar entre 1 y {MAX_FICHAS}.")
+    total = cantidad_posiciones(fichas)
+
+    with archivo_de_trabajo(ruta, total * total * 8) as trabajo:
+        matriz = np.memmap(trabajo, dtype=np.float64, mode='r+', shape=(total, total))
+        matriz[0, :] = 1.0      # quien tiene el turno ya no tiene fichas: ganó
+        matriz[1:, 0] = 0.0     # el rival ya sacó todas: quien tiene el turno perdió
+        matriz.flush()
+
+        pool = None
+        if procesos > 1:
+            pool = multiprocessing.Pool(procesos, initializer=_iniciar_trabajo,
+                                        initargs=(trabajo, fichas))
+        else:
+            _iniciar_trabajo(trabajo, fichas)
+        try:
+            pips = [_pips(posicion_de_indice(i, fichas)) for i in range(total)]
+            maximo = max(pips)
+            niveles = range(2, 2 * maximo + 1)
+            for numero, nivel in enumerate(niveles, 1):
+                indices = [a for a in range(1, total) if 1 <= nivel - pips[a] <= maximo]
+                if pool is None:
+                    _calcular_bloque((nivel, indices))
+                else:
+                    paso = max(8, len(indices) // (procesos * 4))
+                    bloques = [(nivel, indices[k:k + paso]) for k in range(0, len(indices), paso)]
+                    pool.map(_calcular_bloque, bloques)
+                if informar:
+                    informar(numero, len(niveles))
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+            _TRABAJO.clear()
+
+        matriz.flush()
+        cuantizada = np.rint(matriz * ESCALA).astype('<u2')
+        with open(ruta, 'wb') as archivo:
+            archivo.write(_CABECERA.pack(MAGIA, VERSION, fichas, total))
+            archivo.write(cuantizada.tobytes())
+        del matriz
+    return total
+
+
+# --- Consulta ---
+
+class TablaFinalesDoble:
+    """
+    Tabla de finales de dos lados abierta con mmap (sólo lectura).
+
+    :param ruta: archivo generado con generar_tabla.
+    """
+
+    def __init__(self, ruta: str = RUTA_POR_DEFECTO):
+        self.__archivo__, self.__mapa__ = mapear_lectura(ruta)
+        magia, version, fichas, total = _CABECERA.unpack_from(self.__mapa__, 0)
+        if (magia != MAGIA or version != VERSION or total != cantidad_posiciones(fichas)
+                or len(self.__mapa__) != _CABECERA.size + total * total * 2):
+            self.__mapa__.close()
+            self.__archivo__.close()
+            raise ValueError(f"Archivo de finales inválido: {ruta}")
+        self.__fichas__ = fichas
+        self.__total__ = total
+        vista = memoryview(self.__mapa__)
+        self.__valores__ = vista[_CABECERA.size:].cast('H')
+        vista.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+    def cerrar(self):
+        """Libera el mapeo del archivo."""
+        valores = self.__dict__.pop('__valores__', None)
+        if valores is not None:
+            valores.release()
+        if not self.__mapa__.closed:
+            self.__mapa__.close()
+        self.__archivo__.close()
+
+    def obtener_fichas(self) -> int:
+        """Máximo de fichas por lado con que se generó la tabla."""
+        return self.__fichas__
+
+    def cubre(self, puntos) -> bool:
+        """Indica si una posición de casa (puntos 1..6) está dentro de la tabla."""
+        return puntos is not None and len(puntos) == PUNTOS and sum(puntos) <= self.__fichas__
+
+    def probabilidad_ganar(self, puntos_turno, puntos_rival) -> float:
+        """Probabilidad exacta de que gane quien tiene el turno."""
+        if not (self.cubre(puntos_turno) and self.cubre(puntos_rival)):
+            raise ValueError(f"Posición fuera de la tabla: {puntos_turno} / {puntos_rival}")
+        indice = indice_posicion(puntos_turno) * self.__total__ + indice_posicion(puntos_rival)
+        return self.__valores__[indice] / ESCALA
+
+    def consultar(self, tablero: Tablero, color: str) -> Optional[float]:
+        """
+        Probabilidad de que gane 'color' (que tiene el turno) si ambos colores
+        tienen todas sus fichas en casa y dentro del límite.
+        :return: la probabilidad, o None si alguno de los dos colores tiene
+            fichas fuera de casa, excede el límite de la tabla o todavía tiene
+            0 fichas fuera (la tabla no distingue gammons).
+        """
+        if not (tablero.todas_las_fichas_en_casa('B') and tablero.todas_las_fichas_en_casa('N')):
+            return None
+        if tablero.obtener_fichas_fuera('B') == 0 or tablero.obtener_fichas_fuera('N') == 0:
+            return None
+        otro = 'N' if color == 'B' else 'B'
+        propios = puntos_en_casa(tablero, color)
+        rivales = puntos_en_casa(tablero, otro)
+        if not (self.cubre(propios) and self.cubre(rivales)):
+            return None
+        return self.probabilidad_ganar(propios, rivales)
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Genera la tabla de finales de dos lados.")
+    parser.add_argument('--ruta', default=RUTA_POR_DEFECTO)
+    parser.add_argument('--fichas', type=int, default=FICHAS_POR_DEFECTO)
+    parser.add_argument('--procesos', type=int, default=multiprocessing.cpu_count())
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+
+    def informar(nivel, niveles):
+        print(f"\rNivel {nivel}/{niveles}", end='', flush=True)
+
+    total = generar_tabla(args.ruta, args.fichas, args.procesos, informar)
+    print(f"\n{total}x{total} posiciones en {time.perf_counter() - inicio:.1f}s -> {args.ruta}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Evaluación estática barata de posiciones.
+
+Los valores se expresan como equidad desde el punto de vista de un color:
++1 gana simple, +2 gammon, +3 backgammon (negativos si pierde). El evaluador
+estático devuelve valores en (-1, 1); sólo las posiciones terminales llegan
+a los extremos de gammon/backgammon.
+
+Sin contacto (Tablero.hay_contacto) la posición es una carrera pura y el
+motor usa evaluar_carrera: un conteo de pips efectivo (pips + desperdicio al
+estilo de la cuenta de Keith) y la aproximación normal de Kleinman para la
+probabilidad de ganar de quien tiene el turno.
+"""
+import math
+from core.board import Tablero
+from core.tables import INDICE_COLOR, PUNTO_SALIDA, SIGNO
+
+EQUIDAD_MIN = -3.0
+EQUIDAD_MAX = 3.0
+
+# Pesos del evaluador lineal (ajustados a mano, antes de la tanh)
+_PESO_PIPS = 0.02
+_PESO_FUERA = 0.08
+_PESO_BARRA = 0.15
+_PESO_BLOT = 0.06
+_PESO_PUNTO = 0.04
+
+# Puntos a distancia 1..6 del final del recorrido de cada color (misma
+# geometría que Tablero.obtener_pips): 'B' (None, 23, ..., 18), 'N' (None, 0, ..., 5)
+_CASA = {color: PUNTO_SALIDA[c] for color, c in INDICE_COLOR.items()}
+
+
+def rival(color: str) -> str:
+    """Devuelve el color contrario."""
+    return 'N' if color == 'B' else 'B'
+
+
+def valor_final(tablero: Tablero, ganador: str) -> float:
+    """
+    Devuelve los puntos que gana 'ganador' (1, 2 o 3) en una posición terminal.
+    Gammon si el perdedor no sacó ninguna ficha; backgammon si además tiene
+    fichas en la barra o en la casa del ganador.
+    """
+    perdedor = rival(ganador)
+    if tablero.obtener_fichas_fuera(perdedor) > 0:
+        return 1.0
+    if tablero.obtener_fichas_barra(perdedor) > 0:
+        return 3.0
+    conteos = tablero.obtener_conteos()
+    # Casa del ganador: 'B' 18-23, 'N' 0-5
+    casa = _CASA[ganador][1:]
+    signo_perdedor = -1 if perdedor == 'N' else 1
+    if any(conteos[i] * signo_perdedor > 0 for i in casa):
+        return 3.0
+    return 2.0
+
+
+def conteo_efectivo(tablero: Tablero, color: str) -> int:
+    """
+    Pips de 'color' más el desperdicio previsible al sacar (cuenta de Keith,
+    sin el ajuste por tener el turno): +2 por cada ficha de más en el punto 1,
+    +1 por cada ficha de más en el punto 2, +1 por cada ficha más allá de la
+    tercera en el punto 3 y +1 por cada punto vacío entre el 4 y el 6. Los
+    puntos se cuentan desde la salida de 'color' (_CASA, el punto k sale con k).
+    """
+    conteos = tablero.vista_conteos()
+    casa = _CASA[color]
+    signo = SIGNO[INDICE_COLOR[color]]
+    n1, n2, n3, n4, n5, n6 = (max(conteos[casa[k]] * signo, 0) for k in range(1, 7))
+    return (tablero.obtener_pips(color)
+            + 2 * max(n1 - 1, 0) + max(n2 - 1, 0) + max(n3 - 3, 0)
+            + (n4 == 0) + (n5 == 0) + (n6 == 0))
+
+
+def probabilidad_carrera(tablero: Tablero, color: str) -> float:
+    """
+    Probabilidad de que gane la carrera 'color', que tiene el turno
+    (aproximación de Kleinman sobre los conteos efectivos).
+    """
+    propio = conteo_efectivo(tablero, color)
+    otro = conteo_efectivo(tablero, rival(color))
+    suma = propio + otro - 4
+    if suma <= 0:
+        return 1.0 if propio <= otro else 0.0
+    return 0.5 * math.erfc(-(otro - propio + 4) / (2.0 * math.sqrt(suma)))
+
+
+def evaluar_carrera(tablero: Tablero, color: str) -> float:
+    """
+    Equidad de una carrera sin contacto para 'color' en el turno, en [-1, 1]
+    (no considera gammons, que en una carrera son raros).
+    """
+    otro = rival(color)
+    if tablero.hay_ganador(color):
+        return valor_final(tablero, color)
+    if tablero.hay_ganador(otro):
+        return -valor_final(tablero, otro)
+    return 2.0 * probabilidad_carrera(tablero, color) - 1.0
+
+
+def evaluar_estatico(tablero: Tablero, color: str) -> float:
+    """
+    Evaluación estática O(24) desde el punto de vista de 'color'.
+    Combina diferencia de pips, fichas fuera, barra, blots y puntos hechos.
+    """
+    otro = rival(color)
+    if tablero.hay_ganador(color):
+        return valor_final(tablero, color)
+    if tablero.hay_ganador(otro):
+        return -valor_final(tablero, otro)
+
+    signo = 1 if color == 'B' else -1
+    blots = 0
+    puntos = 0
+    for n in tablero.vista_conteos():
+        n *= signo
+        if n == 1:
+            blots += 1
+        elif n == -1:
+            blots -= 1
+        elif n >= 2:
+            puntos += 1
+        elif n <= -2:
+            puntos -= 1
+
+    x = (_PESO_PIPS * (tablero.obtener_pips(otro) - tablero.obtener_pips(color))
+         + _PESO_FUERA * (tablero.obtener_fichas_fuera(color) - tablero.obtener_fichas_fuera(otro))
+         + _PESO_BARRA * (tablero.obtener_fichas_barra(otro) - tablero.obtener_fichas_barra(color))
+         - _PESO_BLOT * blots
+         + _PESO_PUNTO * puntos)
+    return math.tanh(x)
@@ -0,0 +1,238 @@
+"""
+Evaluador de posiciones con una red neuronal en NumPy puro.
+
+Codificación estilo TD-Gammon (198 entradas):
+- por color ('B' y luego 'N') y por punto, 4 unidades: n >= 1, n >= 2, n >= 3
+  y (n - 3) / 2 si n > 3 (96 por color);
+- por color, fichas en la barra / 2 y fichas fuera / 15;
+- 2 unidades de turno (quién tiene la tirada).
+
+La red es de una capa oculta (sigmoide) y 5 salidas sigmoide desde el punto de
+vista de quien tiene el turno: gana, gana gammon, gana backgammon, pierde
+gammon y pierde backgammon. La equidad es
+    2*gana - 1 + (gammon - gammon_perdido) + (backgammon - backgammon_perdido).
+
+La inferencia es por lotes: todas las jugadas candidatas se codifican en una
+sola matriz y se evalúan con una multiplicación de matrices. Las carreras sin
+contacto se evalúan con evaluar_carrera (engine.evaluation) sin usar la red.
+"""
+from typing import Optional
+import numpy as np
+from core.board import Tablero
+from engine.evaluation import evaluar_carrera, valor_final, rival
+
+ENTRADAS = 198
+SALIDAS = 5
+OCULTAS_POR_DEFECTO = 80
+
+# Índices de las salidas
+GANA, GANA_GAMMON, GANA_BACKGAMMON, PIERDE_GAMMON, PIERDE_BACKGAMMON = range(SALIDAS)
+_PESOS_EQUIDAD = np.array([2.0, 1.0, 1.0, -1.0, -1.0])
+
+
+def _sigmoide(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def codificar_conteos(conteos, barra, fuera, turno_negro):
+    """
+    Codifica un lote de posiciones.
+    :param conteos: matriz (k, 24) de conteos con signo.
+    :param barra: matriz (k, 2) de fichas en la barra (blancas, negras).
+    :param fuera: matriz (k, 2) de fichas fuera (blancas, negras).
+    :param turno_negro: vector (k,) booleano: True si mueve 'N'.
+    :return: matriz (k, ENTRADAS) float64.
+    """
+    k = conteos.shape[0]
+    x = np.empty((k, ENTRADAS))
+    for c, n in enumerate((np.maximum(conteos, 0), np.maximum(-conteos, 0))):
+        bloque = x[:, c * 99:c * 99 + 96].reshape(k, 24, 4)
+        bloque[:, :, 0] = n >= 1
+        bloque[:, :, 1] = n >= 2
+        bloque[:, :, 2] = n >= 3
+        bloque[:, :, 3] = np.maximum(n - 3, 0) / 2.0
+        x[:, c * 99 + 96] = barra[:, c] / 2.0
+        x[:, c * 99 + 97] = fuera[:, c] / 15.0
+        x[:, c * 99 + 98] = 0.0
+    # Las dos unidades de turno ocupan la última columna de cada bloque de color
+    x[:, 98] = ~turno_negro
+    x[:, 197] = turno_negro
+    return x
+
+
+def codificar(tablero: Tablero, color: str) -> np.ndarray:
+    """Codifica una posición con 'color' en el turno (vector de ENTRADAS)."""
+    return codificar_lote([tablero], color)[0]
+
+
+def codificar_lote(tableros, color: str) -> np.ndarray:
+    """Codifica varias posiciones con el mismo color en el turno."""
+    k = len(tableros)
+    conteos = np.empty((k, 24), dtype=np.int8)
+    barra = np.empty((k, 2), dtype=np.int8)
+    fuera = np.empty((k, 2), dtype=np.int8)
+    for j, tablero in enumerate(tableros):
+        conteos[j] = tablero.vista_conteos()
+        barra[j] = tablero.obtener_barra()
+        fuera[j] = tablero.obtener_fuera()
+    return codificar_conteos(conteos, barra, fuera, np.full(k, color == 'N'))
+
+
+def codificar_jugadas(tablero: Tablero, color: str, jugadas, carreras: bool = False):
+    """
+    Codifica la posición resultante de cada jugada (con el rival en el turno)
+    usando aplicar/deshacer sobre el mismo tablero.
+    :param carreras: si es True, las jugadas que dejan una carrera sin
+                     contacto reciben directamente el valor de evaluar_carrera.
+    :return: tupla (matriz (k, ENTRADAS), lista con el valor para 'color' de
+             las jugadas que no necesitan la red (ganan la partida o, con
+             'carreras', dejan una carrera) o None).
+    """
+    k = len(jugadas)
+    conteos = np.empty((k, 24), dtype=np.int8)
+    barra = np.empty((k, 2), dtype=np.int8)
+    fuera = np.empty((k, 2), dtype=np.int8)
+    finales = [None] * k
+    for j, jugada in enumerate(jugadas):
+        for origen, destino, _ in jugada:
+            tablero.aplicar(color, origen, destino)
+        conteos[j] = tablero.vista_conteos()
+        barra[j] = tablero.obtener_barra()
+        fuera[j] = tablero.obtener_fuera()
+        if tablero.hay_ganador(color):
+            finales[j] = valor_final(tablero, color)
+        elif carreras and not tablero.hay_contacto():
+            finales[j] = -evaluar_carrera(tablero, rival(color))
+        for _ in jugada:
+            tablero.deshacer()
+    return codificar_conteos(conteos, barra, fuera, np.full(k, color == 'B')), finales
+
+
+class RedNeuronal:
+    """
+    Red de una capa oculta para evaluar posiciones.
+
+    :param ocultas: cantidad de neuronas ocultas.
+    :param semilla: semilla para los pesos iniciales.
+    :param carreras: evaluar las carreras sin contacto con evaluar_carrera.
+    """
+
+    def __init__(self, ocultas: int = OCULTAS_POR_DEFECTO, semilla: Optional[int] = 0,
+                 carreras: bool = True):
+        if ocultas < 1:
+            raise ValueError("La red necesita al menos una neurona oculta.")
+        rng = np.random.default_rng(semilla)
+        self.w1 = rng.normal(0.0, 1.0 / np.sqrt(ENTRADAS), (ENTRADAS, ocultas))
+        self.b1 = np.zeros(ocultas)
+        self.w2 = rng.normal(0.0, 1.0 / np.sqrt(ocultas), (ocultas, SALIDAS))
+        self.b2 = np.zeros(SALIDAS)
+        self.carreras = carreras
+
+    def obtener_ocultas(self) -> int:
+        """Cantidad de neuronas ocultas."""
+        return self.b1.shape[0]
+
+    # --- Inferencia ---
+
+    def propagar(self, x: np.ndarray):
+        """
+        Propaga un lote de entradas.
+        :return: tupla (salidas (k, SALIDAS), activaciones ocultas (k, ocultas)).
+        """
+        ocultas = _sigmoide(x @ self.w1 + self.b1)
+        return _sigmoide(ocultas @ self.w2 + self.b2), ocultas
+
+    def probabilidades_lote(self, x: np.ndarray) -> np.ndarray:
+        """Probabilidades de las salidas para cada fila del lote."""
+        return self.propagar(x)[0]
+
+    def equidades_lote(self, x: np.ndarray) -> np.ndarray:
+        """Equidad de quien tiene el turno para cada fila del lote."""
+        return self.probabilidades_lote(x) @ _PESOS_EQUIDAD - 1.0
+
+    def probabilidades(self, tablero: Tablero, color: str) -> np.ndarray:
+        """Las 5 probabilidades de 'color' con 'color' en el turno."""
+        return self.probabilidades_lote(codificar(tablero, color)[None, :])[0]
+
+    def evaluar(self, tablero: Tablero, color: str) -> float:
+        """Equidad de 'color' en el turno (misma firma que evaluar_estatico)."""
+        if tablero.hay_ganador(color):
+            return valor_final(tablero, color)
+        otro = rival(color)
+        if tablero.hay_ganador(otro):
+            return -valor_final(tablero, otro)
+        if self.carreras and not tablero.hay_contacto():
+            return evaluar_carrera(tablero, color)
+        return float(self.equidades_lote(codificar(tablero, color)[None, :])[0])
+
+    __call__ = evaluar
+
+    def evaluar_jugadas(self, tablero: Tablero, color: str, jugadas) -> np.ndarray:
+        """
+        Equidad para 'color' de cada jugada candidata, con una sola
+        multiplicación de matrices para las que la necesitan.
+        """
+        x, fijos = codificar_jugadas(tablero, color, jugadas, self.carreras)
+        pendientes = [j for j, valor in enumerate(fijos) if valor is None]
+        equidades = np.empty(len(jugadas))
+        if pendientes:
+            equidades[pendientes] = -self.equidades_lote(x[pendientes])
+        for j, valor in enumerate(fijos):
+            if valor is not None:
+                equidades[j] = valor
+        return equidades
+
+    # --- Entrenamiento ---
+
+    def entrenar_lote(self, x: np.ndarray, objetivos: np.ndarray, alfa: float) -> float:
+        """
+        Un paso de descenso por gradiente sobre el error cuadrático medio
+        entre las salidas y los objetivos (k, SALIDAS).
+        :return: pérdida del lote antes del paso.
+        """
+        salidas, ocultas = self.propagar(x)
+        error = salidas - objetivos
+        perdida = float(np.mean(error * error)) / 2.0
+        delta2 = error * salidas * (1.0 - salidas) / x.shape[0]
+        delta1 = (delta2 @ self.w2.T) * ocultas * (1.0 - ocultas)
+        self.w2 -= alfa * (ocultas.T @ delta2)
+        self.b2 -= alfa * delta2.sum(axis=0)
+        self.w1 -= alfa * (x.T @ delta1)
+        self.b1 -= alfa * delta1.sum(axis=0)
+        return perdida
+
+    def obtener_parametros(self) -> np.ndarray:
+        """Todos los pesos en un vector plano (para publicarlos entre procesos)."""
+        return np.concatenate([self.w1.ravel(), self.b1, self.w2.ravel(), self.b2])
+
+    def fijar_parametros(self, vector: np.ndarray):
+        """Copia los pesos desde un vector plano de obtener_parametros."""
+        inicio = 0
+        for nombre in ('w1', 'b1', 'w2', 'b2'):
+            destino = getattr(self, nombre)
+            fin = inicio + destino.size
+            destino[...] = np.reshape(vector[inicio:fin], destino.shape)
+            inicio = fin
+
+    def cantidad_parametros(self) -> int:
+        """Cantidad total de pesos y sesgos."""
+        return self.w1.size + self.b1.size + self.w2.size + self.b2.size
+
+    # --- Pesos ---
+
+    def guardar(self, ruta: str):
+        """Guarda los pesos en un archivo .npz."""
+        np.savez(ruta, w1=self.w1, b1=self.b1, w2=self.w2, b2=self.b2)
+
+    @classmethod
+    def cargar(cls, ruta: str) -> 'RedNeuronal':
+        """Carga una red guardada con guardar."""
+        with np.load(ruta) as datos:
+            w1, b1, w2, b2 = datos['w1'], datos['b1'], datos['w2'], datos['b2']
+        ocultas = b1.shape[0]
+        if (w1.shape != (ENTRADAS, ocultas) or w2.shape != (ocultas, SALIDAS)
+                or b2.shape != (SALIDAS,)):
+            raise ValueError(f"Pesos incompatibles en {ruta}")
+        red = cls(ocultas, semilla=None)
+        red.w1, red.b1, red.w2, red.b2 = w1, b1, w2, b2
+        return red
@@ -0,0 +1,224 @@
+"""
+Libro de aperturas: la mejor jugada precalculada para las primeras tiradas.
+
+Las primeras jugadas de cada partida son siempre los mismos problemas. El
+libro se genera una sola vez con rollouts (engine.rollout): desde la posición
+inicial, para cada tirada se evalúan las mejores candidatas y se guarda la
+ganadora; luego se aplica esa jugada y se repite con las 21 tiradas del rival
+(las respuestas principales), hasta 'profundidad' turnos. Si ninguna prueba
+del rollout de una posición llegó al final (todas truncadas), la posición no
+se guarda ni se sigue explorando.
+
+La clave es (hash de Zobrist con el turno, tirada), así que una consulta es
+una búsqueda en un diccionario. El archivo es binario y compacto (25 bytes
+por entrada) y se carga recién en la primera consulta.
+
+Generar (una sola vez):
+    python -m engine.opening --profundidad 2 --procesos 4
+"""
+import argparse
+import multiprocessing
+import os
+import struct
+import time
+from typing import NamedTuple, Optional
+from core.board import Tablero
+from engine.evaluation import rival
+from engine.rollout import rollout
+from engine.search import Buscador, TIRADAS, dados_de_tirada
+
+MAGIA = b'BGA1'
+VERSION = 1
+_CABECERA = struct.Struct('<4sHI')
+# hash, dado menor, dado mayor, cantidad de movimientos, 4 x (origen, destino, dado), equidad x 1000
+_ENTRADA = struct.Struct('<QBBB12bh')
+_MAX_MOVIMIENTOS = 4
+_ESCALA_EQUIDAD = 1000
+
+PROFUNDIDAD_POR_DEFECTO = 2
+RUTA_POR_DEFECTO = os.path.join(os.path.dirname(__file__), 'datos', 'aperturas.bin')
+
+
+class JugadaLibro(NamedTuple):
+    """Jugada del libro para una tirada y su equidad según el rollout."""
+    jugada: tuple
+    equidad: float
+
+
+def clave_tirada(dados) -> Optional[tuple]:
+    """
+    Tirada completa (menor, mayor), como en TIRADAS, de una lista de dados
+    sin jugar, o None si los dados no forman una tirada entera (por ejemplo,
+    a mitad de turno).
+    """
+    if len(dados) == 2 and dados[0] != dados[1]:
+        return min(dados), max(dados)
+    if len(dados) == 4 and dados.count(dados[0]) == 4:
+        return dados[0], dados[0]
+    return None
+
+
+# --- Generación ---
+
+def _mejor_jugada(tablero, color, tirada, candidatos, opciones_rollout) -> Optional[JugadaLibro]:
+    """
+    Elige la jugada de una tirada con rollouts sobre las mejores candidatas
+    estáticas. Devuelve None si todas las pruebas de los rollouts se truncaron.
+    """
+    buscador = Buscador(profundidad=1, capacidad_tabla=0)
+    evaluadas = buscador.evaluar_jugadas(tablero, color, dados_de_tirada(tirada))
+    jugadas = [jugada for jugada, _ in evaluadas[:candidatos]]
+    if len(jugadas) == 1:
+        return JugadaLibro(jugadas[0], evaluadas[0][1])
+    mejor = rollout(tablero, color, jugadas=jugadas, **opciones_rollout)[0]
+    if not mejor.pruebas:
+        return None
+    return JugadaLibro(mejor.jugada, mejor.media)
+
+
+def generar_libro(ruta: str = RUTA_POR_DEFECTO, profundidad: int = PROFUNDIDAD_POR_DEFECTO,
+                  candidatos: int = 4, pruebas: int = 1296, truncamiento: Optional[int] = None,
+                  max_turnos: int = 200, procesos: int = 1, semilla: int = 0,
+                  color: str = 'B', informar=None) -> int:
+    """
+    Genera el archivo del libro.
+    :param profundidad: turnos cubiertos (1 = sólo la primera tirada, 2 = también
+                        las respuestas del rival a cada jugada del libro).
+    :param candidatos: jugadas (las mejores según el evaluador estático) que
+                       se comparan con rollouts en cada posición.
+    :param color: color que sale (en Game siempre empieza 'B').
+    :param informar: función opcional (hechas, total) para mostrar progreso.
+    :return: cantidad de entradas escritas (sin las posiciones descartadas
+             porque todas sus pruebas se truncaron).
+    """
+    if profundidad < 1:
+        raise ValueError("La profundidad debe ser al menos 1.")
+    if candidatos < 1:
+        raise ValueError("Se necesita al menos una candidata.")
+    opciones_rollout = {
+        'pruebas': pruebas, 'truncamiento': truncamiento, 'max_turnos': max_turnos,
+        'procesos': procesos, 'semilla': semilla,
+    }
+    tablero = Tablero()
+    # Incluye las posiciones descartadas (None) para no repetir sus rollouts
+    entradas = {}
+    total = sum(len(TIRADAS) ** (nivel + 1) for nivel in range(profundidad))
+
+    def explorar(color, nivel):
+        for tirada, _ in TIRADAS:
+            clave = (tablero.obtener_hash(color), tirada)
+            if clave not in entradas:
+                entradas[clave] = _mejor_jugada(tablero, color, tirada, candidatos,
+                                                opciones_rollout)
+            if informar:
+                informar(len(entradas), total)
+            if entradas[clave] is not None and nivel + 1 < profundidad:
+                jugada = entradas[clave].jugada
+                for origen, destino, _ in jugada:
+                    tablero.aplicar(color, origen, destino)
+                if not tablero.hay_ganador(color):
+                    explorar(rival(color), nivel + 1)
+                for _ in jugada:
+                    tablero.deshacer()
+
+    explorar(color, 0)
+    entradas = {clave: entrada for clave, entrada in entradas.items() if entrada is not None}
+    guardar_libro(ruta, entradas)
+    return len(entradas)
+
+
+def guardar_libro(ruta: str, entradas: dict):
+    """Escribe un diccionario {(hash, tirada): JugadaLibro} en el formato del libro."""
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    os.makedirs(directorio, exist_ok=True)
+    with open(ruta, 'wb') as archivo:
+        archivo.write(_CABECERA.pack(MAGIA, VERSION, len(entradas)))
+        for (clave, (a, b)), (jugada, equidad) in sorted(entradas.items()):
+            if len(jugada) > _MAX_MOVIMIENTOS:
+                raise ValueError(f"Jugada demasiado larga para el libro: {jugada}")
+            movimientos = [valor for movimiento in jugada for valor in movimiento]
+            movimientos += [0] * (3 * _MAX_MOVIMIENTOS - len(movimientos))
+            archivo.write(_ENTRADA.pack(clave, a, b, len(jugada), *movimientos,
+                                        round(equidad * _ESCALA_EQUIDAD)))
+
+
+# --- Consulta ---
+
+class LibroAperturas:
+    """
+    Libro de aperturas de sólo lectura; el archivo se lee en la primera consulta.
+
+    :param ruta: archivo generado con generar_libro.
+    """
+
+    def __init__(self, ruta: str = RUTA_POR_DEFECTO):
+        self.__ruta__ = ruta
+        self.__entradas__: Optional[dict] = None
+        self.aciertos = 0
+        self.fallos = 0
+
+    def __getstate__(self):
+        # Al enviarlo a otros procesos basta con la ruta: cada uno lo carga al usarlo
+        return {'__ruta__': self.__ruta__, '__entradas__': None, 'aciertos': 0, 'fallos': 0}
+
+    def __len__(self):
+        return len(self._cargar())
+
+    def _cargar(self) -> dict:
+        if self.__entradas__ is None:
+            with open(self.__ruta__, 'rb') as archivo:
+                datos = archivo.read()
+            if len(datos) < _CABECERA.size:
+                raise ValueError(f"Libro de aperturas inválido: {self.__ruta__}")
+            magia, version, cantidad = _CABECERA.unpack_from(datos, 0)
+            esperado = _CABECERA.size + cantidad * _ENTRADA.size
+            if magia != MAGIA or version != VERSION or len(datos) != esperado:
+                raise ValueError(f"Libro de aperturas inválido: {self.__ruta__}")
+            entradas = {}
+            for campos in _ENTRADA.iter_unpack(datos[_CABECERA.size:]):
+                clave, a, b, cantidad_movimientos = campos[:4]
+                movimientos = campos[4:4 + 3 * cantidad_movimientos]
+                jugada = tuple(tuple(movimientos[k:k + 3]) for k in range(0, len(movimientos), 3))
+                entradas[(clave, (a, b))] = JugadaLibro(jugada, campos[-1] / _ESCALA_EQUIDAD)
+            self.__entradas__ = entradas
+        return self.__entradas__
+
+    def consultar(self, tablero: Tablero, color: str, dados) -> Optional[JugadaLibro]:
+        """Jugada del libro para 'color' con los dados de una tirada entera, o None."""
+        tirada = clave_tirada(list(dados))
+        entrada = None
+        if tirada is not None:
+            entrada = self._cargar().get((tablero.obtener_hash(color), tirada))
+        if entrada is None:
+            self.fallos += 1
+        else:
+            self.aciertos += 1
+        return entrada
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Genera el libro de aperturas con rollouts.")
+    parser.add_argument('--ruta', default=RUTA_POR_DEFECTO)
+    parser.add_argument('--profundidad', type=int, default=PROFUNDIDAD_POR_DEFECTO)
+    parser.add_argument('--candidatos', type=int, default=4)
+    parser.add_argument('--pruebas', type=int, default=1296)
+    parser.add_argument('--truncamiento', type=int, default=None)
+    parser.add_argument('--max-turnos', type=int, default=200)
+    parser.add_argument('--procesos', type=int, default=multiprocessing.cpu_count())
+    parser.add_argument('--semilla', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+
+    def informar(hechas, total):
+        print(f"\rPosiciones {hechas}/{total}", end='', flush=True)
+
+    cantidad = generar_libro(args.ruta, args.profundidad, args.candidatos, args.pruebas,
+                             args.truncamiento, args.max_turnos, args.procesos, args.semilla,
+                             informar=informar)
+    print(f"\n{cantidad} entradas en {time.perf_counter() - inicio:.1f}s -> {args.ruta}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Políticas de juego para partidas sin interfaz (simulaciones, rollouts).
+
+Una política elige una jugada completa entre las legales. Todas comparten la
+misma interfaz para poder enfrentarse entre sí, y se construyen por nombre con
+crear_politica para poder crearlas dentro de procesos de trabajo.
+"""
+import random
+from abc import ABC, abstractmethod
+from core.board import Tablero
+from engine.evaluation import evaluar_estatico, valor_final, rival
+from engine.search import Buscador
+
+
+class Politica(ABC):
+    """Interfaz base (abstracta): elige una jugada entre las legales."""
+
+    nombre = 'base'
+
+    def sembrar(self, semilla: int):
+        """Reinicia el azar propio de la política (si lo tiene)."""
+
+    @abstractmethod
+    def elegir(self, tablero: Tablero, color: str, dados, jugadas):
+        """
+        :param jugadas: jugadas legales (nunca vacía; [()] si no hay movimientos).
+        :return: una de las jugadas.
+        """
+
+
+class PoliticaAleatoria(Politica):
+    """Elige una jugada legal al azar (uniforme)."""
+
+    nombre = 'aleatoria'
+
+    def __init__(self, semilla=None):
+        self.__rng__ = random.Random(semilla)
+
+    def sembrar(self, semilla: int):
+        self.__rng__.seed(semilla)
+
+    def elegir(self, tablero, color, dados, jugadas):
+        return jugadas[0] if len(jugadas) == 1 else self.__rng__.choice(jugadas)
+
+
+class PoliticaGolosa(Politica):
+    """Elige la jugada que deja la mejor posición según un evaluador (1 ply)."""
+
+    nombre = 'golosa'
+
+    def __init__(self, evaluador=evaluar_estatico):
+        self.__evaluador__ = evaluador
+
+    def elegir(self, tablero, color, dados, jugadas):
+        if len(jugadas) == 1:
+            return jugadas[0]
+        mejor, mejor_valor = jugadas[0], None
+        otro = rival(color)
+        for jugada in jugadas:
+            for origen, destino, _ in jugada:
+                tablero.aplicar(color, origen, destino)
+            if tablero.hay_ganador(color):
+                valor = valor_final(tablero, color)
+            else:
+                valor = -self.__evaluador__(tablero, otro)
+            for _ in jugada:
+                tablero.deshacer()
+            if mejor_valor is None or valor > mejor_valor:
+                mejor, mejor_valor = jugada, valor
+        return mejor
+
+
+class PoliticaBusqueda(Politica):
+    """Elige la jugada con el motor expectiminimax (engine.search)."""
+
+    nombre = 'busqueda'
+
+    def __init__(self, profundidad: int = 2, tiempo_limite=None, **opciones):
+        self.__buscador__ = Buscador(profundidad=profundidad, tiempo_limite=tiempo_limite,
+                                     **opciones)
+
+    def elegir(self, tablero, color, dados, jugadas):
+        if len(jugadas) == 1:
+            return jugadas[0]
+        jugada, _ = self.__buscador__.buscar(tablero, color, dados)
+        return jugada
+
+
+class PoliticaRed(Politica):
+    """Elige la jugada con la red neuronal (todas las candidatas en un solo lote)."""
+
+    nombre = 'red'
+
+    def __init__(self, ruta=None, red=None):
+        # Importación diferida: sólo esta política necesita numpy
+        from engine.neural import RedNeuronal
+        if red is None:
+            red = RedNeuronal.cargar(ruta) if ruta else RedNeuronal()
+        self.__red__ = red
+
+    def elegir(self, tablero, color, dados, jugadas):
+        if len(jugadas) == 1:
+            return jugadas[0]
+        return jugadas[int(self.__red__.evaluar_jugadas(tablero, color, jugadas).argmax())]
+
+
+POLITICAS = {
+    PoliticaAleatoria.nombre: PoliticaAleatoria,
+    PoliticaGolosa.nombre: PoliticaGolosa,
+    PoliticaBusqueda.nombre: PoliticaBusqueda,
+    PoliticaRed.nombre: PoliticaRed,
+}
+
+
+def especificacion_politica(politica):
+    """
+    Normaliza la especificación de una política para enviarla a otros procesos.
+    Acepta 'nombre' o ('nombre', {opciones}).
+    :return: tupla (nombre, opciones).
+    """
+    if isinstance(politica, str):
+        return politica, {}
+    nombre, opciones = politica
+    return nombre, dict(opciones)
+
+
+def crear_politica(nombre: str, **opciones) -> Politica:
+    """Construye una política registrada por su nombre."""
+    try:
+        clase = POLITICAS[nombre]
+    except KeyError:
+        raise ValueError(f"Política desconocida: {nombre}. "
+                         f"Opciones: {', '.join(POLITICAS)}") from None
+    return clase(**opciones)
@@ -0,0 +1,296 @@
+"""
+Rollouts Monte Carlo para comparar jugadas candidatas.
+
+Para cada jugada candidata se aplica la jugada y se juega la posición hasta el
+final (o hasta el truncamiento) muchas veces con una política rápida. El valor
+de cada prueba es la equidad para el color que hizo la jugada: los puntos
+ganados/perdidos si la partida termina. Las pruebas que no terminan (por
+'truncamiento' o por el tope de turnos) se cuentan aparte: su valor con el
+evaluador estático se promedia por separado y no entra en la equidad.
+
+Reducción de varianza:
+- Números aleatorios comunes: la prueba i usa los mismos dados para todas
+  las candidatas (semilla por prueba).
+- Rotación de dados: las primeras 'rotar' tiradas recorren de forma
+  estratificada las 36 combinaciones (cuasi-aleatorio) en vez de sortearse.
+
+Las pruebas se reparten en rondas; tras cada ronda se descartan las candidatas
+claramente peores (su intervalo de confianza queda por debajo del de la mejor).
+Con varios procesos, cada ronda se reparte en un Pool.
+"""
+import math
+import multiprocessing
+import random
+from typing import NamedTuple, Optional
+from core.board import Tablero
+from core.moves import generar_jugadas
+from engine.evaluation import evaluar_estatico, valor_final, rival
+from engine.policies import crear_politica, especificacion_politica
+
+# Las 36 tiradas ordenadas (a, b)
+_TIRADAS_36 = tuple((a, b) for a in range(1, 7) for b in range(1, 7))
+_CARAS = (1, 2, 3, 4, 5, 6)
+_PASO_SEMILLA = 1_000_003
+
+
+class ResultadoRollout(NamedTuple):
+    """Resultado del rollout de una jugada candidata."""
+    jugada: tuple
+    pruebas: int                  # pruebas jugadas hasta el final
+    media: float                  # equidad media de esas pruebas
+    desviacion: float
+    podada: bool
+    truncadas: int = 0            # pruebas cortadas antes de terminar
+    media_truncadas: float = 0.0  # evaluación estática media de las cortadas
+
+    def error_estandar(self) -> float:
+        """Error estándar de la media (0 con menos de dos pruebas terminadas)."""
+        return self.desviacion / math.sqrt(self.pruebas) if self.pruebas > 1 else 0.0
+
+    def intervalo(self, z: float = 1.96):
+        """Intervalo de confianza (por defecto 95%) de la equidad media."""
+        margen = z * self.error_estandar()
+        return self.media - margen, self.media + margen
+
+
+class _Acumulador:
+    """
+    Suma y suma de cuadrados de los valores de las pruebas terminadas de una
+    candidata, y cantidad y suma de las truncadas (aparte).
+    """
+
+    def __init__(self):
+        self.pruebas = 0
+        self.suma = 0.0
+        self.suma_cuadrados = 0.0
+        self.truncadas = 0
+        self.suma_truncadas = 0.0
+        self.podada = False
+
+    def agregar(self, pruebas, suma, suma_cuadrados, truncadas, suma_truncadas):
+        """Suma los totales de una ronda de pruebas."""
+        self.pruebas += pruebas
+        self.suma += suma
+        self.suma_cuadrados += suma_cuadrados
+        self.truncadas += truncadas
+        self.suma_truncadas += suma_truncadas
+
+    def media(self):
+        """Equidad media de las pruebas terminadas."""
+        return self.suma / self.pruebas if self.pruebas else 0.0
+
+    def media_truncadas(self):
+        """Evaluación estática media de las pruebas truncadas."""
+        return self.suma_truncadas / self.truncadas if self.truncadas else 0.0
+
+    def desviacion(self):
+        """Desviación estándar muestral de las pruebas terminadas."""
+        if self.pruebas < 2:
+            return 0.0
+        varianza = (self.suma_cuadrados - self.suma * self.suma / self.pruebas) / (self.pruebas - 1)
+        return math.sqrt(max(varianza, 0.0))
+
+    def error_estandar(self):
+        """Error estándar de la media de las pruebas terminadas."""
+        return self.desviacion() / math.sqrt(self.pruebas) if self.pruebas > 1 else 0.0
+
+
+def _ordenes_rotacion(semilla, rotar):
+    """Para cada tirada rotada, una permutación sembrada de las 36 tiradas."""
+    ordenes = []
+    for k in range(rotar):
+        orden = list(_TIRADAS_36)
+        random.Random(semilla * _PASO_SEMILLA - k - 1).shuffle(orden)
+        ordenes.append(orden)
+    return ordenes
+
+
+class _Jugador:
+    """Juega las pruebas de un rollout sobre un tablero propio (uno por proceso)."""
+
+    def __init__(self, conteos, barra, fuera, color, jugadas, politica, evaluador,
+                 semilla, truncamiento, max_turnos, rotar):
+        nombre, opciones = politica
+        self.__politica__ = crear_politica(nombre, **opciones)
+        self.__tablero__ = Tablero()
+        self.__posicion__ = (conteos, barra, fuera)
+        self.__color__ = color
+        self.__jugadas__ = jugadas
+        self.__evaluador__ = evaluador
+        self.__semilla__ = semilla
+        self.__limite__ = min(truncamiento, max_turnos) if truncamiento is not None else max_turnos
+        self.__ordenes__ = _ordenes_rotacion(semilla, rotar)
+
+    def jugar_rango(self, candidata, inicio, fin):
+        """
+        Juega las pruebas [inicio, fin) de una candidata y devuelve
+        (candidata, terminadas, suma, suma², truncadas, suma de truncadas).
+        """
+        terminadas = truncadas = 0
+        suma = suma_cuadrados = suma_truncadas = 0.0
+        for i in range(inicio, fin):
+            valor, terminada = self.jugar_prueba(candidata, i)
+            if terminada:
+                terminadas += 1
+                suma += valor
+                suma_cuadrados += valor * valor
+            else:
+                truncadas += 1
+                suma_truncadas += valor
+        return candidata, terminadas, suma, suma_cuadrados, truncadas, suma_truncadas
+
+    def jugar_prueba(self, candidata, i):
+        """Devuelve (valor, terminada): terminada es False si la prueba se cortó."""
+        tablero = self.__tablero__
+        tablero.cargar_posicion(*self.__posicion__)
+        color = self.__color__
+        for origen, destino, _ in self.__jugadas__[candidata]:
+            tablero.aplicar(color, origen, destino)
+        if tablero.hay_ganador(color):
+            return valor_final(tablero, color), True
+
+        semilla = self.__semilla__ * _PASO_SEMILLA + i
+        rng = random.Random(semilla)
+        politica = self.__politica__
+        politica.sembrar(semilla)
+        ordenes = self.__ordenes__
+        turno = rival(color)
+        for k in range(self.__limite__):
+            if k < len(ordenes):
+                a, b = ordenes[k][(i // 36 ** k) % 36]
+            else:
+                a, b = rng.choices(_CARAS, k=2)
+            dados = [a] * 4 if a == b else [a, b]
+            jugada = politica.elegir(tablero, turno, dados, generar_jugadas(tablero, turno, dados))
+            for origen, destino, _ in jugada:
+                tablero.aplicar(turno, origen, destino)
+            if tablero.hay_ganador(turno):
+                valor = valor_final(tablero, turno)
+                return (valor if turno == color else -valor), True
+            turno = rival(turno)
+
+        valor = self.__evaluador__(tablero, turno)
+        return (valor if turno == color else -valor), False
+
+
+# --- Trabajo en procesos ---
+
+_JUGADOR = {}
+
+
+def _iniciar_proceso(*argumentos):
+    _JUGADOR['actual'] = _Jugador(*argumentos)
+
+
+def _jugar_tarea(tarea):
+    return _JUGADOR['actual'].jugar_rango(*tarea)
+
+
+def _repartir(candidata, inicio, fin, partes):
+    """Divide [inicio, fin) en 'partes' tareas contiguas."""
+    paso = max(1, math.ceil((fin - inicio) / partes))
+    return [(candidata, a, min(a + paso, fin)) for a in range(inicio, fin, paso)]
+
+
+def rollout(tablero: Tablero, color: str, dados=None, jugadas=None, pruebas: int = 1296,
+            politica='golosa', evaluador=evaluar_estatico, truncamiento: Optional[int] = None,
+            max_turnos: int = 200, rotar: int = 2, tamano_ronda: int = 144,
+            podar: bool = True, z: float = 1.96, procesos: int = 1, semilla: int = 0):
+    """
+    Estima la equidad de cada jugada candidata para 'color'.
+    :param dados: dados del turno; si no se indican 'jugadas', se generan las legales.
+    :param jugadas: lista de jugadas candidatas.
+    :param pruebas: pruebas máximas por candidata.
+    :param politica: política de las pruebas: nombre o (nombre, {opciones}).
+    :param evaluador: función (tablero, color) -> equidad para las pruebas truncadas
+                      (debe poder enviarse a otros procesos).
+    :param truncamiento: turnos jugados antes de cortar la prueba (None = hasta el final).
+    :param max_turnos: tope de turnos de cada prueba (al llegar, la prueba se corta).
+    :param rotar: cantidad de tiradas iniciales rotadas entre las 36 combinaciones.
+    :param tamano_ronda: pruebas por candidata entre controles de poda.
+    :param podar: descarta candidatas cuyo intervalo queda por debajo del de la mejor.
+    :param z: ancho de los intervalos de confianza (1.96 = 95%).
+    :param procesos: cantidad de procesos (1 = en el proceso actual).
+    :return: lista de ResultadoRollout ordenada de mejor a peor media de las
+             pruebas terminadas; las candidatas sin ninguna prueba terminada
+             van al final, ordenadas por media_truncadas.
+    """
+    if jugadas is None:
+        if dados is None:
+            raise ValueError("Se necesitan los dados o la lista de jugadas.")
+        jugadas = generar_jugadas(tablero, color, dados)
+    jugadas = [tuple(j) for j in jugadas]
+    if not jugadas:
+        raise ValueError("No hay jugadas candidatas.")
+    if pruebas < 1 or tamano_ronda < 1:
+        raise ValueError("La cantidad de pruebas debe ser positiva.")
+    if procesos < 1:
+        raise ValueError("Se necesita al menos un proceso.")
+
+    argumentos = (
+        tablero.obtener_conteos(),
+        (tablero.obtener_fichas_barra('B'), tablero.obtener_fichas_barra('N')),
+        (tablero.obtener_fichas_fuera('B'), tablero.obtener_fichas_fuera('N')),
+        color, jugadas, especificacion_politica(politica), evaluador,
+        semilla, truncamiento, max_turnos, rotar,
+    )
+    acumuladores = [_Acumulador() for _ in jugadas]
+
+    pool = None
+    if procesos > 1:
+        pool = multiprocessing.Pool(procesos, initializer=_iniciar_proceso, initargs=argumentos)
+    if pool is None:
+        jugador = _Jugador(*argumentos)
+    try:
+        hechas = 0
+        while hechas < pruebas:
+            fin = min(hechas + tamano_ronda, pruebas)
+            activas = [k for k, acumulador in enumerate(acumuladores) if not acumulador.podada]
+            if pool is None:
+                parciales = [jugador.jugar_rango(k, hechas, fin) for k in activas]
+            else:
+                tareas = [t for k in activas for t in _repartir(k, hechas, fin, procesos)]
+                parciales = pool.map(_jugar_tarea, tareas)
+            for k, *parcial in parciales:
+                acumuladores[k].agregar(*parcial)
+            hechas = fin
+            if podar and hechas < pruebas and len(activas) > 1:
+                _podar(acumuladores, activas, z)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    resultados = [
+        ResultadoRollout(jugada, a.pruebas, a.media(), a.desviacion(), a.podada,
+                         a.truncadas, a.media_truncadas())
+        for jugada, a in zip(jugadas, acumuladores)
+    ]
+    resultados.sort(key=lambda r: (r.pruebas > 0, r.media if r.pruebas else r.media_truncadas),
+                    reverse=True)
+    return resultados
+
+
+def _podar(acumuladores, activas, z):
+    """
+    Marca como podadas las candidatas claramente peores que la mejor. Sólo se
+    comparan candidatas con al menos dos pruebas terminadas.
+    """
+    medibles = [k for k in activas if acumuladores[k].pruebas > 1]
+    if len(medibles) < 2:
+        return
+    mejor = max(medibles, key=lambda k: acumuladores[k].media())
+    piso = acumuladores[mejor].media() - z * acumuladores[mejor].error_estandar()
+    for k in medibles:
+        acumulador = acumuladores[k]
+        if k != mejor and acumulador.media() + z * acumulador.error_estandar() < piso:
+            acumulador.podada = True
+
+
+def rollout_juego(juego, jugadas=None, **opciones):
+    """Rollout de las jugadas del jugador actual de un Game (a mitad de turno)."""
+    color = 'B' if juego.mostrar_jugador_actual().obtener_color() == 'blanco' else 'N'
+    if jugadas is None:
+        jugadas = juego.generar_jugadas_legales()
+    return rollout(juego.obtener_tablero(), color, juego.obtener_movimientos_disponibles(),
+                   jugadas, **opciones)
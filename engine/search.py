@@ -0,0 +1,447 @@
+"""
+Motor de búsqueda expectiminimax para Backgammon.
+
+Alterna nodos MAX (el jugador elige una jugada para los dados tirados) y nodos
+de AZAR (las 21 tiradas distintas, ponderadas por probabilidad). Los nodos de
+azar se podan con Star1 (cotas a partir de los valores ya calculados) y Star2
+(sondeo previo de la primera jugada de cada tirada). Las jugadas se ordenan con
+el evaluador estático para que los sondeos y la poda sean efectivos, y los
+resultados se guardan en una tabla de transposición acotada (engine.transposition)
+que también hace de caché de evaluaciones. Si se indica una tabla de finales de
+dos lados (engine.bearoff_doble), las posiciones con ambos colores en casa se
+responden desde la tabla sin seguir buscando. Las carreras sin contacto se
+evalúan directamente con evaluar_carrera, y con un libro de aperturas
+(engine.opening) las primeras tiradas se responden sin buscar.
+Los valores son negamax: siempre desde el punto de vista de quien mueve.
+"""
+import time
+from typing import Optional
+from core.board import Tablero
+from core.moves import generar_jugadas
+from engine.evaluation import (
+    evaluar_estatico, evaluar_carrera, valor_final, rival, EQUIDAD_MIN, EQUIDAD_MAX,
+)
+from engine.transposition import TablaTransposicion, EXACTA, valor_utilizable, tipo_de_valor
+
+# Las 21 tiradas distintas con su probabilidad (dobles 1/36, resto 2/36)
+TIRADAS = tuple(
+    ((a, b), (1 if a == b else 2) / 36)
+    for a in range(1, 7) for b in range(a, 7)
+)
+
+# Cada cuántos nodos se consulta el reloj
+_NODOS_ENTRE_CONTROLES = 256
+
+
+def dados_de_tirada(tirada):
+    """Convierte una tirada (a, b) en la lista de dados a jugar."""
+    a, b = tirada
+    return [a] * 4 if a == b else [a, b]
+
+
+def _color_actual(juego) -> str:
+    """Color ('B' o 'N') del jugador que tiene el turno en un Game."""
+    return 'B' if juego.mostrar_jugador_actual().obtener_color() == 'blanco' else 'N'
+
+
+class _TiempoAgotado(Exception):
+    """Se lanza internamente cuando se agota el presupuesto de tiempo."""
+
+
+class Estadisticas:
+    """
+    Contadores de una búsqueda: nodos visitados, podas en nodos de azar
+    y tiempo empleado.
+    """
+
+    def __init__(self):
+        self.nodos = 0
+        self.nodos_azar = 0
+        self.evaluaciones = 0
+        self.cortes_star1 = 0
+        self.cortes_star2 = 0
+        self.sondeos = 0
+        self.cortes_tabla = 0
+        self.consultas_finales = 0
+        self.aciertos_libro = 0
+        self.carreras = 0
+        self.segundos = 0.0
+        self.tiempo_agotado = False
+
+    def nodos_por_segundo(self) -> float:
+        """Devuelve la velocidad de la búsqueda (0 si no se midió tiempo)."""
+        return self.nodos / self.segundos if self.segundos > 0 else 0.0
+
+    def como_dict(self) -> dict:
+        """Devuelve los contadores como diccionario (útil para logs)."""
+        return {
+            'nodos': self.nodos,
+            'nodos_azar': self.nodos_azar,
+            'evaluaciones': self.evaluaciones,
+            'cortes_star1': self.cortes_star1,
+            'cortes_star2': self.cortes_star2,
+            'sondeos': self.sondeos,
+            'cortes_tabla': self.cortes_tabla,
+            'consultas_finales': self.consultas_finales,
+            'aciertos_libro': self.aciertos_libro,
+            'carreras': self.carreras,
+            'segundos': self.segundos,
+            'nodos_por_segundo': self.nodos_por_segundo(),
+            'tiempo_agotado': self.tiempo_agotado,
+        }
+
+
+class Buscador:
+    """
+    Búsqueda expectiminimax con poda Star1/Star2 en nodos de azar.
+
+    :param profundidad: jugadas (plies) a mirar hacia adelante; 1 = sólo las
+                        jugadas propias evaluadas estáticamente.
+    :param evaluador: función (tablero, color) -> equidad para las hojas.
+    :param tiempo_limite: segundos máximos por búsqueda (None = sin límite).
+    :param star1: habilita la poda Star1.
+    :param star2: habilita el sondeo Star2 (requiere star1).
+    :param capacidad_tabla: entradas máximas de la tabla de transposición
+                            (0 la deshabilita). La tabla se conserva entre
+                            búsquedas del mismo Buscador.
+    :param politica_tabla: 'lru' o 'profundidad'.
+    :param finales: TablaFinalesDoble opcional para responder los finales exactos.
+    :param libro: LibroAperturas opcional que se consulta en buscar antes de buscar.
+    :param carreras: sin contacto, evaluar con evaluar_carrera en vez de seguir
+                     buscando o de usar el evaluador.
+    """
+
+    def __init__(self, profundidad: int = 2, evaluador=evaluar_estatico,
+                 tiempo_limite: Optional[float] = None, star1: bool = True, star2: bool = True,
+                 capacidad_tabla: int = 1 << 16, politica_tabla: str = 'lru', finales=None,
+                 libro=None, carreras: bool = True):
+        if profundidad < 1:
+            raise ValueError("La profundidad debe ser al menos 1.")
+        self.__profundidad__ = profundidad
+        self.__evaluador__ = evaluador
+        self.__tiempo_limite__ = tiempo_limite
+        self.__star1__ = star1
+        self.__star2__ = star1 and star2
+        self.__tablero__: Optional[Tablero] = None
+        self.__estadisticas__ = Estadisticas()
+        self.__orden__ = {}
+        self.__limite__ = None
+        self.__tabla__ = (TablaTransposicion(capacidad_tabla, politica_tabla)
+                          if capacidad_tabla else None)
+        self.__finales__ = finales
+        self.__libro__ = libro
+        self.__carreras__ = carreras
+
+    def obtener_estadisticas(self) -> Estadisticas:
+        """Devuelve las estadísticas de la última búsqueda."""
+        return self.__estadisticas__
+
+    def obtener_tabla(self) -> Optional[TablaTransposicion]:
+        """Devuelve la tabla de transposición (None si está deshabilitada)."""
+        return self.__tabla__
+
+    # --- API pública ---
+
+    def buscar(self, tablero: Tablero, color: str, dados, profundidad: Optional[int] = None):
+        """
+        Busca la mejor jugada para 'color' con los dados dados.
+        Si la posición y la tirada están en el libro de aperturas, devuelve la
+        jugada del libro sin buscar. Si se agota el tiempo, devuelve la mejor
+        jugada entre las ya evaluadas. El tablero queda exactamente como estaba.
+        :return: tupla (jugada, valor).
+        """
+        if self.__libro__ is not None:
+            entrada = self.__libro__.consultar(tablero, color, dados)
+            if entrada is not None:
+                self.__estadisticas__ = Estadisticas()
+                self.__estadisticas__.aciertos_libro = 1
+                return entrada.jugada, entrada.equidad
+        resultados = self.evaluar_jugadas(tablero, color, dados, profundidad, exactas=False)
+        return resultados[0]
+
+    def evaluar_jugadas(self, tablero: Tablero, color: str, dados,
+                        profundidad: Optional[int] = None, exactas: bool = True):
+        """
+        Evalúa cada jugada legal de la raíz.
+        :param exactas: si es False, cada jugada se busca con la ventana acotada
+                        por la mejor encontrada, y los valores de las jugadas
+                        peores son sólo cotas superiores (más rápido).
+        :return: lista de (jugada, valor) ordenada de mejor a peor; si se agota
+                 el tiempo sólo incluye las jugadas evaluadas (al menos una).
+        """
+        profundidad = profundidad or self.__profundidad__
+        self.__estadisticas__ = Estadisticas()
+        inicio = time.perf_counter()
+        limite = inicio + self.__tiempo_limite__ if self.__tiempo_limite__ else None
+        try:
+            resultados, _ = self._evaluar_raiz(tablero, color, dados, profundidad, exactas, limite)
+        finally:
+            self.__estadisticas__.segundos = time.perf_counter() - inicio
+        return resultados
+
+    def profundizar(self, tablero: Tablero, color: str, dados,
+                    tiempo_limite: Optional[float] = None,
+                    profundidad_maxima: Optional[int] = None):
+        """
+        Profundización iterativa: evalúa todas las jugadas a profundidad 1, 2, ...
+        hasta profundidad_maxima o hasta agotar el tiempo. El plazo se controla
+        antes de empezar cada iteración y dentro de la búsqueda, así que nunca
+        se excede; una iteración cortada se descarta y se devuelve la última
+        completa. Si ni la primera llega a completarse, las jugadas que faltan
+        se valoran con el evaluador estático y la profundidad alcanzada es 0.
+        La tabla de transposición se conserva entre iteraciones.
+        :param tiempo_limite: segundos disponibles (None = el del Buscador).
+        :param profundidad_maxima: por defecto, la profundidad del Buscador.
+        :return: tupla (lista de (jugada, valor) exactos ordenada de mejor a
+                 peor, profundidad alcanzada).
+        """
+        profundidad_maxima = profundidad_maxima or self.__profundidad__
+        if tiempo_limite is None:
+            tiempo_limite = self.__tiempo_limite__
+        self.__estadisticas__ = Estadisticas()
+        inicio = time.perf_counter()
+        limite = inicio + tiempo_limite if tiempo_limite else None
+        resultados, alcanzada = [], 0
+        try:
+            for profundidad in range(1, profundidad_maxima + 1):
+                if resultados and limite is not None and time.perf_counter() >= limite:
+                    break
+                parciales, completa = self._evaluar_raiz(tablero, color, dados, profundidad,
+                                                         True, limite)
+                if not completa:
+                    if not resultados:
+                        resultados = self._completar_estaticas(color, dados, parciales)
+                    break
+                resultados, alcanzada = parciales, profundidad
+        finally:
+            self.__estadisticas__.segundos = time.perf_counter() - inicio
+        self.__estadisticas__.tiempo_agotado = alcanzada < profundidad_maxima
+        return resultados, alcanzada
+
+    def buscar_en_juego(self, juego, profundidad: Optional[int] = None):
+        """Busca la mejor jugada para el jugador actual de un Game."""
+        return self.buscar(juego.obtener_tablero(), _color_actual(juego),
+                           juego.obtener_movimientos_disponibles(), profundidad)
+
+    def profundizar_en_juego(self, juego, tiempo_limite: Optional[float] = None,
+                             profundidad_maxima: Optional[int] = None):
+        """Profundización iterativa para el jugador actual de un Game (ver profundizar)."""
+        return self.profundizar(juego.obtener_tablero(), _color_actual(juego),
+                                juego.obtener_movimientos_disponibles(),
+                                tiempo_limite, profundidad_maxima)
+
+    # --- Nodos internos ---
+
+    def _evaluar_raiz(self, tablero, color, dados, profundidad, exactas, limite):
+        """
+        Evalúa las jugadas de la raíz hasta el instante 'limite' (None = sin límite).
+        :return: tupla (lista de (jugada, valor) ordenada de mejor a peor,
+                 True si se evaluaron todas las jugadas).
+        """
+        self.__tablero__ = tablero
+        self.__orden__ = {}
+        self.__limite__ = limite
+
+        jugadas = self._ordenar(color, dados)
+        resultados = []
+        completa = True
+        alfa = EQUIDAD_MIN
+        try:
+            for jugada in jugadas:
+                self._controlar_tiempo()
+                valor = self._valor_jugada(color, jugada, profundidad, alfa, EQUIDAD_MAX)
+                resultados.append((jugada, valor))
+                if not exactas and valor > alfa:
+                    alfa = valor
+        except _TiempoAgotado:
+            completa = False
+            self.__estadisticas__.tiempo_agotado = True
+            if not resultados:
+                # Sin tiempo ni para una jugada: usar el orden estático
+                resultados.append((jugadas[0], self._estatico_tras(color, jugadas[0])))
+        finally:
+            self.__orden__ = {}
+
+        resultados.sort(key=lambda r: r[1], reverse=True)
+        return resultados, completa
+
+    def _completar_estaticas(self, color, dados, parciales):
+        """
+        Completa una raíz cortada por el tiempo: las jugadas sin evaluar reciben
+        el valor del evaluador estático. Devuelve todas, de mejor a peor.
+        """
+        evaluadas = dict(parciales)
+        resultados = list(parciales)
+        for jugada in generar_jugadas(self.__tablero__, color, dados):
+            if jugada not in evaluadas:
+                resultados.append((jugada, self._estatico_tras(color, jugada)))
+        resultados.sort(key=lambda r: r[1], reverse=True)
+        return resultados
+
+    def _controlar_tiempo(self):
+        if self.__limite__ is not None and time.perf_counter() > self.__limite__:
+            raise _TiempoAgotado()
+
+    def _contar_nodo(self):
+        estadisticas = self.__estadisticas__
+        estadisticas.nodos += 1
+        if estadisticas.nodos % _NODOS_ENTRE_CONTROLES == 0:
+            self._controlar_tiempo()
+
+    def _evaluar(self, color):
+        self.__estadisticas__.evaluaciones += 1
+        return self.__evaluador__(self.__tablero__, color)
+
+    def _estatico_tras(self, color, jugada):
+        tablero = self.__tablero__
+        for origen, destino, _ in jugada:
+            tablero.aplicar(color, origen, destino)
+        try:
+            if tablero.hay_ganador(color):
+                return valor_final(tablero, color)
+            # El orden de jugadas siempre usa el evaluador estático barato
+            return -evaluar_estatico(tablero, rival(color))
+        finally:
+            for _ in jugada:
+                tablero.deshacer()
+
+    def _ordenar(self, color, dados):
+        """Jugadas legales ordenadas de mejor a peor según el evaluador estático."""
+        clave = (self.__tablero__.obtener_hash(color), tuple(dados))
+        jugadas = self.__orden__.get(clave)
+        if jugadas is None:
+            jugadas = generar_jugadas(self.__tablero__, color, dados)
+            if len(jugadas) > 1:
+                valores = {j: self._estatico_tras(color, j) for j in jugadas}
+                jugadas.sort(key=valores.__getitem__, reverse=True)
+            self.__orden__[clave] = jugadas
+        return jugadas
+
+    def _valor_jugada(self, color, jugada, profundidad, alfa, beta):
+        """Valor (para 'color') de aplicar una jugada y seguir buscando."""
+        tablero = self.__tablero__
+        for origen, destino, _ in jugada:
+            tablero.aplicar(color, origen, destino)
+        try:
+            if tablero.hay_ganador(color):
+                return valor_final(tablero, color)
+            return -self._azar(rival(color), profundidad - 1, -beta, -alfa)
+        finally:
+            for _ in jugada:
+                tablero.deshacer()
+
+    def _max(self, color, dados, profundidad, alfa, beta, solo_primera=False):
+        """Nodo MAX: mejor jugada para 'color' con dados fijos (fail-soft)."""
+        self._contar_nodo()
+        # Generar y ordenar las jugadas es lo más caro de un nodo: mirar el reloj antes
+        self._controlar_tiempo()
+        tabla = self.__tabla__
+        jugadas = self._ordenar(color, dados)
+        if tabla is not None:
+            clave = (self.__tablero__.obtener_hash(color), tuple(dados))
+            entrada = tabla.buscar(clave)
+            valor = valor_utilizable(entrada, profundidad, alfa, beta)
+            if valor is not None:
+                self.__estadisticas__.cortes_tabla += 1
+                return valor
+            if entrada is not None and entrada.jugada is not None and entrada.jugada != jugadas[0]:
+                # Probar primero la mejor jugada de una búsqueda anterior
+                jugadas = [entrada.jugada] + [j for j in jugadas if j != entrada.jugada]
+
+        alfa_inicial = alfa
+        mejor = EQUIDAD_MIN
+        mejor_jugada = None
+        for jugada in jugadas:
+            valor = self._valor_jugada(color, jugada, profundidad, alfa, beta)
+            if valor > mejor:
+                mejor = valor
+                mejor_jugada = jugada
+                if valor > alfa:
+                    alfa = valor
+                if valor >= beta:
+                    break
+            if solo_primera:
+                break
+
+        # Un sondeo de una sola jugada no se guarda: pisaría resultados más precisos
+        if tabla is not None and not solo_primera:
+            tabla.guardar(clave, profundidad, mejor, tipo_de_valor(mejor, alfa_inicial, beta),
+                          mejor_jugada)
+        return mejor
+
+    def _azar(self, color, profundidad, alfa, beta):
+        """
+        Nodo de AZAR antes de la tirada de 'color'. Con Star2 primero sondea la
+        primera jugada de cada tirada para obtener cotas inferiores; con Star1
+        poda cuando las cotas del promedio quedan fuera de la ventana.
+        """
+        self._contar_nodo()
+        if self.__finales__ is not None:
+            probabilidad = self.__finales__.consultar(self.__tablero__, color)
+            if probabilidad is not None:
+                # Sin gammons posibles en la tabla: equidad = 2p - 1
+                self.__estadisticas__.consultas_finales += 1
+                return 2.0 * probabilidad - 1.0
+        if self.__carreras__ and not self.__tablero__.hay_contacto():
+            self.__estadisticas__.carreras += 1
+            return evaluar_carrera(self.__tablero__, color)
+        tabla = self.__tabla__
+        if tabla is not None:
+            clave = self.__tablero__.obtener_hash(color)
+            valor = valor_utilizable(tabla.buscar(clave), profundidad, alfa, beta)
+            if valor is not None:
+                self.__estadisticas__.cortes_tabla += 1
+                return valor
+        if profundidad == 0:
+            valor = self._evaluar(color)
+            if tabla is not None:
+                tabla.guardar(clave, 0, valor, EXACTA)
+            return valor
+        valor = self._azar_expandir(color, profundidad, alfa, beta)
+        if tabla is not None:
+            tabla.guardar(clave, profundidad, valor, tipo_de_valor(valor, alfa, beta))
+        return valor
+
+    def _azar_expandir(self, color, profundidad, alfa, beta):
+        """Promedia las 21 tiradas aplicando Star2 y Star1."""
+        self.__estadisticas__.nodos_azar += 1
+        minimo, maximo = EQUIDAD_MIN, EQUIDAD_MAX
+        cotas = [minimo] * len(TIRADAS)
+
+        if self.__star2__:
+            # Fase de sondeo: el valor de la primera jugada es cota inferior del nodo MAX
+            acumulado = 0.0
+            resto = 1.0
+            for k, (tirada, p) in enumerate(TIRADAS):
+                resto -= p
+                umbral = (beta - acumulado - minimo * resto) / p
+                self.__estadisticas__.sondeos += 1
+                cotas[k] = self._max(color, dados_de_tirada(tirada), profundidad,
+                                     minimo, min(umbral, maximo), solo_primera=True)
+                acumulado += p * cotas[k]
+                if cotas[k] >= umbral:
+                    self.__estadisticas__.cortes_star2 += 1
+                    return acumulado + minimo * resto
+
+        acumulado = 0.0
+        resto = 1.0
+        resto_inferior = sum(p * cotas[k] for k, (_, p) in enumerate(TIRADAS))
+        for k, (tirada, p) in enumerate(TIRADAS):
+            resto -= p
+            resto_inferior -= p * cotas[k]
+            if self.__star1__:
+                a = (alfa - acumulado - maximo * resto) / p
+                b = (beta - acumulado - resto_inferior) / p
+                valor = self._max(color, dados_de_tirada(tirada), profundidad,
+                                  max(a, minimo), min(b, maximo))
+                acumulado += p * valor
+                if valor <= a:
+                    self.__estadisticas__.cortes_star1 += 1
+                    return acumulado + maximo * resto
+                if valor >= b:
+                    self.__estadisticas__.cortes_star1 += 1
+                    return acumulado + resto_inferior
+            else:
+                acumulado += p * self._max(color, dados_de_tirada(tirada), profundidad,
+                                           minimo, maximo)
+        return acumulado
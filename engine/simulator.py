@@ -0,0 +1,246 @@
+"""
+Simulador de partidas sin interfaz, en lote y en varios procesos.
+
+Juega N partidas completas entre dos políticas (engine.policies) usando Game,
+igual que la CLI pero sin entrada de usuario. Cada partida tiene una semilla
+propia derivada de la semilla base y de su índice, así que el resultado de
+cada partida no depende de cuántos procesos se usen ni de qué proceso la juegue.
+Los dados de cada partida usan un Dado con esa semilla y tiradas en lote.
+
+Uso:
+    python -m engine.simulator --partidas 10000 --procesos 4 --blancas golosa --negras aleatoria
+"""
+import argparse
+import json
+import multiprocessing
+import time
+from typing import NamedTuple, Optional
+from core.game import Game
+from core.dice import Dado
+from engine.evaluation import valor_final
+from engine.policies import crear_politica, especificacion_politica
+
+TIPOS_VICTORIA = {1: 'simple', 2: 'gammon', 3: 'backgammon'}
+MOTIVOS_AUTO_PASE = ('barra-bloqueada', 'sin-movimientos')
+
+# Tiradas generadas por bloque en los dados de cada partida
+_LOTE_DADOS = 256
+
+# Multiplicador para derivar semillas de partida independientes del reparto
+_PASO_SEMILLA = 1_000_003
+
+
+class ResultadoPartida(NamedTuple):
+    """Resultado de una partida simulada."""
+    indice: int
+    semilla: int
+    ganador: Optional[str]        # 'B', 'N' o None si se alcanzó el tope de turnos
+    puntos: int                   # 1 simple, 2 gammon, 3 backgammon (0 sin ganador)
+    turnos: int
+    auto_pases_barra: int
+    auto_pases_sin_movimientos: int
+
+    def tipo_victoria(self) -> Optional[str]:
+        """Tipo de victoria ('simple', 'gammon', 'backgammon') o None sin ganador."""
+        return TIPOS_VICTORIA.get(self.puntos)
+
+    def como_dict(self) -> dict:
+        """Resultado como dict serializable a JSON (con el tipo de victoria)."""
+        datos = self._asdict()
+        datos['tipo_victoria'] = self.tipo_victoria()
+        return datos
+
+
+def semilla_partida(semilla: int, indice: int) -> int:
+    """Semilla determinista de la partida 'indice' de una simulación."""
+    return semilla * _PASO_SEMILLA + indice
+
+
+def jugar_partida(politica_blancas, politica_negras, semilla: int, indice: int = 0,
+                  max_turnos: int = 1000, posicion: Optional[str] = None) -> ResultadoPartida:
+    """
+    Juega una partida completa con Game.
+    :param politica_blancas: objeto Politica para 'B'.
+    :param politica_negras: objeto Politica para 'N'.
+    :param semilla: semilla de la partida (dados y azar de las políticas).
+    :param max_turnos: tope de turnos; si se alcanza, la partida no tiene ganador.
+    :param posicion: ID de posición inicial opcional (ver core.position_id).
+    """
+    politica_blancas.sembrar(semilla)
+    politica_negras.sembrar(semilla + 1)
+    politicas = {'B': politica_blancas, 'N': politica_negras}
+
+    juego = Game("Blancas", "Negras", Dado(semilla=semilla, lote=_LOTE_DADOS))
+    if posicion:
+        juego.cargar_id_posicion(posicion)
+    tablero = juego.obtener_tablero()
+    auto_pases = {motivo: 0 for motivo in MOTIVOS_AUTO_PASE}
+    ganador = None
+    turnos = 0
+
+    while turnos < max_turnos:
+        turnos += 1
+        color = 'B' if juego.mostrar_jugador_actual().obtener_color() == 'blanco' else 'N'
+        if not juego.obtener_movimientos_disponibles():
+            juego.tirar_dados()
+            motivo = juego.consumir_motivo_auto_pase()
+            if motivo:
+                auto_pases[motivo] += 1
+                continue
+        dados = list(juego.obtener_movimientos_disponibles())
+        jugadas = juego.generar_jugadas_legales()
+        juego.aplicar_jugada(politicas[color].elegir(tablero, color, dados, jugadas))
+        if juego.verificar_victoria():
+            ganador = color
+            break
+        juego.cambiar_turno()
+
+    puntos = int(valor_final(tablero, ganador)) if ganador else 0
+    return ResultadoPartida(indice, semilla, ganador, puntos, turnos,
+                            auto_pases['barra-bloqueada'], auto_pases['sin-movimientos'])
+
+
+# --- Trabajo en procesos ---
+
+_CONFIGURACION = {}
+
+
+def _iniciar_proceso(blancas, negras, semilla, max_turnos, posicion):
+    """Construye las políticas una sola vez por proceso."""
+    nombre_b, opciones_b = blancas
+    nombre_n, opciones_n = negras
+    _CONFIGURACION.update(
+        blancas=crear_politica(nombre_b, **opciones_b),
+        negras=crear_politica(nombre_n, **opciones_n),
+        semilla=semilla, max_turnos=max_turnos, posicion=posicion,
+    )
+
+
+def _jugar_indice(indice: int) -> ResultadoPartida:
+    config = _CONFIGURACION
+    return jugar_partida(config['blancas'], config['negras'],
+                         semilla_partida(config['semilla'], indice), indice,
+                         config['max_turnos'], config['posicion'])
+
+
+def simular(partidas: int, blancas='aleatoria', negras='aleatoria', procesos: int = 1,
+            semilla: int = 0, max_turnos: int = 1000, posicion: Optional[str] = None,
+            tamano_lote: Optional[int] = None):
+    """
+    Juega 'partidas' partidas y devuelve los resultados a medida que terminan
+    (generador; con varios procesos el orden no es el de los índices).
+    :param blancas: política de 'B': nombre o (nombre, {opciones}).
+    :param negras: política de 'N': nombre o (nombre, {opciones}).
+    :param procesos: cantidad de procesos (1 = en el proceso actual).
+    :param tamano_lote: partidas enviadas a cada proceso por vez.
+    """
+    if partidas < 0:
+        raise ValueError("La cantidad de partidas no puede ser negativa.")
+    if procesos < 1:
+        raise ValueError("Se necesita al menos un proceso.")
+    argumentos = (especificacion_politica(blancas), especificacion_politica(negras),
+                  semilla, max_turnos, posicion)
+
+    if procesos == 1:
+        _iniciar_proceso(*argumentos)
+        for indice in range(partidas):
+            yield _jugar_indice(indice)
+        return
+
+    # Lotes grandes amortizan la comunicación entre procesos
+    tamano_lote = tamano_lote or max(1, min(256, partidas // (procesos * 8)))
+    with multiprocessing.Pool(procesos, initializer=_iniciar_proceso, initargs=argumentos) as pool:
+        yield from pool.imap_unordered(_jugar_indice, range(partidas), chunksize=tamano_lote)
+
+
+class Resumen:
+    """Acumula resultados de partidas y mide la velocidad de la simulación."""
+
+    def __init__(self):
+        self.partidas = 0
+        self.victorias = {'B': 0, 'N': 0}
+        self.puntos = {'B': 0, 'N': 0}
+        self.tipos = {tipo: 0 for tipo in TIPOS_VICTORIA.values()}
+        self.sin_ganador = 0
+        self.turnos = 0
+        self.auto_pases_barra = 0
+        self.auto_pases_sin_movimientos = 0
+        self.__inicio__ = time.perf_counter()
+        self.segundos = 0.0
+
+    def agregar(self, resultado: ResultadoPartida):
+        """Suma el resultado de una partida a los totales."""
+        self.partidas += 1
+        self.turnos += resultado.turnos
+        self.auto_pases_barra += resultado.auto_pases_barra
+        self.auto_pases_sin_movimientos += resultado.auto_pases_sin_movimientos
+        if resultado.ganador is None:
+            self.sin_ganador += 1
+        else:
+            self.victorias[resultado.ganador] += 1
+            self.puntos[resultado.ganador] += resultado.puntos
+            self.tipos[resultado.tipo_victoria()] += 1
+        self.segundos = time.perf_counter() - self.__inicio__
+
+    def partidas_por_segundo(self) -> float:
+        """Velocidad de la simulación (0 si todavía no se midió tiempo)."""
+        return self.partidas / self.segundos if self.segundos > 0 else 0.0
+
+    def como_dict(self) -> dict:
+        """Totales como dict serializable a JSON."""
+        return {
+            'partidas': self.partidas,
+            'victorias': dict(self.victorias),
+            'puntos': dict(self.puntos),
+            'tipos': dict(self.tipos),
+            'sin_ganador': self.sin_ganador,
+            'turnos_promedio': self.turnos / self.partidas if self.partidas else 0.0,
+            'auto_pases_barra': self.auto_pases_barra,
+            'auto_pases_sin_movimientos': self.auto_pases_sin_movimientos,
+            'segundos': self.segundos,
+            'partidas_por_segundo': self.partidas_por_segundo(),
+        }
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        description="Simulador de partidas de Backgammon sin interfaz.")
+    parser.add_argument('--partidas', type=int, default=100)
+    parser.add_argument('--procesos', type=int, default=multiprocessing.cpu_count())
+    parser.add_argument('--blancas', default='golosa')
+    parser.add_argument('--negras', default='aleatoria')
+    parser.add_argument('--profundidad', type=int, default=1,
+                        help="profundidad de la política 'busqueda'")
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--max-turnos', type=int, default=1000)
+    parser.add_argument('--posicion', default=None, help="ID de posición inicial")
+    parser.add_argument('--salida', default=None, help="archivo JSONL con un resultado por partida")
+    args = parser.parse_args(argv)
+
+    def especificacion(nombre):
+        return (nombre, {'profundidad': args.profundidad}) if nombre == 'busqueda' else nombre
+
+    resumen = Resumen()
+    salida = open(args.salida, 'w', encoding='utf-8') if args.salida else None
+    try:
+        resultados = simular(args.partidas, especificacion(args.blancas),
+                             especificacion(args.negras), args.procesos, args.semilla,
+                             args.max_turnos, args.posicion)
+        for resultado in resultados:
+            resumen.agregar(resultado)
+            if salida:
+                salida.write(json.dumps(resultado.como_dict()) + '\n')
+    finally:
+        if salida:
+            salida.close()
+    if resumen.partidas and resumen.sin_ganador == resumen.partidas:
+        # Sin ninguna partida terminada las estadísticas no dicen nada
+        parser.exit(1, f"Ninguna de las {resumen.partidas} partidas terminó antes de "
+                       f"{args.max_turnos} turnos: revisar la posición inicial "
+                       f"o subir --max-turnos.\n")
+    print(json.dumps(resumen.como_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+"""
+Entrenamiento por autojuego con TD(λ) en varios procesos.
+
+- Los trabajadores juegan partidas contra sí mismos con Game y los pesos
+  vigentes (eligiendo con la red, en lote) y devuelven la trayectoria
+  compacta: los conteos int8 de cada posición antes de tirar, el color que
+  mueve y el resultado final (o None si la partida se cortó por el tope de
+  turnos). El registro informa cuántas partidas terminaron ('terminadas').
+- El aprendiz codifica las trayectorias, calcula los objetivos λ-return
+  (vista hacia adelante de TD(λ), con la perspectiva invertida entre turnos)
+  y aplica un paso de gradiente por cada lote de partidas.
+- Los pesos nuevos se publican en un bloque de memoria compartida
+  (multiprocessing.shared_memory) con un número de versión; cada trabajador
+  copia los pesos al empezar una partida si la versión cambió.
+- Se guardan checkpoints periódicos (.npz) y un registro JSONL con partidas
+  por segundo y la curva de pérdida.
+
+Uso:
+    python -m engine.training --partidas 100000 --procesos 8 --directorio entrenamiento
+"""
+import argparse
+import json
+import multiprocessing
+import multiprocessing.util
+import os
+import random
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+import numpy as np
+from core.dice import Dado
+from core.game import Game
+from engine.evaluation import valor_final
+from engine.neural import RedNeuronal, codificar_conteos
+from engine.simulator import semilla_partida
+
+class Trayectoria:
+    """Posiciones de una partida de autojuego (antes de cada tirada) y su resultado."""
+
+    def __init__(self, conteos, barra, fuera, turno_negro, resultado):
+        self.conteos = conteos            # (n, 24) int8
+        self.barra = barra                # (n, 2) int8
+        self.fuera = fuera                # (n, 2) int8
+        self.turno_negro = turno_negro    # (n,) bool
+        self.resultado = resultado        # (SALIDAS,) para la última posición, o None
+
+    def __len__(self):
+        return len(self.turno_negro)
+
+    def codificar(self) -> np.ndarray:
+        """Codifica todas las posiciones de la trayectoria (matriz (n, ENTRADAS))."""
+        return codificar_conteos(self.conteos, self.barra, self.fuera, self.turno_negro)
+
+
+def invertir(probabilidades: np.ndarray) -> np.ndarray:
+    """Cambia la perspectiva de las 5 salidas al otro jugador (funciona por filas)."""
+    p = np.asarray(probabilidades)
+    return np.stack([1.0 - p[..., 0], p[..., 3], p[..., 4], p[..., 1], p[..., 2]], axis=-1)
+
+
+def objetivos_lambda(predicciones: np.ndarray, resultado: Optional[np.ndarray], lam: float):
+    """
+    Objetivos λ-return de una trayectoria.
+    :param predicciones: salidas de la red para cada posición (n, SALIDAS).
+    :param resultado: resultado final desde la perspectiva de la última
+                      posición; si es None, la última posición sólo sirve de
+                      arranque (bootstrap) y no se entrena.
+    :return: tupla (objetivos, cantidad de posiciones a entrenar).
+    """
+    n = len(predicciones)
+    objetivos = np.empty_like(predicciones)
+    if resultado is not None:
+        objetivos[-1] = resultado
+        entrenables = n
+    else:
+        objetivos[-1] = predicciones[-1]
+        entrenables = n - 1
+    for t in range(n - 2, -1, -1):
+        objetivos[t] = invertir((1.0 - lam) * predicciones[t + 1] + lam * objetivos[t + 1])
+    return objetivos[:entrenables], entrenables
+
+
+def _vector_resultado(puntos: float) -> np.ndarray:
+    return np.array([1.0, puntos >= 2, puntos >= 3, 0.0, 0.0])
+
+
+def jugar_autojuego(red: RedNeuronal, semilla: int, max_turnos: int = 500,
+                    posicion: Optional[str] = None, exploracion: float = 0.0) -> Trayectoria:
+    """
+    Juega una partida de la red contra sí misma con Game, igual que el
+    simulador: tiradas, auto-pases, validación de jugadas y fin de partida
+    siguen las reglas del juego. Los dados y la exploración usan el mismo
+    generador, así que la semilla determina la partida.
+    """
+    rng = random.Random(semilla)
+    juego = Game("Blancas", "Negras", Dado(rng=rng))
+    if posicion:
+        juego.cargar_id_posicion(posicion, cargar_dados=False)
+    tablero = juego.obtener_tablero()
+    conteos = np.empty((max_turnos + 1, 24), dtype=np.int8)
+    barra = np.empty((max_turnos + 1, 2), dtype=np.int8)
+    fuera = np.empty((max_turnos + 1, 2), dtype=np.int8)
+    turno_negro = np.empty(max_turnos + 1, dtype=bool)
+    resultado = None
+
+    n = 0
+    while True:
+        color = 'B' if juego.mostrar_jugador_actual().obtener_color() == 'blanco' else 'N'
+        conteos[n] = tablero.vista_conteos()
+        barra[n] = tablero.obtener_barra()
+        fuera[n] = tablero.obtener_fuera()
+        turno_negro[n] = color == 'N'
+        n += 1
+        if n > max_turnos:
+            break
+        juego.tirar_dados()
+        if juego.consumir_motivo_auto_pase():
+            continue
+        jugadas = juego.generar_jugadas_legales()
+        if len(jugadas) == 1:
+            jugada = jugadas[0]
+        elif exploracion and rng.random() < exploracion:
+            jugada = rng.choice(jugadas)
+        else:
+            jugada = jugadas[int(red.evaluar_jugadas(tablero, color, jugadas).argmax())]
+        juego.aplicar_jugada(jugada)
+        if juego.verificar_victoria():
+            resultado = _vector_resultado(valor_final(tablero, color))
+            break
+        juego.cambiar_turno()
+    return Trayectoria(conteos[:n].copy(), barra[:n].copy(), fuera[:n].copy(),
+                       turno_negro[:n].copy(), resultado)
+
+
+# --- Pesos compartidos ---
+
+class PesosCompartidos:
+    """
+    Bloque de memoria compartida con [versión, parámetros...] en float64.
+    El aprendiz publica; los trabajadores copian si la versión cambió.
+    """
+
+    def __init__(self, cantidad: int, nombre: Optional[str] = None, bloqueo=None):
+        tamano = (cantidad + 1) * 8
+        self.__propio__ = nombre is None
+        self.__memoria__ = shared_memory.SharedMemory(name=nombre, create=self.__propio__,
+                                                      size=tamano)
+        self.__datos__ = np.ndarray((cantidad + 1,), dtype=np.float64, buffer=self.__memoria__.buf)
+        self.__bloqueo__ = bloqueo
+        if self.__propio__:
+            self.__datos__[0] = 0
+
+    def obtener_nombre(self) -> str:
+        """Nombre del bloque de memoria compartida (para abrirlo desde otro proceso)."""
+        return self.__memoria__.name
+
+    def version(self) -> int:
+        """Cantidad de veces que se publicaron pesos."""
+        return int(self.__datos__[0])
+
+    def publicar(self, red: RedNeuronal):
+        """Publica los pesos de la red e incrementa la versión."""
+        with self.__bloqueo__:
+            self.__datos__[1:] = red.obtener_parametros()
+            self.__datos__[0] += 1
+
+    def copiar_a(self, red: RedNeuronal) -> int:
+        """Copia los pesos publicados a la red y devuelve la versión copiada."""
+        with self.__bloqueo__:
+            red.fijar_parametros(self.__datos__[1:])
+            return int(self.__datos__[0])
+
+    def cerrar(self):
+        """Libera el bloque de memoria (y lo elimina si lo creó este objeto)."""
+        del self.__datos__
+        self.__memoria__.close()
+        if self.__propio__:
+            self.__memoria__.unlink()
+
+
+# --- Trabajadores ---
+
+_TRABAJADOR = {}
+
+
+def _iniciar_trabajador(nombre, bloqueo, ocultas, configuracion):
+    """
+    Prepara la red del trabajador y se conecta al bloque de pesos. El bloque
+    se cierra al terminar el proceso (Finalize corre cuando el trabajador sale
+    normalmente, después de pool.close()).
+    """
+    red = RedNeuronal(ocultas, semilla=None)
+    pesos = PesosCompartidos(red.cantidad_parametros(), nombre, bloqueo)
+    cierre = multiprocessing.util.Finalize(pesos, pesos.cerrar, exitpriority=10)
+    _TRABAJADOR.update(red=red, pesos=pesos, cierre=cierre, version=-1, **configuracion)
+
+
+def _jugar_en_trabajador(semilla):
+    datos = _TRABAJADOR
+    pesos = datos['pesos']
+    if pesos.version() != datos['version']:
+        datos['version'] = pesos.copiar_a(datos['red'])
+    return jugar_autojuego(datos['red'], semilla, datos['max_turnos'], datos['posicion'],
+                           datos['exploracion'])
+
+
+# --- Aprendiz ---
+
+class Entrenador:
+    """
+    Aprendiz TD(λ): consume trayectorias, actualiza la red y publica pesos.
+
+    :param red: red a entrenar (se modifica en el lugar).
+    :param alfa: tasa de aprendizaje.
+    :param lam: λ de TD(λ).
+    :param partidas_por_lote: partidas acumuladas antes de cada actualización.
+    """
+
+    def __init__(self, red: RedNeuronal, alfa: float = 0.1, lam: float = 0.7,
+                 partidas_por_lote: int = 16):
+        if not 0.0 <= lam <= 1.0:
+            raise ValueError("λ debe estar entre 0 y 1.")
+        if partidas_por_lote < 1:
+            raise ValueError("Se necesita al menos una partida por lote.")
+        self.__red__ = red
+        self.__alfa__ = alfa
+        self.__lam__ = lam
+        self.__partidas_por_lote__ = partidas_por_lote
+        self.__pendientes__ = []
+        self.partidas = 0
+        self.posiciones = 0
+        self.actualizaciones = 0
+        self.terminadas = 0
+        self.ultima_perdida = None
+
+    def obtener_red(self) -> RedNeuronal:
+        """Red que se está entrenando."""
+        return self.__red__
+
+    def agregar(self, trayectoria: Trayectoria) -> bool:
+        """Agrega una trayectoria; devuelve True si se aplicó una actualización."""
+        self.partidas += 1
+        self.posiciones += len(trayectoria)
+        self.terminadas += trayectoria.resultado is not None
+        self.__pendientes__.append(trayectoria)
+        if len(self.__pendientes__) < self.__partidas_por_lote__:
+            return False
+        self.actualizar()
+        return True
+
+    def actualizar(self) -> Optional[float]:
+        """Aplica un paso de TD(λ) con las trayectorias pendientes."""
+        pendientes, self.__pendientes__ = self.__pendientes__, []
+        entradas, objetivos = [], []
+        red = self.__red__
+        for trayectoria in pendientes:
+            x = trayectoria.codificar()
+            objetivo, entrenables = objetivos_lambda(red.probabilidades_lote(x),
+                                                     trayectoria.resultado, self.__lam__)
+            if entrenables:
+                entradas.append(x[:entrenables])
+                objetivos.append(objetivo)
+        if not entradas:
+            return None
+        self.ultima_perdida = red.entrenar_lote(np.concatenate(entradas), np.concatenate(objetivos),
+                                                self.__alfa__)
+        self.actualizaciones += 1
+        return self.ultima_perdida
+
+
+def entrenar(partidas: int, red: Optional[RedNeuronal] = None, procesos: int = 1, semilla: int = 0,
+             alfa: float = 0.1, lam: float = 0.7, partidas_por_lote: int = 16,
+             max_turnos: int = 500, posicion: Optional[str] = None, exploracion: float = 0.0,
+             directorio: Optional[str] = None, checkpoint_cada: int = 1000,
+             registrar_cada: int = 100, informar=None) -> RedNeuronal:
+    """
+    Entrena una red por autojuego.
+    :param procesos: procesos que juegan (1 = todo en el proceso actual).
+    :param directorio: carpeta para checkpoints (red_<partidas>.npz y red_ultima.npz)
+                       y para el registro registro.jsonl.
+    :param informar: función opcional que recibe cada entrada del registro (dict).
+    :return: la red entrenada.
+    """
+    if partidas < 0:
+        raise ValueError("La cantidad de partidas no puede ser negativa.")
+    if procesos < 1:
+        raise ValueError("Se necesita al menos un proceso.")
+    red = red or RedNeuronal(semilla=semilla)
+    entrenador = Entrenador(red, alfa, lam, partidas_por_lote)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+    registro = None
+    if directorio:
+        registro = open(os.path.join(directorio, 'registro.jsonl'), 'a', encoding='utf-8')
+    semillas = (semilla_partida(semilla, i) for i in range(partidas))
+    inicio = time.perf_counter()
+
+    def anotar():
+        segundos = time.perf_counter() - inicio
+        entrada = {
+            'partidas': entrenador.partidas,
+            'terminadas': entrenador.terminadas,
+            'posiciones': entrenador.posiciones,
+            'actualizaciones': entrenador.actualizaciones,
+            'perdida': entrenador.ultima_perdida,
+            'segundos': segundos,
+            'partidas_por_segundo': entrenador.partidas / segundos if segundos > 0 else 0.0,
+        }
+        if registro:
+            registro.write(json.dumps(entrada) + '\n')
+            registro.flush()
+        if informar:
+            informar(entrada)
+
+    def procesar(trayectorias, pesos=None):
+        for trayectoria in trayectorias:
+            if entrenador.agregar(trayectoria) and pesos is not None:
+                pesos.publicar(red)
+            if entrenador.partidas % registrar_cada == 0:
+                anotar()
+            if directorio and entrenador.partidas % checkpoint_cada == 0:
+                red.guardar(os.path.join(directorio, f'red_{entrenador.partidas}.npz'))
+
+    try:
+        if procesos == 1:
+            procesar(jugar_autojuego(red, s, max_turnos, posicion, exploracion) for s in semillas)
+        else:
+            bloqueo = multiprocessing.Lock()
+            pesos = PesosCompartidos(red.cantidad_parametros(), bloqueo=bloqueo)
+            try:
+                pesos.publicar(red)
+                configuracion = {'max_turnos': max_turnos, 'posicion': posicion,
+                                 'exploracion': exploracion}
+                argumentos = (pesos.obtener_nombre(), bloqueo, red.obtener_ocultas(), configuracion)
+                with multiprocessing.Pool(procesos, initializer=_iniciar_trabajador,
+                                          initargs=argumentos) as pool:
+                    procesar(pool.imap_unordered(_jugar_en_trabajador, semillas), pesos)
+                    # Terminar normalmente para que cada trabajador cierre su bloque
+                    pool.close()
+                    pool.join()
+            finally:
+                pesos.cerrar()
+        entrenador.actualizar()
+        anotar()
+        if directorio:
+            red.guardar(os.path.join(directorio, 'red_ultima.npz'))
+    finally:
+        if registro:
+            registro.close()
+    return red
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Entrenamiento TD(λ) por autojuego.")
+    parser.add_argument('--partidas', type=int, default=10000)
+    parser.add_argument('--procesos', type=int, default=multiprocessing.cpu_count())
+    parser.add_argument('--ocultas', type=int, default=80)
+    parser.add_argument('--alfa', type=float, default=0.1)
+    parser.add_argument('--lam', type=float, default=0.7)
+    parser.add_argument('--lote', type=int, default=16, help="partidas por actualización")
+    parser.add_argument('--max-turnos', type=int, default=500)
+    parser.add_argument('--posicion', default=None, help="ID de posición inicial")
+    parser.add_argument('--exploracion', type=float, default=0.0)
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--directorio', default='entrenamiento')
+    parser.add_argument('--desde', default=None, help="pesos .npz para continuar")
+    args = parser.parse_args(argv)
+
+    red = RedNeuronal.cargar(args.desde) if args.desde else RedNeuronal(args.ocultas, args.semilla)
+
+    def informar(entrada):
+        print(f"{entrada['partidas']} partidas ({entrada['terminadas']} terminadas)  "
+              f"pérdida={entrada['perdida']}  {entrada['partidas_por_segundo']:.1f} partidas/s")
+
+    entrenar(args.partidas, red, args.procesos, args.semilla, args.alfa, args.lam, args.lote,
+             args.max_turnos, args.posicion, args.exploracion, args.directorio, informar=informar)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Tabla de transposición acotada para la búsqueda y la evaluación.
+
+En Backgammon las mismas posiciones aparecen una y otra vez (distinto orden
+de dados, distinto orden de submovimientos), así que se guarda por clave de
+posición la profundidad buscada, el valor, el tipo de cota y la mejor jugada.
+La tabla tiene una capacidad máxima fija de entradas y dos políticas de
+reemplazo cuando se llena:
+- 'lru': se desaloja la entrada usada hace más tiempo.
+- 'profundidad': se prefiere conservar las entradas más profundas; la más
+  antigua sólo se desaloja si no es más profunda que la nueva (si lo es,
+  se le da otra oportunidad y la entrada nueva se descarta).
+"""
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+# Tipos de valor guardado
+EXACTA = 0
+INFERIOR = 1   # el valor real es >= valor (corte por beta)
+SUPERIOR = 2   # el valor real es <= valor (corte por alfa)
+
+POLITICAS = ('lru', 'profundidad')
+
+
+class Entrada(NamedTuple):
+    """Entrada de la tabla: valor de una búsqueda a cierta profundidad y su mejor jugada."""
+    profundidad: int
+    valor: float
+    tipo: int
+    jugada: Optional[tuple]
+
+
+class TablaTransposicion:
+    """
+    Caché de posiciones con capacidad máxima y contadores de uso.
+
+    :param capacidad: cantidad máxima de entradas (límite duro de memoria).
+    :param politica: 'lru' o 'profundidad'.
+    """
+
+    def __init__(self, capacidad: int = 1 << 16, politica: str = 'lru'):
+        if capacidad < 1:
+            raise ValueError("La capacidad debe ser al menos 1.")
+        if politica not in POLITICAS:
+            raise ValueError(f"Política de reemplazo inválida: {politica}")
+        self.__capacidad__ = capacidad
+        self.__politica__ = politica
+        self.__entradas__ = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.descartes = 0
+
+    def __len__(self):
+        return len(self.__entradas__)
+
+    def obtener_capacidad(self) -> int:
+        """Cantidad máxima de entradas."""
+        return self.__capacidad__
+
+    def obtener_politica(self) -> str:
+        """Política de reemplazo ('lru' o 'profundidad')."""
+        return self.__politica__
+
+    def buscar(self, clave) -> Optional[Entrada]:
+        """Devuelve la entrada guardada para la clave (o None) y cuenta acierto/fallo."""
+        entrada = self.__entradas__.get(clave)
+        if entrada is None:
+            self.fallos += 1
+            return None
+        self.aciertos += 1
+        if self.__politica__ == 'lru':
+            self.__entradas__.move_to_end(clave)
+        return entrada
+
+    def guardar(self, clave, profundidad: int, valor: float, tipo: int = EXACTA, jugada=None):
+        """
+        Guarda un resultado. Si la clave ya existe sólo se reemplaza por una
+        búsqueda al menos igual de profunda. Si la tabla está llena se aplica
+        la política de reemplazo.
+        """
+        entradas = self.__entradas__
+        anterior = entradas.get(clave)
+        if anterior is not None:
+            if profundidad < anterior.profundidad:
+                return
+            if jugada is None and anterior.profundidad == profundidad:
+                jugada = anterior.jugada
+            entradas[clave] = Entrada(profundidad, valor, tipo, jugada)
+            if self.__politica__ == 'lru':
+                entradas.move_to_end(clave)
+            return
+
+        if len(entradas) >= self.__capacidad__:
+            victima, entrada_victima = next(iter(entradas.items()))
+            if self.__politica__ == 'profundidad' and entrada_victima.profundidad > profundidad:
+                # La más antigua es más valiosa: se rota y se descarta la nueva
+                entradas.move_to_end(victima)
+                self.descartes += 1
+                return
+            del entradas[victima]
+            self.desalojos += 1
+        entradas[clave] = Entrada(profundidad, valor, tipo, jugada)
+
+    def limpiar(self):
+        """Vacía la tabla y reinicia los contadores."""
+        self.__entradas__.clear()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.descartes = 0
+
+    def tasa_aciertos(self) -> float:
+        """Proporción de consultas que encontraron la posición."""
+        consultas = self.aciertos + self.fallos
+        return self.aciertos / consultas if consultas else 0.0
+
+    def como_dict(self) -> dict:
+        """Devuelve los contadores como diccionario (útil para logs)."""
+        return {
+            'entradas': len(self),
+            'capacidad': self.__capacidad__,
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'desalojos': self.desalojos,
+            'descartes': self.descartes,
+            'tasa_aciertos': self.tasa_aciertos(),
+        }
+
+
+def valor_utilizable(entrada: Optional[Entrada], profundidad: int, alfa: float,
+                     beta: float) -> Optional[float]:
+    """
+    Devuelve el valor guardado si basta para resolver el nodo con la ventana
+    (alfa, beta) a la profundidad pedida; si no, None.
+    """
+    if entrada is None or entrada.profundidad < profundidad:
+        return None
+    if entrada.tipo == EXACTA:
+        return entrada.valor
+    if entrada.tipo == INFERIOR and entrada.valor >= beta:
+        return entrada.valor
+    if entrada.tipo == SUPERIOR and entrada.valor <= alfa:
+        return entrada.valor
+    return None
+
+
+def tipo_de_valor(valor: float, alfa: float, beta: float) -> int:
+    """Clasifica un resultado fail-soft según la ventana con la que se buscó."""
+    if valor <= alfa:
+        return SUPERIOR
+    if valor >= beta:
+        return INFERIOR
+    return EXACTA
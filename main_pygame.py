@@ -1,5 +1,6 @@
 # main_pygame.py
 
+import argparse
 import sys
 # Añadir el directorio raíz al path para que Python
 # pueda encontrar los módulos 'core' y 'pygame_ui'
@@ -20,8 +21,15 @@ if __name__ == "__main__":
         print("Por favor, instálalo ejecutando: pip install pygame")
         sys.exit(1)
     
+    parser = argparse.ArgumentParser(description="Backgammon con interfaz Pygame.")
+    parser.add_argument('--perfil', action='store_true',
+                        help="muestra FPS y tiempos de dibujado por etapa (F3 lo alterna)")
+    parser.add_argument('--registro-perfil', default=None,
+                        help="archivo JSONL donde se registran FPS y percentiles por etapa")
+    args = parser.parse_args()
+
     # Crear y ejecutar la interfaz de usuario
     # Los nombres se pedirán mediante la interfaz gráfica
-    ui_juego = InterfazPygame()
+    ui_juego = InterfazPygame(perfil=args.perfil, registro_perfil=args.registro_perfil)
     ui_juego.ejecutar()
     
\ No newline at end of file
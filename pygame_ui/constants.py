@@ -21,6 +21,10 @@ ANCHO_BARRA = ANCHO_PUNTO
 # Dimensiones de las fichas
 RADIO_FICHA = int(ANCHO_PUNTO * 0.45)
 DIAMETRO_FICHA = RADIO_FICHA * 2
+# Fichas dibujadas (75% del diámetro para no tapar los números) e íconos
+DIAMETRO_FICHA_DIBUJO = int(DIAMETRO_FICHA * 0.75)
+TAMANO_ICONO_TURNO = 25
+TAMANO_ICONO_FUERA = 16
 
 # Posiciones clave
 CENTRO_X = ANCHO_PANTALLA / 2
@@ -0,0 +1,118 @@
+# pygame_ui/perfil.py
+
+import json
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentil(muestras, p):
+    """Percentil 'p' (0-100) de una lista ordenada, por el método del rango más cercano."""
+    if not muestras:
+        return 0.0
+    indice = max(0, min(len(muestras) - 1, math.ceil(p / 100.0 * len(muestras)) - 1))
+    return muestras[indice]
+
+
+class Instrumentacion:
+    """
+    Tiempos de dibujado por etapa y de las llamadas al core, en ventanas
+    móviles de las últimas 'ventana' muestras (en milisegundos).
+    """
+
+    def __init__(self, ventana=240, ruta_registro=None, intervalo_registro=5.0):
+        """
+        :param ventana: cantidad de muestras recientes que se guardan por etapa.
+        :param ruta_registro: archivo JSONL donde se agrega un resumen cada
+                              'intervalo_registro' segundos (None = sin registro).
+        """
+        self.ventana = ventana
+        self.__muestras__ = {}
+        self.__cuadros__ = deque(maxlen=ventana)
+        self.__ruta_registro__ = ruta_registro
+        self.__intervalo_registro__ = intervalo_registro
+        self.__ultimo_registro__ = time.perf_counter()
+
+    def agregar(self, etapa, milisegundos):
+        muestras = self.__muestras__.get(etapa)
+        if muestras is None:
+            muestras = self.__muestras__[etapa] = deque(maxlen=self.ventana)
+        muestras.append(milisegundos)
+
+    @contextmanager
+    def medir(self, etapa):
+        """Mide el bloque 'with' y lo agrega a las muestras de 'etapa'."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.agregar(etapa, (time.perf_counter() - inicio) * 1000.0)
+
+    def cuadro(self, milisegundos):
+        """Registra un cuadro completo (evento + dibujado + presentación)."""
+        self.__cuadros__.append(time.perf_counter())
+        self.agregar('cuadro', milisegundos)
+        if self.__ruta_registro__ and time.perf_counter() - self.__ultimo_registro__ >= self.__intervalo_registro__:
+            self.registrar()
+
+    def fps(self):
+        """Cuadros por segundo según la ventana de cuadros recientes."""
+        if len(self.__cuadros__) < 2:
+            return 0.0
+        duracion = self.__cuadros__[-1] - self.__cuadros__[0]
+        return (len(self.__cuadros__) - 1) / duracion if duracion > 0 else 0.0
+
+    def resumen(self):
+        """{etapa: {'n', 'p50', 'p95', 'p99'}} con las muestras de la ventana."""
+        etapas = {}
+        for etapa, muestras in self.__muestras__.items():
+            ordenadas = sorted(muestras)
+            datos = {'n': len(ordenadas)}
+            for p in PERCENTILES:
+                datos[f'p{p}'] = percentil(ordenadas, p)
+            etapas[etapa] = datos
+        return etapas
+
+    def registrar(self):
+        """Agrega una línea con FPS y percentiles por etapa al archivo de registro."""
+        self.__ultimo_registro__ = time.perf_counter()
+        if not self.__ruta_registro__:
+            return
+        linea = {'tiempo': time.time(), 'fps': self.fps(), 'etapas': self.resumen()}
+        with open(self.__ruta_registro__, 'a', encoding='utf-8') as archivo:
+            archivo.write(json.dumps(linea) + '\n')
+
+    def lineas(self):
+        """Texto del overlay: FPS y 'p50 p95 p99 etapa' en ms."""
+        lineas = [f"FPS {self.fps():.1f}", "   p50    p95    p99  (ms)"]
+        for etapa, datos in sorted(self.resumen().items()):
+            lineas.append(f"{datos['p50']:6.2f} {datos['p95']:6.2f} {datos['p99']:6.2f}  {etapa}")
+        return lineas
+
+
+class LlamadasMedidas:
+    """
+    Envoltorio que mide cada llamada a un método del objeto envuelto como
+    la etapa '<prefijo>.<método>'.
+    """
+
+    def __init__(self, objeto, instrumentacion, prefijo):
+        self.__objeto__ = objeto
+        self.__instrumentacion__ = instrumentacion
+        self.__prefijo__ = prefijo
+
+    def __getattr__(self, nombre):
+        atributo = getattr(self.__objeto__, nombre)
+        if not callable(atributo):
+            return atributo
+        instrumentacion = self.__instrumentacion__
+        etapa = f"{self.__prefijo__}.{nombre}"
+
+        def medido(*args, **kwargs):
+            with instrumentacion.medir(etapa):
+                return atributo(*args, **kwargs)
+
+        return medido
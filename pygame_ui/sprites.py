@@ -0,0 +1,44 @@
+# pygame_ui/sprites.py
+
+import pygame
+
+
+class CacheSprites:
+    """
+    Superficies escaladas de los assets, generadas una sola vez por
+    (asset, tamaño). El dibujado sólo hace blit de las superficies guardadas.
+    """
+
+    def __init__(self, assets):
+        """
+        :param assets: diccionario de superficies originales (el de __cargar_assets__).
+        """
+        self.__assets__ = assets
+        self.__cache__ = {}
+
+    def obtener(self, nombre, tamano):
+        """
+        Devuelve el asset 'nombre' escalado a 'tamano' (lado en píxeles o (ancho, alto)).
+        La primera vez lo escala con smoothscale; después lo devuelve de la caché.
+        """
+        if isinstance(tamano, int):
+            tamano = (tamano, tamano)
+        clave = (nombre, tamano)
+        sprite = self.__cache__.get(clave)
+        if sprite is None:
+            sprite = pygame.transform.smoothscale(self.__assets__[nombre], tamano)
+            self.__cache__[clave] = sprite
+        return sprite
+
+    def precargar(self, nombres, tamanos):
+        """Genera de antemano todas las combinaciones de 'nombres' y 'tamanos'."""
+        for nombre in nombres:
+            for tamano in tamanos:
+                self.obtener(nombre, tamano)
+
+    def limpiar(self):
+        """Descarta las superficies escaladas (p. ej. al cambiar el tamaño de la ventana)."""
+        self.__cache__.clear()
+
+    def __len__(self):
+        return len(self.__cache__)
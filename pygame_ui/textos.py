@@ -0,0 +1,67 @@
+# pygame_ui/textos.py
+
+from collections import OrderedDict
+import pygame
+
+
+class RegistroFuentes:
+    """
+    Fuentes compartidas por toda la interfaz: cada (nombre, tamaño, negrita)
+    se construye una sola vez.
+    """
+
+    def __init__(self):
+        self.__fuentes__ = {}
+
+    def obtener(self, tamano, nombre=None, negrita=False):
+        """
+        Devuelve la fuente pedida, creándola la primera vez.
+        :param tamano: tamaño en puntos.
+        :param nombre: fuente del sistema (SysFont) o None para la fuente por defecto.
+        :param negrita: sólo se aplica a las fuentes del sistema.
+        """
+        clave = (nombre, tamano, negrita)
+        fuente = self.__fuentes__.get(clave)
+        if fuente is None:
+            if nombre is None:
+                fuente = pygame.font.Font(None, tamano)
+            else:
+                fuente = pygame.font.SysFont(nombre, tamano, bold=negrita)
+            self.__fuentes__[clave] = fuente
+        return fuente
+
+
+class CacheTextos:
+    """
+    Caché LRU de textos ya renderizados, por (fuente, texto, color, antialias).
+    Los textos que no cambian entre cuadros se devuelven sin volver a rasterizar.
+    """
+
+    def __init__(self, capacidad=256):
+        if capacidad < 1:
+            raise ValueError("La capacidad debe ser positiva.")
+        self.capacidad = capacidad
+        self.aciertos = 0
+        self.fallos = 0
+        self.__cache__ = OrderedDict()
+
+    def render(self, fuente, texto, color, antialias=True):
+        """Equivalente a fuente.render(texto, antialias, color), con caché."""
+        clave = (fuente, texto, tuple(color), antialias)
+        superficie = self.__cache__.get(clave)
+        if superficie is not None:
+            self.__cache__.move_to_end(clave)
+            self.aciertos += 1
+            return superficie
+        self.fallos += 1
+        superficie = fuente.render(texto, antialias, color)
+        self.__cache__[clave] = superficie
+        if len(self.__cache__) > self.capacidad:
+            self.__cache__.popitem(last=False)
+        return superficie
+
+    def limpiar(self):
+        self.__cache__.clear()
+
+    def __len__(self):
+        return len(self.__cache__)
@@ -3,20 +3,51 @@
 import pygame
 import sys
 import math
+import time
+from contextlib import nullcontext
+from typing import NamedTuple
 from . import constants as const
 from . import events as ui_events
+from .sprites import CacheSprites
+from .textos import CacheTextos, RegistroFuentes
+from .perfil import Instrumentacion, LlamadasMedidas
 # Importamos las clases del core
 from core.game import Game
 from core.board import Tablero 
+from core.tables import INDICE_COLOR, DADO_SALIDA
 from core.player import Player
 
+# Duración del mensaje de error en pantalla (ms) y período del parpadeo de avisos (ms)
+DURACION_ERROR = 3000
+PERIODO_PARPADEO = 500
+# Cada cuánto se refresca el overlay de rendimiento aunque no haya eventos (ms)
+PERIODO_PERFIL = 500
+
+_SIN_MEDIR = nullcontext()
+
+
+class _Escena(NamedTuple):
+    """Entradas de las capas dinámicas; si no cambian, el cuadro tampoco."""
+    posicion: int        # hash de Zobrist del tablero
+    dados: tuple
+    movimientos: tuple
+    turno: str
+    seleccion: object
+    resaltados: tuple
+    error: object
+
+
 class InterfazPygame:
     """
     Controla toda la interfaz gráfica de Pygame.
     Se comunica con la clase BackgammonGame de la lógica central.
     """
 
-    def __init__(self):
+    def __init__(self, perfil=False, registro_perfil=None):
+        """
+        :param perfil: muestra el overlay con FPS y tiempos por etapa (F3 lo alterna).
+        :param registro_perfil: archivo JSONL donde se registran periódicamente esos tiempos.
+        """
         pygame.init()
         pygame.font.init()
 
@@ -24,8 +55,14 @@ class InterfazPygame:
             (const.ANCHO_PANTALLA, const.ALTO_PANTALLA)
         )
         pygame.display.set_caption("Backgammon Computación 2025")
-        self.__reloj__ = pygame.time.Clock()
+        self.__fuentes__ = RegistroFuentes()
+        self.__textos__ = CacheTextos()
         self.__assets__ = self.__cargar_assets__()
+        self.__sprites__ = CacheSprites(self.__assets__)
+        self.__sprites__.precargar(
+            ("ficha_blanca", "ficha_negra"),
+            (const.DIAMETRO_FICHA_DIBUJO, const.TAMANO_ICONO_TURNO, const.TAMANO_ICONO_FUERA),
+        )
 
         # --- Obtener nombres de jugadores con interfaz gráfica ---
         nombre1, nombre2 = self.__pedir_nombres_jugadores__()
@@ -39,24 +76,38 @@ class InterfazPygame:
         self.__boton_pasar_turno__ = None
         self.__mensaje_error__ = None
         self.__tiempo_error__ = 0
+        self.__lineas_error__ = (None, [])
+
+        # --- Instrumentación (opcional) ---
+        self.__perfil__ = None
+        if perfil or registro_perfil:
+            self.__perfil__ = Instrumentacion(ruta_registro=registro_perfil)
+        self.__mostrar_perfil__ = perfil
+        self.__rect_perfil__ = None
 
         self.__generar_coordenadas_layout__()
 
+        # --- Capas de dibujado ---
+        # Tablero estático (fondo, triángulos, bordes y números) compuesto una sola vez,
+        # y la escena completa del último cuadro, que se reutiliza mientras no cambie su clave.
+        self.__capa_tablero__ = self.__componer_capa_tablero__()
+        self.__capa_escena__ = None
+        self.__clave_escena__ = None
+        self.__conteos_escena__ = None
+
     def __pedir_nombres_jugadores__(self):
         """
         Muestra una pantalla elegante de sala de juegos para ingresar los nombres de los jugadores.
         """
-        fuente_titulo = pygame.font.Font(None, 72)
-        fuente_subtitulo = pygame.font.Font(None, 40)
-        fuente_input = pygame.font.Font(None, 36)
-        fuente_hint = pygame.font.Font(None, 24)
+        fuente_titulo = self.__fuentes__.obtener(72)
+        fuente_subtitulo = self.__fuentes__.obtener(40)
+        fuente_input = self.__fuentes__.obtener(36)
+        fuente_hint = self.__fuentes__.obtener(24)
         
         nombre1 = ""
         nombre2 = ""
         input_activo = 1  # 1 para jugador 1, 2 para jugador 2
         
-        reloj = pygame.time.Clock()
-        
         while True:
             # Fondo elegante de madera oscura con textura
             self.__pantalla__.fill((40, 30, 20))  # Marrón oscuro profundo
@@ -73,13 +124,13 @@ class InterfazPygame:
             pygame.draw.rect(self.__pantalla__, (139, 90, 43), (25, 25, const.ANCHO_PANTALLA - 50, const.ALTO_PANTALLA - 50), 2, border_radius=12)
             
             # Título principal con sombra
-            titulo = fuente_titulo.render("BACKGAMMON", True, (218, 165, 32))
-            sombra_titulo = fuente_titulo.render("BACKGAMMON", True, (20, 15, 10))
+            titulo = self.__textos__.render(fuente_titulo, "BACKGAMMON", (218, 165, 32))
+            sombra_titulo = self.__textos__.render(fuente_titulo, "BACKGAMMON", (20, 15, 10))
             self.__pantalla__.blit(sombra_titulo, (const.ANCHO_PANTALLA // 2 - titulo.get_width() // 2 + 3, 58))
             self.__pantalla__.blit(titulo, (const.ANCHO_PANTALLA // 2 - titulo.get_width() // 2, 55))
             
             # Subtítulo elegante
-            subtitulo = fuente_subtitulo.render("Sala de Juegos", True, (180, 140, 90))
+            subtitulo = self.__textos__.render(fuente_subtitulo, "Sala de Juegos", (180, 140, 90))
             self.__pantalla__.blit(subtitulo, (const.ANCHO_PANTALLA // 2 - subtitulo.get_width() // 2, 130))
             
             # Línea decorativa
@@ -90,14 +141,14 @@ class InterfazPygame:
             # Instrucciones con estilo
             y_instruccion = 220
             if input_activo == 1:
-                instruccion = fuente_input.render("Jugador Blanco", True, (240, 230, 200))
+                instruccion = self.__textos__.render(fuente_input, "Jugador Blanco", (240, 230, 200))
                 icono = "♔"  # Rey blanco
             else:
-                instruccion = fuente_input.render("Jugador Negro", True, (240, 230, 200))
+                instruccion = self.__textos__.render(fuente_input, "Jugador Negro", (240, 230, 200))
                 icono = "♚"  # Rey negro
             
-            fuente_icono = pygame.font.Font(None, 50)
-            texto_icono = fuente_icono.render(icono, True, (218, 165, 32))
+            fuente_icono = self.__fuentes__.obtener(50)
+            texto_icono = self.__textos__.render(fuente_icono, icono, (218, 165, 32))
             self.__pantalla__.blit(texto_icono, (const.ANCHO_PANTALLA // 2 - instruccion.get_width() // 2 - 50, y_instruccion - 5))
             self.__pantalla__.blit(instruccion, (const.ANCHO_PANTALLA // 2 - instruccion.get_width() // 2, y_instruccion))
             
@@ -118,15 +169,15 @@ class InterfazPygame:
             
             # Mostrar nombre actual
             if input_activo == 1:
-                texto_nombre = fuente_input.render(nombre1 + "|", True, (255, 245, 220))
+                texto_nombre = self.__textos__.render(fuente_input, nombre1 + "|", (255, 245, 220))
             else:
-                texto_nombre = fuente_input.render(nombre2 + "|", True, (255, 245, 220))
+                texto_nombre = self.__textos__.render(fuente_input, nombre2 + "|", (255, 245, 220))
             
             self.__pantalla__.blit(texto_nombre, (rect_input.x + 20, rect_input.y + 15))
             
             # Hint de texto si está vacío
             if (input_activo == 1 and not nombre1) or (input_activo == 2 and not nombre2):
-                hint = fuente_hint.render("Ingrese su nombre...", True, (120, 100, 80))
+                hint = self.__textos__.render(fuente_hint, "Ingrese su nombre...", (120, 100, 80))
                 self.__pantalla__.blit(hint, (rect_input.x + 20, rect_input.y + 18))
             
             # Mostrar confirmación del primer jugador
@@ -135,16 +186,16 @@ class InterfazPygame:
                 pygame.draw.rect(self.__pantalla__, (50, 80, 50, 150), panel_confirmado, border_radius=10)
                 pygame.draw.rect(self.__pantalla__, (100, 180, 100), panel_confirmado, 2, border_radius=10)
                 
-                confirmado1 = fuente_input.render(f"✓ Blanco: {nombre1}", True, (150, 255, 150))
+                confirmado1 = self.__textos__.render(fuente_input, f"✓ Blanco: {nombre1}", (150, 255, 150))
                 self.__pantalla__.blit(confirmado1, (const.ANCHO_PANTALLA // 2 - confirmado1.get_width() // 2, 380))
             
             # Instrucción final
             if nombre2 and input_activo == 2:
-                info = fuente_input.render("Presiona ENTER para comenzar", True, (255, 220, 100))
-                sombra_info = fuente_input.render("Presiona ENTER para comenzar", True, (100, 80, 40))
+                info = self.__textos__.render(fuente_input, "Presiona ENTER para comenzar", (255, 220, 100))
+                sombra_info = self.__textos__.render(fuente_input, "Presiona ENTER para comenzar", (100, 80, 40))
                 y_info = 460
                 # Efecto de parpadeo
-                if (pygame.time.get_ticks() // 500) % 2 == 0:
+                if (pygame.time.get_ticks() // PERIODO_PARPADEO) % 2 == 0:
                     self.__pantalla__.blit(sombra_info, (const.ANCHO_PANTALLA // 2 - info.get_width() // 2 + 2, y_info + 2))
                     self.__pantalla__.blit(info, (const.ANCHO_PANTALLA // 2 - info.get_width() // 2, y_info))
             
@@ -155,7 +206,12 @@ class InterfazPygame:
             
             pygame.display.flip()
             
-            for evento in pygame.event.get():
+            # Esperar el próximo evento; si hay aviso parpadeando, sólo hasta su próximo cambio
+            espera = 0
+            if nombre2 and input_activo == 2:
+                espera = PERIODO_PARPADEO - pygame.time.get_ticks() % PERIODO_PARPADEO
+            primero = pygame.event.wait(espera)
+            for evento in [primero] + pygame.event.get():
                 if evento.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -177,8 +233,6 @@ class InterfazPygame:
                                 nombre1 += evento.unicode
                             else:
                                 nombre2 += evento.unicode
-            
-            reloj.tick(30)
     
     def __cargar_assets__(self):
         assets = {}
@@ -277,17 +331,153 @@ class InterfazPygame:
     # --- MÉTODOS DE DIBUJADO (DRAW) ---
 
     def __dibujar__(self):
+        """
+        Dibuja un cuadro por capas. Si nada cambió desde el cuadro anterior
+        basta con un blit de la escena guardada; si no, se parte del tablero
+        estático y se dibujan encima fichas, UI, resaltados y mensajes.
+        :return: lista de rectángulos de pantalla que cambiaron (vacía si ninguno).
+        """
+        clave = self.__calcular_clave_escena__()
+        if clave == self.__clave_escena__:
+            with self.__medir__('escena'):
+                self.__pantalla__.blit(self.__capa_escena__, (0, 0))
+            return self.__dibujar_perfil__()
+
+        conteos = self.__juego__.obtener_tablero().obtener_conteos()
+        regiones = self.__regiones_cambiadas__(self.__clave_escena__, clave, self.__conteos_escena__, conteos)
+        with self.__medir__('escena'):
+            self.__pantalla__.blit(self.__capa_tablero__, (0, 0))
+        with self.__medir__('fichas'):
+            self.__dibujar_todas_las_fichas__()
+        with self.__medir__('ui'):
+            self.__dibujar_elementos_ui__()
+        with self.__medir__('resaltados'):
+            self.__dibujar_resaltados__()
+        with self.__medir__('mensajes'):
+            self.__dibujar_mensaje_error__()
+            self.__dibujar_mensaje_ganador__()
+
+        with self.__medir__('escena'):
+            if self.__capa_escena__ is None:
+                self.__capa_escena__ = self.__pantalla__.copy()
+            else:
+                self.__capa_escena__.blit(self.__pantalla__, (0, 0))
+        self.__clave_escena__ = clave
+        self.__conteos_escena__ = conteos
+        return regiones + self.__dibujar_perfil__()
+
+    def __medir__(self, etapa):
+        """Contexto que mide 'etapa' si la instrumentación está activa."""
+        if self.__perfil__ is None:
+            return _SIN_MEDIR
+        return self.__perfil__.medir(etapa)
+
+    def __dibujar_perfil__(self):
+        """
+        Dibuja el overlay de rendimiento (arriba a la izquierda) sobre la escena.
+        :return: regiones a actualizar: la del overlay, o la que ocupaba si se ocultó.
+        """
+        anterior = self.__rect_perfil__
+        self.__rect_perfil__ = None
+        if self.__perfil__ is None or not self.__mostrar_perfil__:
+            return [anterior] if anterior else []
+
+        # Los números cambian en cada refresco: se renderizan sin pasar por la caché de textos
+        fuente = self.__fuentes__.obtener(16, 'monospace')
+        lineas = self.__perfil__.lineas()
+        alto_linea = fuente.get_linesize()
+        rect = pygame.Rect(0, 0, max(fuente.size(linea)[0] for linea in lineas) + 12,
+                           alto_linea * len(lineas) + 8)
+        fondo = pygame.Surface(rect.size, pygame.SRCALPHA)
+        fondo.fill((0, 0, 0, 180))
+        self.__pantalla__.blit(fondo, rect)
+        for i, linea in enumerate(lineas):
+            self.__pantalla__.blit(fuente.render(linea, True, (230, 230, 230)), (6, 4 + i * alto_linea))
+        self.__rect_perfil__ = rect
+        return [rect.union(anterior) if anterior else rect]
+
+    def __componer_capa_tablero__(self):
+        """
+        Compone fuera de pantalla las partes que nunca cambian: fondo y tablero.
+        """
         if self.__assets__["fondo_tablero"]:
             self.__pantalla__.blit(self.__assets__["fondo_tablero"], (0, 0))
         else:
             self.__pantalla__.fill(const.COLOR_FONDO)
+        with self.__medir__('tablero'):
+            self.__dibujar_tablero__()
+        return self.__pantalla__.copy()
 
-        self.__dibujar_tablero__()
-        self.__dibujar_todas_las_fichas__()
-        self.__dibujar_elementos_ui__()
-        self.__dibujar_resaltados__()
-        self.__dibujar_mensaje_error__()
-        self.__dibujar_mensaje_ganador__()
+    def __calcular_clave_escena__(self):
+        """
+        Resume todo lo que determina las capas dinámicas: posición (hash de
+        Zobrist), dados, turno, selección, resaltados y el mensaje visible.
+        """
+        error_visible = (
+            self.__mensaje_error__ is not None
+            and pygame.time.get_ticks() - self.__tiempo_error__ < DURACION_ERROR
+        )
+        return _Escena(
+            self.__juego__.obtener_tablero().obtener_hash(),
+            self.__juego__.mostrar_dados().obtener_valores(),
+            tuple(self.__juego__.obtener_movimientos_disponibles()),
+            self.__juego__.mostrar_jugador_actual().obtener_color(),
+            self.__punto_seleccionado__,
+            tuple(self.__movimientos_posibles__.items()),
+            (self.__mensaje_error__, self.__tiempo_error__) if error_visible else None,
+        )
+
+    def __regiones_cambiadas__(self, anterior, actual, conteos_anteriores, conteos):
+        """
+        Rectángulos de pantalla afectados al pasar de la escena 'anterior' a 'actual'.
+        Cada parte de la escena se asocia a la zona donde se dibuja: columnas de
+        los puntos, barra, panel 'Fuera', panel de turno, zona central de dados y
+        botones, y mensaje de error. La primera escena y la victoria ocupan toda la pantalla.
+        """
+        pantalla = self.__pantalla__.get_rect()
+        if anterior is None or self.__juego__.verificar_victoria():
+            return [pantalla]
+
+        regiones = []
+        if actual.posicion != anterior.posicion:
+            regiones.extend(
+                self.__region_punto__(i) for i in range(24) if conteos[i] != conteos_anteriores[i]
+            )
+            regiones.append(self.__region_barra__())
+            regiones.append(self.__region_panel_fuera__())
+        if (actual.dados, actual.movimientos, actual.turno) != (anterior.dados, anterior.movimientos, anterior.turno):
+            regiones.append(pygame.Rect(const.CENTRO_X - 175, 5, 350, 40))
+            regiones.append(pygame.Rect(const.CENTRO_X - 100, const.CENTRO_Y - 20, 200, 100))
+            regiones.append(self.__region_panel_fuera__())
+        if (actual.seleccion, actual.resaltados) != (anterior.seleccion, anterior.resaltados):
+            for escena in (anterior, actual):
+                puntos = [escena.seleccion] + [indice for indice, _ in escena.resaltados]
+                for indice in puntos:
+                    if indice is not None and 0 <= indice <= 23:
+                        regiones.append(self.__region_punto__(indice))
+                if escena.seleccion == 24:
+                    regiones.append(self.__region_barra__())
+            regiones.append(self.__region_panel_fuera__())
+        if actual.error != anterior.error:
+            regiones.append(pygame.Rect(const.CENTRO_X - 250, const.ALTO_PANTALLA - 120, 500, 60))
+        return [region.clip(pantalla) for region in regiones]
+
+    def __region_punto__(self, indice):
+        """Columna de un punto: triángulo, pila de fichas y contador '+N'."""
+        hitbox = const.HITBOXES_PUNTOS[indice]
+        y = const.MARGEN_TABLERO_Y if indice >= 12 else const.CENTRO_Y
+        return pygame.Rect(hitbox.left - 1, y, hitbox.width + 2, const.ALTO_TABLERO / 2)
+
+    def __region_barra__(self):
+        return pygame.Rect(const.CENTRO_X - const.ANCHO_BARRA / 2, const.MARGEN_TABLERO_Y,
+                           const.ANCHO_BARRA, const.ALTO_TABLERO)
+
+    def __region_panel_fuera__(self):
+        """Panel lateral 'Fuera' con el margen del resaltado de sacar fichas."""
+        return const.HITBOX_FUERA_BLANCO.union(const.HITBOX_FUERA_NEGRO).inflate(8, 8).union(
+            pygame.Rect(const.ANCHO_PANTALLA - const.MARGEN_TABLERO_X, const.CENTRO_Y - 60,
+                        const.MARGEN_TABLERO_X, 120)
+        )
 
     def __dibujar_tablero__(self):
         # Fondo del tablero con borde
@@ -309,7 +499,7 @@ class InterfazPygame:
         pygame.draw.rect(self.__pantalla__, (101, 67, 33), rect_barra, 2)
         
         # Dibujar los 24 puntos (triángulos)
-        fuente_numeros = pygame.font.Font(None, 20)
+        fuente_numeros = self.__fuentes__.obtener(20)
         
         for i in range(24):
             # Alternar colores para los puntos
@@ -348,7 +538,7 @@ class InterfazPygame:
             
             # Dibujar el número del punto
             color_texto = (240, 230, 200) if i % 2 == 0 else (60, 40, 20)
-            texto_numero = fuente_numeros.render(str(numero_punto), True, color_texto)
+            texto_numero = self.__textos__.render(fuente_numeros, str(numero_punto), color_texto)
             
             # Centrar el número
             texto_rect = texto_numero.get_rect(center=(pos_numero_x, pos_numero_y))
@@ -381,11 +571,10 @@ class InterfazPygame:
             
             # Determinar el color de la ficha basado en el primer carácter
             color_ficha = fichas[0]  # 'B' o 'N'
-            img_ficha_original = self.__assets__["ficha_blanca"] if color_ficha == 'B' else self.__assets__["ficha_negra"]
             
-            # Escalar la ficha a un tamaño compacto para no tapar números (75% del tamaño original)
-            nuevo_diametro = int(const.DIAMETRO_FICHA * 0.75)
-            img_ficha = pygame.transform.smoothscale(img_ficha_original, (nuevo_diametro, nuevo_diametro))
+            # Ficha en tamaño compacto para no tapar números (75% del tamaño original)
+            nuevo_diametro = const.DIAMETRO_FICHA_DIBUJO
+            img_ficha = self.__sprites__.obtener("ficha_blanca" if color_ficha == 'B' else "ficha_negra", nuevo_diametro)
             
             base_x = const.HITBOXES_PUNTOS[indice_punto].left + (const.ANCHO_PUNTO - nuevo_diametro) // 2
             
@@ -397,8 +586,8 @@ class InterfazPygame:
             for i in range(cantidad_fichas):
                 if i >= 5: 
                     # Mostrar contador si hay más de 5 fichas
-                    fuente = pygame.font.Font(None, 24)
-                    texto = fuente.render(f"+{cantidad_fichas - 5}", True, (255, 255, 0))
+                    fuente = self.__fuentes__.obtener(24)
+                    texto = self.__textos__.render(fuente, f"+{cantidad_fichas - 5}", (255, 255, 0))
                     self.__pantalla__.blit(texto, (base_x + nuevo_diametro // 2 - 10, pos_y + offset_y * 2))
                     break
                 self.__pantalla__.blit(img_ficha, (base_x, pos_y))
@@ -424,11 +613,9 @@ class InterfazPygame:
         if contador == 0:
             return
 
-        img_ficha_original = self.__assets__["ficha_blanca"] if color == 'B' else self.__assets__["ficha_negra"]
-        
-        # Escalar la ficha a un tamaño compacto
-        nuevo_diametro = int(const.DIAMETRO_FICHA * 0.75)
-        img_ficha = pygame.transform.smoothscale(img_ficha_original, (nuevo_diametro, nuevo_diametro))
+        # Ficha en tamaño compacto
+        nuevo_diametro = const.DIAMETRO_FICHA_DIBUJO
+        img_ficha = self.__sprites__.obtener("ficha_blanca" if color == 'B' else "ficha_negra", nuevo_diametro)
         
         pos_x = const.CENTRO_X - nuevo_diametro // 2
         
@@ -455,11 +642,9 @@ class InterfazPygame:
         if contador == 0:
             return
 
-        img_ficha_original = self.__assets__["ficha_blanca"] if color == 'B' else self.__assets__["ficha_negra"]
-        
-        # Escalar la ficha a un tamaño compacto
-        nuevo_diametro = int(const.DIAMETRO_FICHA * 0.75)
-        img_ficha = pygame.transform.smoothscale(img_ficha_original, (nuevo_diametro, nuevo_diametro))
+        # Ficha en tamaño compacto
+        nuevo_diametro = const.DIAMETRO_FICHA_DIBUJO
+        img_ficha = self.__sprites__.obtener("ficha_blanca" if color == 'B' else "ficha_negra", nuevo_diametro)
         
         pos_x = const.ANCHO_PANTALLA - const.MARGEN_TABLERO_X / 2
 
@@ -471,8 +656,8 @@ class InterfazPygame:
         self.__pantalla__.blit(img_ficha, (pos_x - nuevo_diametro // 2, pos_y - nuevo_diametro // 2))
         
         # Mostrar contador de fichas en casa
-        fuente = pygame.font.Font(None, 28)
-        texto = fuente.render(str(contador), True, (255, 255, 255))
+        fuente = self.__fuentes__.obtener(28)
+        texto = self.__textos__.render(fuente, str(contador), (255, 255, 255))
         self.__pantalla__.blit(texto, (pos_x + const.RADIO_FICHA + 5, pos_y - 10))
 
     def __dibujar_barra_lateral_progreso__(self):
@@ -501,23 +686,23 @@ class InterfazPygame:
         pygame.draw.rect(self.__pantalla__, (218, 165, 32), panel_rect, 1, border_radius=8)
 
         # Título compacto y claro
-        fuente_titulo = pygame.font.SysFont('georgia', 14, bold=True)
-        txt = fuente_titulo.render("Fuera", True, (240, 220, 180))
+        fuente_titulo = self.__fuentes__.obtener(14, 'georgia', negrita=True)
+        txt = self.__textos__.render(fuente_titulo, "Fuera", (240, 220, 180))
         self.__pantalla__.blit(txt, (panel_x + (panel_ancho - txt.get_width()) // 2, panel_y + 4))
 
         # Helper compacto para cada línea
         def dibujar_linea(y_base, es_blancas, cantidad):
             # Ícono de ficha
-            img = self.__assets__["ficha_blanca"] if es_blancas else self.__assets__["ficha_negra"]
-            icono = pygame.transform.smoothscale(img, (16, 16))
-            self.__pantalla__.blit(icono, (panel_x + (panel_ancho - 16) // 2, y_base))
+            tamano = const.TAMANO_ICONO_FUERA
+            icono = self.__sprites__.obtener("ficha_blanca" if es_blancas else "ficha_negra", tamano)
+            self.__pantalla__.blit(icono, (panel_x + (panel_ancho - tamano) // 2, y_base))
 
             # Texto "x/15"
-            fuente = pygame.font.Font(None, 18)
+            fuente = self.__fuentes__.obtener(18)
             pref = 'B' if es_blancas else 'N'
             texto = f"{pref} {cantidad}/15"
             color_txt = (255, 255, 255) if es_blancas else (40, 40, 40)
-            surf_txt = fuente.render(texto, True, color_txt)
+            surf_txt = self.__textos__.render(fuente, texto, color_txt)
             self.__pantalla__.blit(surf_txt, (panel_x + (panel_ancho - surf_txt.get_width()) // 2, y_base + 16))
 
             # Barra de progreso
@@ -540,8 +725,8 @@ class InterfazPygame:
         if self.__juego__.verificar_victoria():
             ganador = self.__juego__.obtener_ganador()
             if ganador is not None:
-                fuente_g = pygame.font.Font(None, 16)
-                surf_g = fuente_g.render("¡Gana!", True, (255, 220, 120))
+                fuente_g = self.__fuentes__.obtener(16)
+                surf_g = self.__textos__.render(fuente_g, "¡Gana!", (255, 220, 120))
                 self.__pantalla__.blit(surf_g, (panel_x + (panel_ancho - surf_g.get_width()) // 2, panel_y + panel_alto - 18))
 
     def __dibujar_elementos_ui__(self):
@@ -567,20 +752,20 @@ class InterfazPygame:
         pygame.draw.rect(self.__pantalla__, (218, 165, 32), panel_rect, 2, border_radius=8)
         
         # Imagen de la ficha del jugador (más pequeña)
-        img_ficha = self.__assets__["ficha_blanca"] if color_jugador == 'blanco' else self.__assets__["ficha_negra"]
-        # Escalar la ficha para que sea más pequeña
-        ficha_pequena = pygame.transform.scale(img_ficha, (25, 25))
+        ficha_pequena = self.__sprites__.obtener(
+            "ficha_blanca" if color_jugador == 'blanco' else "ficha_negra", const.TAMANO_ICONO_TURNO
+        )
         ficha_x = panel_x + 10
         ficha_y = panel_y + panel_altura // 2 - 12
         self.__pantalla__.blit(ficha_pequena, (ficha_x, ficha_y))
         
         # Texto del turno con fuente elegante pero compacta
-        fuente_nombre = pygame.font.SysFont('georgia', 22, bold=True)
+        fuente_nombre = self.__fuentes__.obtener(22, 'georgia', negrita=True)
         
         color_texto = (255, 255, 255) if color_jugador == 'blanco' else (50, 50, 50)
         
         # Nombre del jugador directamente
-        texto_nombre = fuente_nombre.render(f"Turno: {jugador_actual.obtener_nombre()}", True, color_texto)
+        texto_nombre = self.__textos__.render(fuente_nombre, f"Turno: {jugador_actual.obtener_nombre()}", color_texto)
         texto_x = ficha_x + 35
         texto_y = panel_y + panel_altura // 2 - texto_nombre.get_height() // 2
         self.__pantalla__.blit(texto_nombre, (texto_x, texto_y))
@@ -594,8 +779,8 @@ class InterfazPygame:
                     self.__pantalla__, color_boton, const.HITBOX_BOTON_LANZAR, border_radius=5
                 )
                 color_texto_boton = (0, 0, 0) if color_jugador == 'blanco' else (255, 255, 255)
-                fuente = pygame.font.Font(None, 36)
-                texto = fuente.render("Lanzar", True, color_texto_boton)
+                fuente = self.__fuentes__.obtener(36)
+                texto = self.__textos__.render(fuente, "Lanzar", color_texto_boton)
                 self.__pantalla__.blit(texto, (const.HITBOX_BOTON_LANZAR.centerx - texto.get_width() // 2,
                                               const.HITBOX_BOTON_LANZAR.centery - texto.get_height() // 2))
         else:
@@ -626,8 +811,8 @@ class InterfazPygame:
             if len(movimientos_disponibles) == 0:
                 boton_pasar = pygame.Rect(const.CENTRO_X - 60, const.CENTRO_Y + 40, 120, 40)
                 pygame.draw.rect(self.__pantalla__, (200, 100, 100), boton_pasar, border_radius=5)
-                fuente = pygame.font.Font(None, 28)
-                texto = fuente.render("Pasar Turno", True, (255, 255, 255))
+                fuente = self.__fuentes__.obtener(28)
+                texto = self.__textos__.render(fuente, "Pasar Turno", (255, 255, 255))
                 self.__pantalla__.blit(texto, (boton_pasar.centerx - texto.get_width() // 2,
                                               boton_pasar.centery - texto.get_height() // 2))
                 # Guardar el botón para detectar clics
@@ -679,12 +864,10 @@ class InterfazPygame:
                     origen = self.__punto_seleccionado__
                     movimientos = self.__juego__.obtener_movimientos_disponibles() or []
 
-                    # Verificar que el origen esté dentro de la casa del jugador
-                    en_casa = (0 <= origen <= 5) if color_sigla == 'B' else (18 <= origen <= 23)
-                    if en_casa and movimientos:
-                        # Dado necesario según orientación actual
-                        dado_necesario = (origen + 1) if color_sigla == 'B' else (24 - origen)
-
+                    # Dado necesario para sacar desde el origen (None fuera de la casa)
+                    dado_necesario = (DADO_SALIDA[INDICE_COLOR[color_sigla]][origen]
+                                      if 0 <= origen <= 23 else None)
+                    if dado_necesario is not None and movimientos:
                         posible = False
                         if dado_necesario in movimientos:
                             posible = True
@@ -725,8 +908,8 @@ class InterfazPygame:
             self.__pantalla__.blit(overlay, (0, 0))
             
             # Dibujar texto de ganador
-            fuente_ganador = pygame.font.Font(None, 72)
-            texto_renderizado = fuente_ganador.render(texto, True, color)
+            fuente_ganador = self.__fuentes__.obtener(72)
+            texto_renderizado = self.__textos__.render(fuente_ganador, texto, color)
             self.__pantalla__.blit(texto_renderizado, 
                                   (const.CENTRO_X - texto_renderizado.get_width() // 2,
                                    const.CENTRO_Y - texto_renderizado.get_height() // 2))
@@ -735,7 +918,7 @@ class InterfazPygame:
         """
         Muestra un mensaje de error temporal en la parte inferior de la pantalla.
         """
-        if self.__mensaje_error__ and pygame.time.get_ticks() - self.__tiempo_error__ < 3000:
+        if self.__mensaje_error__ and pygame.time.get_ticks() - self.__tiempo_error__ < DURACION_ERROR:
             # Crear un recuadro semi-transparente para el mensaje
             ancho_mensaje = 500
             alto_mensaje = 60
@@ -753,33 +936,36 @@ class InterfazPygame:
                            (x_mensaje, y_mensaje, ancho_mensaje, alto_mensaje), 2, border_radius=8)
             
             # Texto del error
-            fuente_error = pygame.font.Font(None, 24)
-            
-            # Dividir el mensaje en múltiples líneas si es muy largo
-            palabras = self.__mensaje_error__.split(' ')
-            lineas = []
-            linea_actual = ""
+            fuente_error = self.__fuentes__.obtener(24)
             
-            for palabra in palabras:
-                test_linea = linea_actual + palabra + " "
-                if fuente_error.size(test_linea)[0] < ancho_mensaje - 20:
-                    linea_actual = test_linea
-                else:
-                    if linea_actual:
-                        lineas.append(linea_actual)
-                    linea_actual = palabra + " "
-            
-            if linea_actual:
-                lineas.append(linea_actual)
+            # Dividir el mensaje en múltiples líneas si es muy largo (una vez por mensaje)
+            if self.__lineas_error__[0] != self.__mensaje_error__:
+                palabras = self.__mensaje_error__.split(' ')
+                lineas = []
+                linea_actual = ""
+                
+                for palabra in palabras:
+                    test_linea = linea_actual + palabra + " "
+                    if fuente_error.size(test_linea)[0] < ancho_mensaje - 20:
+                        linea_actual = test_linea
+                    else:
+                        if linea_actual:
+                            lineas.append(linea_actual)
+                        linea_actual = palabra + " "
+                
+                if linea_actual:
+                    lineas.append(linea_actual)
+                self.__lineas_error__ = (self.__mensaje_error__, lineas)
+            lineas = self.__lineas_error__[1]
             
             # Dibujar cada línea con color claro para buen contraste
             y_offset = y_mensaje + 12
             for linea in lineas[:2]:  # Máximo 2 líneas
-                texto_renderizado = fuente_error.render(linea.strip(), True, (255, 255, 220))
+                texto_renderizado = self.__textos__.render(fuente_error, linea.strip(), (255, 255, 220))
                 self.__pantalla__.blit(texto_renderizado, 
                                       (const.CENTRO_X - texto_renderizado.get_width() // 2, y_offset))
                 y_offset += 26
-        elif pygame.time.get_ticks() - self.__tiempo_error__ >= 3000:
+        elif pygame.time.get_ticks() - self.__tiempo_error__ >= DURACION_ERROR:
             # Limpiar el mensaje después de 3 segundos
             self.__mensaje_error__ = None
 
@@ -794,23 +980,76 @@ class InterfazPygame:
     # --- MÉTODOS DE LÓGICA DE EVENTOS (HANDLE) ---
 
     def ejecutar(self):
+        """
+        Bucle principal dirigido por eventos: duerme en pygame.event.wait hasta
+        el próximo evento (o hasta que venza el mensaje de error) y sólo envía
+        a la ventana las regiones que cambiaron.
+        """
+        self.__dibujar__()
+        pygame.display.flip()
         ejecutando = True
         while ejecutando:
-            for evento in pygame.event.get():
+            primero = pygame.event.wait(self.__espera_proximo_temporizador__())
+            inicio = time.perf_counter()
+            redibujar_todo = False
+            for evento in [primero] + pygame.event.get():
                 if evento.type == pygame.QUIT:
                     ejecutando = False
                 
                 if evento.type == pygame.MOUSEBUTTONDOWN:
                     if evento.button == 1: 
-                        self.__manejar_clic__(evento.pos)
+                        self.__atender_clic__(evento.pos)
 
-            self.__dibujar__()
-            pygame.display.flip()
-            self.__reloj__.tick(30) 
+                if evento.type == pygame.KEYDOWN and evento.key == pygame.K_F3 and self.__perfil__ is not None:
+                    self.__mostrar_perfil__ = not self.__mostrar_perfil__
+
+                if evento.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                    redibujar_todo = True
+
+            regiones = self.__dibujar__()
+            with self.__medir__('presentar'):
+                if redibujar_todo:
+                    pygame.display.flip()
+                elif regiones:
+                    pygame.display.update(regiones)
+            if self.__perfil__ is not None:
+                self.__perfil__.cuadro((time.perf_counter() - inicio) * 1000.0)
+
+        if self.__perfil__ is not None:
+            self.__perfil__.registrar()
 
         pygame.quit()
         sys.exit()
 
+    def __espera_proximo_temporizador__(self):
+        """
+        Milisegundos hasta el próximo temporizador (vencimiento del mensaje de
+        error o refresco del overlay de rendimiento), o 0 (esperar sin límite)
+        si no hay ninguno pendiente.
+        """
+        esperas = []
+        if self.__mensaje_error__ is not None:
+            esperas.append(max(1, DURACION_ERROR - (pygame.time.get_ticks() - self.__tiempo_error__)))
+        if self.__perfil__ is not None and self.__mostrar_perfil__:
+            esperas.append(PERIODO_PERFIL)
+        return min(esperas) if esperas else 0
+
+    def __atender_clic__(self, pos):
+        """
+        Maneja un clic; con la instrumentación activa mide el clic completo
+        ('clic') y cada llamada al core hecha durante él ('core.<método>').
+        """
+        if self.__perfil__ is None:
+            self.__manejar_clic__(pos)
+            return
+        juego = self.__juego__
+        self.__juego__ = LlamadasMedidas(juego, self.__perfil__, 'core')
+        try:
+            with self.__perfil__.medir('clic'):
+                self.__manejar_clic__(pos)
+        finally:
+            self.__juego__ = juego
+
     def __manejar_clic__(self, pos):
         if self.__juego__.verificar_victoria(): 
             return
@@ -967,13 +1206,8 @@ class InterfazPygame:
                     # si el dado es EXACTO o si es MAYOR y es la ficha más alejada en casa.
                     if self.__juego__.jugador_puede_sacar_fichas():
                         color_char = 'B' if jugador.obtener_color() == 'blanco' else 'N'
-                        en_casa = (0 <= indice_punto <= 5) if color_char == 'B' else (18 <= indice_punto <= 23)
-                        if en_casa:
-                            if color_char == 'B':
-                                dado_necesario = indice_punto + 1
-                            else:
-                                dado_necesario = 24 - indice_punto
-
+                        dado_necesario = DADO_SALIDA[INDICE_COLOR[color_char]][indice_punto]
+                        if dado_necesario is not None:
                             if valor_dado == dado_necesario:
                                 movimientos_posibles[-1] = valor_dado
                             elif valor_dado > dado_necesario:
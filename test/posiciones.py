@@ -0,0 +1,24 @@
+"""
+Ayudas compartidas por las pruebas para armar posiciones de prueba.
+Las posiciones se dan como {índice: conteo con signo} (positivo 'B', negativo 'N').
+"""
+from core.board import Tablero
+
+
+def conteos_de(puntos) -> list:
+    """Devuelve los 24 conteos con signo de una posición {índice: conteo}."""
+    conteos = [0] * 24
+    for indice, fichas in puntos.items():
+        conteos[indice] = fichas
+    return conteos
+
+
+def cargar(tablero: Tablero, puntos, barra=(0, 0), fuera=(0, 0)) -> Tablero:
+    """Carga la posición {índice: conteo} en 'tablero' y lo devuelve."""
+    tablero.cargar_posicion(conteos_de(puntos), barra, fuera)
+    return tablero
+
+
+def tablero_con(puntos, barra=(0, 0), fuera=(0, 0)) -> Tablero:
+    """Tablero nuevo con la posición {índice: conteo}."""
+    return cargar(Tablero(), puntos, barra, fuera)
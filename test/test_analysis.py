@@ -0,0 +1,186 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from core.board import Tablero
+from core.dice import Dado
+from core.game import Game
+from core.notation import leer_jugada, texto_jugada
+from core.position_id import codificar_id_posicion
+from engine.analysis import (AnalisisPartida, ResumenJugadores, analizar, analizar_partida, clasificar,
+                             leer_partidas, main, _DadoGrabado)
+from engine.policies import PoliticaAleatoria
+from engine.search import Buscador
+from test.posiciones import cargar
+
+
+def grabar_partida(semilla, turnos=12):
+    """Juega una partida con jugadas aleatorias y la devuelve en el formato grabado."""
+    juego = Game("Ana", "Beto", Dado(semilla=semilla))
+    politica = PoliticaAleatoria(semilla)
+    registro = {'id': f"p{semilla}", 'blancas': "Ana", 'negras': "Beto", 'turnos': []}
+    for _ in range(turnos):
+        color = 'B' if juego.mostrar_jugador_actual().obtener_color() == 'blanco' else 'N'
+        dados = juego.tirar_dados()
+        if juego.consumir_motivo_auto_pase():
+            registro['turnos'].append({'dados': list(dados), 'jugada': ""})
+            continue
+        jugada = politica.elegir(juego.obtener_tablero(), color, list(juego.obtener_movimientos_disponibles()),
+                                 juego.generar_jugadas_legales())
+        registro['turnos'].append({'dados': list(dados), 'jugada': texto_jugada(jugada)})
+        juego.aplicar_jugada(jugada)
+        if juego.verificar_victoria():
+            break
+        juego.cambiar_turno()
+    return registro
+
+
+class TestAnalysis(unittest.TestCase):
+    """Pruebas unitarias para el análisis de partidas grabadas."""
+
+    def setUp(self):
+        self.buscador = Buscador(profundidad=1)
+
+    def test_clasificar(self):
+        self.assertEqual(clasificar(0.0), 'correcta')
+        self.assertEqual(clasificar(0.05), 'dudosa')
+        self.assertEqual(clasificar(0.1), 'error')
+        self.assertEqual(clasificar(0.5), 'grave')
+
+    def test_analizar_partida(self):
+        registro = grabar_partida(3)
+        analisis = analizar_partida(registro, self.buscador)
+        self.assertIsInstance(analisis, AnalisisPartida)
+        self.assertIsNone(analisis.error)
+        self.assertEqual(analisis.jugadores, {'B': "Ana", 'N': "Beto"})
+        self.assertTrue(analisis.decisiones)
+        for decision in analisis.decisiones:
+            grabada = registro['turnos'][decision.turno - 1]
+            self.assertEqual(decision.dados, tuple(grabada['dados']))
+            self.assertEqual(leer_jugada(decision.jugada), leer_jugada(grabada['jugada']))
+            self.assertGreaterEqual(decision.perdida, 0.0)
+            self.assertAlmostEqual(decision.perdida, decision.equidad_mejor - decision.equidad_jugada)
+            self.assertEqual(decision.clasificacion, clasificar(decision.perdida))
+            self.assertEqual(decision.jugador, "Ana" if decision.color == 'B' else "Beto")
+
+    def test_jugada_mejor_no_pierde(self):
+        registro = grabar_partida(5, turnos=1)
+        primera = analizar_partida(registro, self.buscador).decisiones[0]
+        registro['turnos'][0]['jugada'] = primera.mejor
+        decision = analizar_partida(registro, self.buscador).decisiones[0]
+        self.assertEqual(decision.perdida, 0.0)
+        self.assertEqual(decision.clasificacion, 'correcta')
+
+    def test_jugada_ilegal(self):
+        registro = grabar_partida(3)
+        registro['turnos'][2]['jugada'] = "1/24"
+        analisis = analizar_partida(registro, self.buscador)
+        self.assertIn("Turno 3", analisis.error)
+        self.assertEqual(len(analisis.decisiones), 2)
+        registro['turnos'] = registro['turnos'][:2]
+        registro['turnos'][1]['jugada'] = ""
+        self.assertIsNotNone(analizar_partida(registro, self.buscador).error)
+
+    def test_desde_posicion_con_auto_pase(self):
+        # 'B' en la barra y las negras cierran los puntos de reingreso
+        tablero = Tablero()
+        conteos = [-2] * 6 + [0] * 18
+        conteos[10] = -3
+        conteos[20] = 14
+        tablero.cargar_posicion(conteos, barra=(1, 0))
+        registro = {'posicion': codificar_id_posicion(tablero, 'B', [2, 2, 2, 2]),
+                    'turnos': [{'dados': [6, 5], 'jugada': ""}, {'dados': [3, 1], 'jugada': "11/8 11/10"}]}
+        analisis = analizar_partida(registro, self.buscador)
+        self.assertIsNone(analisis.error)
+        self.assertEqual([(d.turno, d.color) for d in analisis.decisiones], [(2, 'N')])
+        registro['turnos'][0]['jugada'] = "barra/6"
+        self.assertIn("se pasa solo", analizar_partida(registro, self.buscador).error)
+
+    def test_termina_al_ganar(self):
+        tablero = Tablero()
+        cargar(tablero, {12: 1, 19: 1, 0: -1}, fuera=(13, 14))
+        registro = {'posicion': codificar_id_posicion(tablero, 'B'),
+                    'turnos': [{'dados': [6, 5], 'jugada': "13/19 20/fuera"},
+                               {'dados': [1, 1], 'jugada': "1/fuera"},
+                               {'dados': [1, 1], 'jugada': "19/20"}]}
+        analisis = analizar_partida(registro, self.buscador)
+        self.assertIsNone(analisis.error)
+        self.assertEqual([d.turno for d in analisis.decisiones], [1])
+
+    def test_dado_grabado_sin_tiradas(self):
+        dado = _DadoGrabado([(3, 1)])
+        self.assertEqual(dado.tirar(), (3, 1))
+        self.assertEqual(dado.obtener_valores(), (3, 1))
+        with self.assertRaises(ValueError):
+            dado.tirar()
+
+    def test_jugada_sin_evaluar(self):
+        registro = grabar_partida(3)
+        buscador = self.buscador
+
+        class BuscadorIncompleto:
+            """Evalúa sólo la primera jugada, como un buscador que poda la hecha."""
+
+            def obtener_tabla(self):
+                return None
+
+            def evaluar_jugadas(self, tablero, color, dados):
+                return buscador.evaluar_jugadas(tablero, color, dados)[:1]
+
+        completo = analizar_partida(registro, buscador)
+        analisis = analizar_partida(registro, BuscadorIncompleto())
+        perdida = next(d for d in completo.decisiones if d.jugada != d.mejor)
+        self.assertIn(f"Turno {perdida.turno}", analisis.error)
+        self.assertIn("no evaluó", analisis.error)
+        self.assertEqual(analisis.decisiones, [d for d in completo.decisiones if d.turno < perdida.turno])
+
+    def test_procesos_no_cambian_resultados(self):
+        registros = [grabar_partida(semilla, turnos=6) for semilla in range(3)]
+        uno = list(analizar(registros, procesos=1, profundidad=1))
+        dos = list(analizar(registros, procesos=2, profundidad=1))
+        self.assertEqual([a.partida for a in dos], ["p0", "p1", "p2"])
+        self.assertEqual([a.decisiones for a in uno], [a.decisiones for a in dos])
+        with self.assertRaises(ValueError):
+            list(analizar(registros, procesos=0))
+
+    def test_resumen_y_archivo(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'partidas.jsonl')
+            with open(ruta, 'w', encoding='utf-8') as archivo:
+                for semilla in (1, 2):
+                    archivo.write(json.dumps(grabar_partida(semilla, turnos=6)) + '\n\n')
+            resumen = ResumenJugadores()
+            for analisis in analizar(leer_partidas(ruta), profundidad=1):
+                resumen.agregar(analisis)
+        datos = resumen.como_dict()
+        self.assertEqual((datos['partidas'], datos['invalidas']), (2, 0))
+        ana = datos['jugadores']["Ana"]
+        self.assertEqual(ana['decisiones'], sum(ana[clase] for clase in ('correcta', 'dudosa', 'error', 'grave')))
+        self.assertAlmostEqual(ana['perdida_media'], ana['perdida'] / ana['decisiones'])
+        self.assertAlmostEqual(ana['tasa_errores'], (ana['error'] + ana['grave']) / ana['decisiones'])
+
+
+    @patch('builtins.print')
+    def test_main(self, mock_print):
+        with tempfile.TemporaryDirectory() as directorio:
+            entrada = os.path.join(directorio, 'partidas.jsonl')
+            salida = os.path.join(directorio, 'decisiones.jsonl')
+            rota = grabar_partida(2, turnos=4)
+            rota['turnos'][1]['jugada'] = "1/24"
+            with open(entrada, 'w', encoding='utf-8') as archivo:
+                for registro in (grabar_partida(1, turnos=4), rota):
+                    archivo.write(json.dumps(registro) + '\n')
+            main([entrada, '--procesos', '1', '--profundidad', '1', '--salida', salida])
+            with open(salida, encoding='utf-8') as archivo:
+                decisiones = [json.loads(linea) for linea in archivo]
+        impresos = [str(c.args[0]) for c in mock_print.call_args_list]
+        self.assertTrue(any(linea.startswith("Partida p2: Turno 2") for linea in impresos))
+        resumen = json.loads(impresos[-1])
+        self.assertEqual((resumen['partidas'], resumen['invalidas']), (2, 1))
+        self.assertEqual(len(decisiones), sum(j['decisiones'] for j in resumen['jugadores'].values()))
+        self.assertTrue(all(d['partida'] in ("p1", "p2") for d in decisiones))
+
+
+if __name__ == '__main__':
+    unittest.main()
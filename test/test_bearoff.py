@@ -0,0 +1,134 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from core.board import Tablero
+from core.moves import generar_jugadas
+from engine.bearoff import (
+    BaseFinales, generar_base, cantidad_posiciones, indice_posicion, posicion_de_indice,
+    sucesores, puntos_en_casa, main,
+)
+from test.posiciones import cargar
+
+
+class TestBearoff(unittest.TestCase):
+    """Pruebas unitarias para la base de finales de un solo lado."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directorio = tempfile.TemporaryDirectory()
+        cls.ruta = os.path.join(cls.directorio.name, 'finales.bin')
+        generar_base(cls.ruta, fichas=4)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directorio.cleanup()
+
+    def test_indice_biyectivo(self):
+        self.assertEqual(cantidad_posiciones(15), 54264)
+        self.assertEqual(indice_posicion((0,) * 6), 0)
+        vistos = set()
+        for indice in range(cantidad_posiciones(4)):
+            puntos = posicion_de_indice(indice, 4)
+            self.assertLessEqual(sum(puntos), 4)
+            self.assertEqual(indice_posicion(puntos), indice)
+            vistos.add(puntos)
+        self.assertEqual(len(vistos), cantidad_posiciones(4))
+
+    def test_sucesores(self):
+        # Una ficha en el punto 6 con 6-5: sale con el 6
+        self.assertEqual(sucesores((0, 0, 0, 0, 0, 1), [6, 5]), {(0,) * 6})
+        # Dos fichas en el punto 2 con 1-1: cuatro unos las sacan
+        self.assertEqual(sucesores((0, 2, 0, 0, 0, 0), [1, 1, 1, 1]), {(0,) * 6})
+        # Con 2-1 y fichas en 3 y 4: el dado mayor no saca la del 3 (hay una más lejana)
+        self.assertNotIn((0, 0, 0, 0, 0, 0), sucesores((0, 0, 1, 1, 0, 0), [2, 1]))
+
+    def test_coincide_con_expectimax_exhaustivo(self):
+        # 'N' con fichas en los índices 1 y 3 (lejos de las 'B'): la base debe dar
+        # las mismas tiradas esperadas que un expectimax sobre el tablero real
+        from engine.search import TIRADAS, dados_de_tirada
+        tablero = Tablero()
+        cargar(tablero, {10: 15, 1: -1, 3: -2}, fuera=(0, 12))
+        memoria = {}
+
+        def esperadas():
+            if tablero.hay_ganador('N'):
+                return 0.0
+            clave = tablero.obtener_hash()
+            if clave not in memoria:
+                total = 1.0
+                for tirada, probabilidad in TIRADAS:
+                    mejor = None
+                    for jugada in generar_jugadas(tablero, 'N', dados_de_tirada(tirada)):
+                        for origen, destino, _ in jugada:
+                            tablero.aplicar('N', origen, destino)
+                        valor = esperadas()
+                        for _ in jugada:
+                            tablero.deshacer()
+                        mejor = valor if mejor is None else min(mejor, valor)
+                    total += probabilidad * mejor
+                memoria[clave] = total
+            return memoria[clave]
+
+        with BaseFinales(self.ruta) as base:
+            indice = base.indice(puntos_en_casa(tablero, 'N'))
+            self.assertAlmostEqual(base.tiradas_esperadas(indice), esperadas(), places=5)
+
+    def test_distribuciones(self):
+        with BaseFinales(self.ruta) as base:
+            self.assertEqual(len(base), cantidad_posiciones(4))
+            self.assertEqual(base.obtener_fichas(), 4)
+            self.assertEqual(base.distribucion(0)[0], 1.0)
+            self.assertAlmostEqual(base.tiradas_esperadas(base.indice((1, 0, 0, 0, 0, 0))), 1.0)
+            # Una ficha en el 6: 27 de 36 tiradas la sacan en una
+            distribucion = base.distribucion(base.indice((0, 0, 0, 0, 0, 1)))
+            self.assertAlmostEqual(distribucion[1], 27 / 36, places=4)
+            self.assertAlmostEqual(sum(distribucion), 1.0, places=3)
+            mas_fichas = base.tiradas_esperadas(base.indice((0, 0, 0, 0, 0, 4)))
+            self.assertGreater(mas_fichas, base.tiradas_esperadas(base.indice((0, 0, 0, 0, 0, 1))))
+            igual = base.indice((0, 1, 0, 0, 0, 0))
+            self.assertEqual(base.probabilidad_ganar(igual, igual), 1.0)
+            with self.assertRaises(ValueError):
+                base.indice((5, 0, 0, 0, 0, 0))
+
+    def test_generacion_en_varios_procesos_es_identica(self):
+        ruta = os.path.join(self.directorio.name, 'paralela.bin')
+        generar_base(ruta, fichas=4, procesos=2)
+        with open(ruta, 'rb') as a, open(self.ruta, 'rb') as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_archivo_invalido(self):
+        ruta = os.path.join(self.directorio.name, 'roto.bin')
+        with open(ruta, 'wb') as archivo:
+            archivo.write(b'XXXX' + bytes(64))
+        with self.assertRaises(ValueError):
+            BaseFinales(ruta)
+        with self.assertRaises(ValueError):
+            generar_base(ruta, fichas=16)
+        vacio = os.path.join(self.directorio.name, 'vacio.bin')
+        open(vacio, 'wb').close()
+        with self.assertRaises(ValueError):
+            BaseFinales(vacio)
+
+    @patch('builtins.print')
+    def test_main(self, mock_print):
+        ruta = os.path.join(self.directorio.name, 'main.bin')
+        main(['--ruta', ruta, '--fichas', '3', '--procesos', '1'])
+        self.assertTrue(any('Nivel' in str(c.args[0]) for c in mock_print.call_args_list))
+        self.assertIn(f"{cantidad_posiciones(3)} posiciones", mock_print.call_args.args[0])
+        self.assertTrue(os.path.getsize(ruta) > 0)
+
+    def test_puntos_en_casa_desde_tablero(self):
+        tablero = Tablero()
+        self.assertIsNone(puntos_en_casa(tablero, 'B'))
+        cargar(tablero, {
+            23: 2,  # 'B' sale con 1
+            18: 1,  # 'B' sale con 6
+            0: -3,  # 'N' sale con 1
+        }, fuera=(12, 12))
+        self.assertEqual(puntos_en_casa(tablero, 'B'), (2, 0, 0, 0, 0, 1))
+        self.assertEqual(puntos_en_casa(tablero, 'N'), (3, 0, 0, 0, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
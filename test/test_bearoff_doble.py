@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from core.board import Tablero
+from engine.bearoff_doble import TablaFinalesDoble, generar_tabla, main
+from engine.search import Buscador
+from test.posiciones import cargar, conteos_de
+
+
+class TestBearoffDoble(unittest.TestCase):
+    """Pruebas unitarias para la tabla de finales de dos lados."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directorio = tempfile.TemporaryDirectory()
+        cls.ruta = os.path.join(cls.directorio.name, 'finales2.bin')
+        generar_tabla(cls.ruta, fichas=3)
+        cls.tabla = TablaFinalesDoble(cls.ruta)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tabla.cerrar()
+        cls.directorio.cleanup()
+
+    def test_probabilidades_conocidas(self):
+        tabla = self.tabla
+        self.assertEqual(tabla.obtener_fichas(), 3)
+        # Una ficha en el punto 1: sale siempre
+        self.assertEqual(tabla.probabilidad_ganar((1, 0, 0, 0, 0, 0), (3, 0, 0, 0, 0, 0)), 1.0)
+        # Una ficha en el 6 contra una en el 1: gana sólo si sale en la primera tirada
+        self.assertAlmostEqual(tabla.probabilidad_ganar((0, 0, 0, 0, 0, 1), (1, 0, 0, 0, 0, 0)),
+                               27 / 36, places=4)
+        # Tener el turno es ventaja en posiciones iguales
+        self.assertGreater(tabla.probabilidad_ganar((0, 0, 0, 0, 0, 3), (0, 0, 0, 0, 0, 3)), 0.5)
+        self.assertTrue(tabla.cubre((0, 0, 1, 1, 1, 0)))
+        self.assertFalse(tabla.cubre((0, 0, 1, 1, 1, 1)))
+        with self.assertRaises(ValueError):
+            tabla.probabilidad_ganar((4, 0, 0, 0, 0, 0), (1, 0, 0, 0, 0, 0))
+
+    def test_generacion_en_varios_procesos_es_identica(self):
+        ruta = os.path.join(self.directorio.name, 'paralela.bin')
+        generar_tabla(ruta, fichas=3, procesos=2)
+        with open(ruta, 'rb') as a, open(self.ruta, 'rb') as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_consultar_desde_tablero(self):
+        tablero = Tablero()
+        self.assertIsNone(self.tabla.consultar(tablero, 'B'))
+        cargar(tablero, {
+            18: 1,  # 'B': una ficha que sale con 6
+            0: -1,  # 'N': una ficha que sale con 1
+        }, fuera=(14, 14))
+        self.assertAlmostEqual(self.tabla.consultar(tablero, 'B'), 27 / 36, places=4)
+        self.assertEqual(self.tabla.consultar(tablero, 'N'), 1.0)
+
+    def test_sin_fichas_fuera_no_consulta(self):
+        # 'N' todavía no sacó ninguna ficha: si pierde es gammon, que la tabla no cubre
+        tablero = Tablero()
+        conteos = conteos_de({18: 1, 0: -1})
+        tablero.cargar_posicion(conteos, fuera=(14, 0))
+        self.assertIsNone(self.tabla.consultar(tablero, 'B'))
+        self.assertIsNone(self.tabla.consultar(tablero, 'N'))
+        # Lo mismo si la que no sacó ninguna es 'B'
+        tablero.cargar_posicion(conteos, fuera=(0, 14))
+        self.assertIsNone(self.tabla.consultar(tablero, 'B'))
+        self.assertIsNone(self.tabla.consultar(tablero, 'N'))
+        tablero.cargar_posicion(conteos, fuera=(14, 0))
+        # A profundidad 1 las hojas son las posiciones de 'N' con 0 fichas fuera
+        buscador = Buscador(profundidad=1, finales=self.tabla, carreras=False)
+        buscador.buscar(tablero, 'B', [2, 1])
+        estadisticas = buscador.obtener_estadisticas()
+        self.assertEqual(estadisticas.consultas_finales, 0)
+        self.assertGreater(estadisticas.nodos, 0)
+
+    def test_buscador_responde_desde_la_tabla(self):
+        tablero = Tablero()
+        cargar(tablero, {23: 2, 22: 1, 0: -2, 1: -1}, fuera=(12, 12))
+        buscador = Buscador(profundidad=3, finales=self.tabla)
+        _, valor = buscador.buscar(tablero, 'B', [2, 1])
+        estadisticas = buscador.obtener_estadisticas()
+        self.assertGreater(estadisticas.consultas_finales, 0)
+        self.assertEqual(estadisticas.nodos_azar, 0)
+        self.assertTrue(-1.0 <= valor <= 1.0)
+
+    def test_archivo_invalido(self):
+        ruta = os.path.join(self.directorio.name, 'roto.bin')
+        with open(ruta, 'wb') as archivo:
+            archivo.write(b'BGB2' + bytes(32))
+        with self.assertRaises(ValueError):
+            TablaFinalesDoble(ruta)
+        with self.assertRaises(ValueError):
+            generar_tabla(ruta, fichas=9)
+        vacio = os.path.join(self.directorio.name, 'vacio.bin')
+        open(vacio, 'wb').close()
+        with self.assertRaises(ValueError):
+            TablaFinalesDoble(vacio)
+
+    def test_fuera_de_la_tabla(self):
+        # 'B' tiene 4 fichas en casa y la tabla cubre hasta 3
+        tablero = Tablero()
+        cargar(tablero, {18: 4, 0: -1}, fuera=(11, 14))
+        self.assertIsNone(self.tabla.consultar(tablero, 'B'))
+        self.assertIsNone(self.tabla.consultar(tablero, 'N'))
+
+    @patch('builtins.print')
+    def test_main(self, mock_print):
+        ruta = os.path.join(self.directorio.name, 'main.bin')
+        main(['--ruta', ruta, '--fichas', '2', '--procesos', '2'])
+        self.assertTrue(any('Nivel' in str(c.args[0]) for c in mock_print.call_args_list))
+        self.assertIn(ruta, mock_print.call_args.args[0])
+        with TablaFinalesDoble(ruta) as tabla:
+            self.assertEqual(tabla.obtener_fichas(), 2)
+            self.assertEqual(tabla.probabilidad_ganar((1, 0, 0, 0, 0, 0), (1, 0, 0, 0, 0, 0)), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
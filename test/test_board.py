@@ -1,7 +1,11 @@
+import random
 import unittest
-from core.board import Tablero
+from core.board import Tablero, BARRA, FUERA
 from core.checker import Ficha 
+from core.moves import generar_jugadas
+from core.tables import PIPS
 from unittest.mock import patch
+from test.posiciones import cargar, conteos_de
 
 class TestTablero(unittest.TestCase):
     """Pruebas unitarias para la clase Tablero (estable)."""
@@ -13,28 +17,28 @@ class TestTablero(unittest.TestCase):
     def test_inicializacion_tablero(self):
         self.assertEqual(len(self.tablero.__puntos__), 24)
         estado = self.tablero.obtener_estado()
-        self.assertEqual(estado[0], ['N', 'N'])
-        self.assertEqual(estado[23], ['B', 'B'])
+        self.assertEqual(estado[0], ['B', 'B'])
+        self.assertEqual(estado[23], ['N', 'N'])
 
     def test_obtener_estado(self):
         estado = self.tablero.obtener_estado()
         self.assertIsInstance(self.tablero.__puntos__[0][0], Ficha)
-        self.assertEqual(estado[0][0], 'N')
+        self.assertEqual(estado[0][0], 'B')
 
     def test_mover_ficha_valido(self):
-        self.tablero.mover_ficha(0, 1, 'N')
+        self.tablero.mover_ficha(23, 22, 'N')
         estado = self.tablero.obtener_estado()
-        self.assertEqual(estado[0], ['N'])
-        self.assertEqual(estado[1], ['N'])
+        self.assertEqual(estado[23], ['N'])
+        self.assertEqual(estado[22], ['N'])
 
     def test_mover_ficha_con_captura_automatica_blanca(self):
-        self.tablero.__puntos__[5] = [Ficha('B')]
-        self.tablero.mover_ficha(0, 5, 'N')
+        self.tablero.__puntos__[20] = [Ficha('B')]
+        self.tablero.mover_ficha(23, 20, 'N')
         self.assertEqual(len(self.tablero.__barra_blanco__), 1)
 
     def test_mover_ficha_con_captura_negra(self):
-        self.tablero.__puntos__[20] = [Ficha('N')]
-        self.tablero.mover_ficha(23, 20, 'B')
+        self.tablero.__puntos__[3] = [Ficha('N')]
+        self.tablero.mover_ficha(0, 3, 'B')
         self.assertEqual(len(self.tablero.__barra_negro__), 1)
 
     def test_mover_ficha_indices_invalidos(self):
@@ -50,13 +54,13 @@ class TestTablero(unittest.TestCase):
             self.tablero.mover_ficha(1, 2, 'N')
         self.assertEqual(str(context.exception), "No hay ficha del color especificado en el punto de origen.")
         with self.assertRaises(ValueError) as context:
-            self.tablero.mover_ficha(0, 1, 'B')
+            self.tablero.mover_ficha(23, 22, 'B')
         self.assertEqual(str(context.exception), "No hay ficha del color especificado en el punto de origen.")
 
     def test_mover_ficha_destino_bloqueado(self):
-        self.tablero.__puntos__[1] = [Ficha('B'), Ficha('B')]
+        self.tablero.__puntos__[22] = [Ficha('B'), Ficha('B')]
         with self.assertRaises(ValueError) as context:
-            self.tablero.mover_ficha(0, 1, 'N')
+            self.tablero.mover_ficha(23, 22, 'N')
         self.assertEqual(str(context.exception), "Movimiento inválido: el punto de destino está bloqueado.")
 
     def test_reincorporar_ficha_indice_invalido(self):
@@ -99,7 +103,7 @@ class TestTablero(unittest.TestCase):
 
     def test_reincorporar_ficha_blanco_valido(self):
         self.tablero.__barra_blanco__.append(Ficha('B'))
-        self.tablero.reincorporar_ficha('B', 5)
+        self.tablero.reincorporar_ficha('B', 3)
         self.assertEqual(self.tablero.__barra_blanco__, [])
 
     def test_reincorporar_ficha_negro_valido(self):
@@ -108,11 +112,11 @@ class TestTablero(unittest.TestCase):
         self.assertEqual(self.tablero.__barra_negro__, [])
 
     def test_sacar_ficha_valido_blanco(self):
-        self.tablero.sacar_ficha(23, 'B')
+        self.tablero.sacar_ficha(18, 'B')
         self.assertEqual(len(self.tablero.__fuera_blanco__), 1)
 
     def test_sacar_ficha_valido_negro(self):
-        self.tablero.sacar_ficha(0, 'N')
+        self.tablero.sacar_ficha(5, 'N')
         self.assertEqual(len(self.tablero.__fuera_negro__), 1)
 
     def test_sacar_ficha_error(self):
@@ -120,7 +124,7 @@ class TestTablero(unittest.TestCase):
             self.tablero.sacar_ficha(1, 'B')
         self.assertEqual(str(context.exception), "No hay ficha de ese color para sacar.")
         with self.assertRaises(ValueError) as context:
-            self.tablero.sacar_ficha(0, 'B')
+            self.tablero.sacar_ficha(23, 'B')
         self.assertEqual(str(context.exception), "No hay ficha de ese color para sacar.")
 
     def test_hay_ganador_todos_los_casos(self):
@@ -147,7 +151,7 @@ class TestTablero(unittest.TestCase):
     @patch('builtins.print')
     def test_mostrar_tablero(self, mock_print):
         self.tablero.mostrar_tablero()
-        mock_print.assert_any_call("Punto 1: ['N', 'N']")
+        mock_print.assert_any_call("Punto 1: ['B', 'B']")
 
     def test_todas_las_fichas_en_casa(self):
         self.assertFalse(self.tablero.todas_las_fichas_en_casa('B'))
@@ -183,5 +187,225 @@ class TestTablero(unittest.TestCase):
         self.tablero.__puntos__ = [[] for _ in range(24)]
         self.assertIsNone(self.tablero._get_farthest_checker_in_home('B'))
         self.assertIsNone(self.tablero._get_farthest_checker_in_home('N'))
+
+    def test_obtener_conteos_compactos(self):
+        conteos = self.tablero.obtener_conteos()
+        self.assertEqual(len(conteos), 24)
+        self.assertEqual(conteos[0], 2)
+        self.assertEqual(conteos[23], -2)
+        self.assertEqual(sum(c for c in conteos if c > 0), 15)
+        self.assertEqual(-sum(c for c in conteos if c < 0), 15)
+
+    def test_accesos_de_solo_lectura(self):
+        vista = self.tablero.vista_conteos()
+        self.assertEqual(list(vista), self.tablero.obtener_conteos())
+        with self.assertRaises(TypeError):
+            vista[0] = 5
+        self.tablero.aplicar('B', 0, 1)
+        self.assertEqual(vista[1], 1)
+        self.assertEqual(self.tablero.obtener_mascara('B') & 0b11, 0b11)
+        self.assertEqual(self.tablero.obtener_mascara('N'), (1 << 5) | (1 << 7) | (1 << 12) | (1 << 23))
+        self.tablero.cargar_posicion([0] * 24, barra=(1, 2), fuera=(14, 13))
+        self.assertEqual(self.tablero.obtener_barra(), (1, 2))
+        self.assertEqual(self.tablero.obtener_fuera(), (14, 13))
+        self.assertEqual(self.tablero.obtener_mascara('B'), 0)
+
+    def test_vista_puntos_refleja_movimientos(self):
+        self.tablero.mover_ficha(0, 1, 'B')
+        self.assertEqual(self.tablero.obtener_conteos()[1], 1)
+        self.assertEqual([f.obtener_color() for f in self.tablero.__puntos__[1]], ['B'])
+        self.assertEqual(sum(1 for _ in self.tablero.__puntos__), 24)
+
+    def test_vista_puntos_rechaza_colores_mezclados(self):
+        with self.assertRaises(ValueError):
+            self.tablero.__puntos__[3] = [Ficha('B'), Ficha('N')]
+        with self.assertRaises(ValueError):
+            self.tablero.__puntos__ = [[] for _ in range(23)]
+
+    def test_vista_pila_barra_y_fuera(self):
+        barra = self.tablero.__barra_negro__
+        barra.append(Ficha('N'))
+        barra.append(Ficha('N'))
+        self.assertEqual(self.tablero.obtener_fichas_barra('N'), 2)
+        self.assertEqual(barra.pop().obtener_color(), 'N')
+        self.assertEqual(len(barra), 1)
+        self.assertEqual(barra[0].obtener_color(), 'N')
+        self.assertEqual(repr(barra), "[Ficha('N')]")
+        self.assertNotEqual(barra, 3)
+        barra.clear()
+        self.assertEqual(barra, [])
+        with self.assertRaises(IndexError):
+            barra.pop()
+        with self.assertRaises(ValueError):
+            barra.append(Ficha('B'))
+        with self.assertRaises(ValueError):
+            self.tablero.__fuera_blanco__ = [Ficha('N')]
+
+    def test_hash_incremental_coincide_con_recalculo(self):
+        hash_inicial = self.tablero.obtener_hash()
+        self.tablero.mover_ficha(0, 1, 'B')
+        self.assertNotEqual(self.tablero.obtener_hash(), hash_inicial)
+        self.tablero.__puntos__[20] = [Ficha('B')]
+        self.tablero.mover_ficha(23, 20, 'N')
+        self.tablero.reincorporar_ficha('B', 3)
+        self.tablero.sacar_ficha(18, 'B')
+        actual = self.tablero.obtener_hash()
+        self.assertEqual(self.tablero._recalcular_hash(), actual)
+
+    def test_hash_independiente_del_orden_de_movimientos(self):
+        otro = Tablero()
+        self.tablero.mover_ficha(0, 1, 'B')
+        self.tablero.mover_ficha(12, 14, 'N')
+        otro.mover_ficha(12, 14, 'N')
+        otro.mover_ficha(0, 1, 'B')
+        self.assertEqual(self.tablero.obtener_hash(), otro.obtener_hash())
+        self.assertEqual(Tablero().obtener_hash(), Tablero().obtener_hash())
+
+    def test_hash_incluye_turno(self):
+        self.assertEqual(self.tablero.obtener_hash('B'), self.tablero.obtener_hash())
+        self.assertNotEqual(self.tablero.obtener_hash('N'), self.tablero.obtener_hash('B'))
+
+    def test_vista_puntos_rechaza_mas_de_15_fichas(self):
+        with self.assertRaises(ValueError):
+            self.tablero.__puntos__[3] = [Ficha('B')] * 16
+        with self.assertRaises(ValueError):
+            self.tablero.__fuera_negro__ = [Ficha('N')] * 16
+
+    def test_aplicar_y_deshacer_restauran_posicion_exacta(self):
+        cargar(self.tablero, {20: -1, 23: 2, 19: 3}, barra=(1, 0), fuera=(0, 2))
+        inicial = (self.tablero.obtener_conteos(), self.tablero.obtener_hash())
+        self.assertTrue(self.tablero.aplicar('B', 23, 20))
+        self.assertEqual(self.tablero.obtener_fichas_barra('N'), 1)
+        self.assertFalse(self.tablero.aplicar('B', BARRA, 3))
+        self.assertFalse(self.tablero.aplicar('B', 19, FUERA))
+        self.assertFalse(self.tablero.aplicar('N', BARRA, 22))
+        self.assertEqual(self.tablero.movimientos_aplicados(), 4)
+        self.assertEqual(self.tablero._recalcular_hash(), self.tablero.obtener_hash())
+        for _ in range(4):
+            self.tablero.deshacer()
+        self.assertEqual((self.tablero.obtener_conteos(), self.tablero.obtener_hash()), inicial)
+        self.assertEqual(self.tablero.obtener_fichas_barra('B'), 1)
+        self.assertEqual(self.tablero.obtener_fichas_barra('N'), 0)
+        self.assertEqual(self.tablero.obtener_fichas_fuera('N'), 2)
+        self.assertEqual(self.tablero.obtener_fichas_fuera('B'), 0)
+
+    def test_deshacer_sin_movimientos(self):
+        with self.assertRaises(ValueError):
+            self.tablero.deshacer()
+
+    def test_agregados_posicion_inicial(self):
+        # Posición estándar: 2 en el punto 24, 5 en el 13, 3 en el 8 y 5 en el 6
+        # de cada color -> pips = 2*24 + 5*13 + 3*8 + 5*6
+        self.assertEqual(self.tablero.obtener_pips('B'), 167)
+        self.assertEqual(self.tablero.obtener_pips('N'), 167)
+        self.assertEqual(self.tablero.fichas_fuera_de_casa('B'), 10)
+        self.assertEqual(self.tablero.fichas_fuera_de_casa('N'), 10)
+        self.assertEqual(self.tablero.punto_mas_lejano('B'), 0)
+        self.assertEqual(self.tablero.punto_mas_lejano('N'), 23)
+
+    def test_mover_baja_los_pips_en_el_valor_del_dado(self):
+        for color in ('B', 'N'):
+            for dado in range(1, 7):
+                for jugada in generar_jugadas(self.tablero, color, [dado]):
+                    (origen, destino, _), = jugada
+                    if destino == FUERA:
+                        continue
+                    antes = self.tablero.obtener_pips(color)
+                    self.tablero.aplicar(color, origen, destino)
+                    self.assertEqual(self.tablero.obtener_pips(color), antes - dado)
+                    self.tablero.deshacer()
+
+    def test_pips_bajan_en_cada_jugada_hasta_cero(self):
+        # Partidas al azar desde la posición inicial: toda jugada legal baja los
+        # pips de quien mueve, y los pips son 0 sólo con las 15 fichas fuera
+        azar = random.Random(3)
+        for _ in range(3):
+            tablero = Tablero()
+            color = 'B'
+            for _ in range(2000):
+                d1, d2 = azar.randint(1, 6), azar.randint(1, 6)
+                dados = [d1] * 4 if d1 == d2 else [d1, d2]
+                jugada = azar.choice(generar_jugadas(tablero, color, dados))
+                antes = tablero.obtener_pips(color)
+                for origen, destino, _ in jugada:
+                    tablero.aplicar(color, origen, destino)
+                if jugada:
+                    self.assertLess(tablero.obtener_pips(color), antes)
+                for c in ('B', 'N'):
+                    self.assertEqual(tablero.obtener_pips(c) == 0, tablero.obtener_fichas_fuera(c) == 15)
+                if tablero.hay_ganador(color):
+                    break
+                color = 'N' if color == 'B' else 'B'
+            self.assertTrue(tablero.hay_ganador(color))
+            self.assertEqual(tablero.obtener_pips(color), 0)
+
+    def test_agregados_incrementales_coinciden_con_recalculo(self):
+        self.tablero.__puntos__[20] = [Ficha('B')]
+        self.tablero.mover_ficha(23, 20, 'N')
+        self.assertEqual(self.tablero.punto_mas_lejano('B'), BARRA)
+        self.tablero.reincorporar_ficha('B', 2)
+        self.tablero.sacar_ficha(5, 'N')
+        self.tablero.aplicar('B', 0, 1)
+        self.tablero.__barra_negro__.append(Ficha('N'))
+        self.assertEqual(self.tablero.punto_mas_lejano('N'), BARRA)
+        incrementales = (
+            [self.tablero.obtener_pips('B'), self.tablero.obtener_pips('N')],
+            [self.tablero.fichas_fuera_de_casa('B'), self.tablero.fichas_fuera_de_casa('N')],
+        )
+        pips, fuera_de_casa, _ = self.tablero._recalcular_agregados()
+        self.assertEqual(incrementales, (pips, fuera_de_casa))
+        self.tablero.deshacer()
+        self.assertEqual(self.tablero.punto_mas_lejano('B'), 0)
+
+    def test_hay_contacto(self):
+        self.assertTrue(self.tablero.hay_contacto())
+        # 'B' avanza hacia índices mayores y 'N' hacia menores: ya se cruzaron
+        conteos = conteos_de({20: 2, 3: -2})
+        self.tablero.cargar_posicion(conteos, fuera=(13, 13))
+        self.assertFalse(self.tablero.hay_contacto())
+        # 'B' en 20 vuelve a 2: queda detrás de las negras del 3
+        self.tablero.aplicar('B', 20, 2)
+        self.assertTrue(self.tablero.hay_contacto())
+        self.tablero.deshacer()
+        self.assertFalse(self.tablero.hay_contacto())
+        self.tablero.cargar_posicion(conteos, barra=(0, 1), fuera=(13, 12))
+        self.assertTrue(self.tablero.hay_contacto())
+        conteos[3] = 0
+        self.tablero.cargar_posicion(conteos, fuera=(13, 15))
+        self.assertFalse(self.tablero.hay_contacto())
+
+    def test_hay_contacto_si_se_puede_golpear(self):
+        cargar(self.tablero, {3: 1, 9: -1}, fuera=(14, 14))
+        self.assertTrue(self.tablero.hay_contacto())
+        jugadas = generar_jugadas(self.tablero, 'B', [6, 1])
+        self.assertIn(((3, 9, 6), (9, 10, 1)), jugadas)
+        self.tablero.aplicar('B', 3, 9)
+        self.assertEqual(self.tablero.obtener_fichas_barra('N'), 1)
+
+    def test_hay_contacto_coincide_con_las_distancias(self):
+        # Hay contacto si alguna 'N' está delante de alguna 'B' en el recorrido de 'B'
+        azar = random.Random(5)
+        tablero = Tablero()
+        color = 'B'
+        for _ in range(400):
+            d1, d2 = azar.randint(1, 6), azar.randint(1, 6)
+            for origen, destino, _ in azar.choice(generar_jugadas(tablero, color, [d1, d2])):
+                tablero.aplicar(color, origen, destino)
+            if tablero.hay_ganador(color):
+                tablero = Tablero()
+            color = 'N' if color == 'B' else 'B'
+            conteos = tablero.obtener_conteos()
+            blancas = [PIPS[0][i] for i in range(24) if conteos[i] > 0]
+            negras = [PIPS[0][i] for i in range(24) if conteos[i] < 0]
+            esperado = (tablero.obtener_fichas_barra('B') + tablero.obtener_fichas_barra('N') > 0
+                        or (blancas and negras and max(blancas) > min(negras)))
+            self.assertEqual(tablero.hay_contacto(), bool(esperado))
+
+    def test_punto_mas_lejano_sin_fichas(self):
+        self.tablero.cargar_posicion([0] * 24, fuera=(15, 15))
+        self.assertIsNone(self.tablero.punto_mas_lejano('B'))
+        self.assertIsNone(self.tablero.punto_mas_lejano('N'))
+        self.assertEqual(self.tablero.obtener_pips('B'), 0)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
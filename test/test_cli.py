@@ -242,6 +242,58 @@ class TestCLI(unittest.TestCase):
             self.assertTrue(seguir)
             self.assertTrue(any('Error:' in ' '.join(map(str, c.args)) for c in mock_print.call_args_list))
 
+    def test_menu_turno_pista_es_la_ultima_opcion(self):
+        j = MagicMock()
+        j.jugador_puede_sacar_fichas.return_value = True
+        self.cli.__juego__ = j
+        with patch.object(self.cli, '__leer_entero_en_rango__', return_value=6) as mock_leer, \
+             patch.object(self.cli, '__mostrar_pista__') as mock_pista:
+            seguir = self.cli.__menu_turno__(tiene_fichas_en_barra=False)
+            self.assertTrue(seguir)
+            mock_pista.assert_called_once()
+            mock_leer.assert_called_once_with("Opción", 1, 6)
+        with patch.object(self.cli, '__leer_entero_en_rango__', return_value=4), \
+             patch.object(self.cli, '__mostrar_pista__') as mock_pista:
+            self.assertTrue(self.cli.__menu_turno__(tiene_fichas_en_barra=True))
+            mock_pista.assert_called_once()
+
+    def test_mostrar_pista_con_juego_real(self):
+        from core.game import Game
+        self.cli = CLI(cantidad_pistas=2, tiempo_pista=0.2)
+        self.cli.__juego__ = Game("A", "B")
+        self.cli.__juego__.__movimientos_disponibles__ = [6, 5]
+        with patch('builtins.print') as mock_print:
+            self.cli.__mostrar_pista__()
+        lineas = [' '.join(map(str, c.args)) for c in mock_print.call_args_list]
+        self.assertTrue(lineas[0].startswith("Pista (profundidad"))
+        self.assertEqual(len(lineas), 3)
+        self.assertIn("equidad", lineas[1])
+        self.assertEqual(self.cli.__juego__.obtener_tablero().movimientos_aplicados(), 0)
+
+    def test_mostrar_pista_sin_tiempo(self):
+        from core.game import Game
+        self.cli = CLI(cantidad_pistas=2, tiempo_pista=1e-9)
+        self.cli.__juego__ = Game("A", "B")
+        self.cli.__juego__.__movimientos_disponibles__ = [6, 5]
+        with patch('builtins.print') as mock_print:
+            self.cli.__mostrar_pista__()
+        lineas = [' '.join(map(str, c.args)) for c in mock_print.call_args_list]
+        self.assertTrue(lineas[0].startswith("Pista (evaluación estática"))
+        self.assertEqual(len(lineas), 3)
+
+    def test_mostrar_pista_error(self):
+        self.cli.__juego__ = MagicMock()
+        self.cli.__juego__.obtener_tablero.side_effect = Exception('x')
+        with patch('builtins.print') as mock_print:
+            self.cli.__mostrar_pista__()
+        self.assertTrue(any('No se pudo calcular la pista' in ' '.join(map(str, c.args))
+                            for c in mock_print.call_args_list))
+
+    def test_formatear_jugada(self):
+        self.assertEqual(CLI.__formatear_jugada__(((11, 5, 6), (16, 11, 5))), "12/6 17/12")
+        self.assertEqual(CLI.__formatear_jugada__(((24, 20, 4), (18, -1, 6))), "barra/21 19/fuera")
+        self.assertEqual(CLI.__formatear_jugada__(()), "(sin movimientos)")
+
     # --- __encabezado_turno__ ---
     @patch('builtins.print')
     def test_encabezado_turno_muestra_dados_restantes(self, mock_print):
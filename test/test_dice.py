@@ -122,5 +122,71 @@ class TestDado(unittest.TestCase):
         for valor in valores1 + valores2:
             self.assertIn(valor, range(1, 7))
 
+    def test_semilla_reproducible(self):
+        """Verifica que dos dados con la misma semilla tiran la misma secuencia."""
+        dado1 = Dado(semilla=42)
+        dado2 = Dado(semilla=42)
+        tiradas = [dado1.tirar() for _ in range(50)]
+        self.assertEqual(tiradas, [dado2.tirar() for _ in range(50)])
+        dado1.sembrar(42)
+        self.assertEqual(tiradas, [dado1.tirar() for _ in range(50)])
+
+    def test_sembrar_sin_generador(self):
+        """Verifica que sembrar() en un dado por defecto pasa a usar un generador propio."""
+        self.dado.sembrar(42)
+        otro = Dado(semilla=42)
+        self.assertEqual([self.dado.tirar() for _ in range(20)], [otro.tirar() for _ in range(20)])
+
+    def test_set_dados_actualiza_todas_las_variantes(self):
+        """Verifica que _set_dado1/_set_dado2 escriben todos los nombres de atributo."""
+        self.dado._set_dado1(3)
+        self.dado._set_dado2(5)
+        for nombre in Dado.__dado1_variantes__:
+            self.assertEqual(getattr(self.dado, nombre), 3)
+        for nombre in Dado.__dado2_variantes__:
+            self.assertEqual(getattr(self.dado, nombre), 5)
+        self.assertEqual(self.dado.obtener_valores(), (3, 5))
+
+    @patch('core.dice.random.randint')
+    def test_rng_inyectado_no_usa_el_modulo_global(self, mock_randint):
+        """Verifica que con un generador propio no se llama a random.randint."""
+        import random
+        dado = Dado(rng=random.Random(1))
+        d1, d2 = dado.tirar()
+        self.assertEqual(mock_randint.call_count, 0)
+        self.assertEqual(dado.obtener_valores(), (d1, d2))
+        self.assertEqual(dado._Dado__dado1__, d1)
+
+    def test_lote_sirve_desde_buffer(self):
+        """Verifica el modo en lote: mismos valores válidos y reproducibles entre lotes."""
+        dado = Dado(semilla=7, lote=4)
+        tiradas = [dado.tirar() for _ in range(10)]
+        self.assertTrue(all(v in range(1, 7) for t in tiradas for v in t))
+        otro = Dado(semilla=7, lote=4)
+        self.assertEqual(tiradas, [otro.tirar() for _ in range(10)])
+
+    def test_generador_numpy(self):
+        """Verifica que acepta un numpy.random.Generator (con y sin lote)."""
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover
+            self.skipTest("numpy no está instalado")
+        for lote in (0, 8):
+            dado = Dado(rng=numpy.random.default_rng(3), lote=lote)
+            tiradas = [dado.tirar() for _ in range(20)]
+            self.assertTrue(all(type(v) is int and 1 <= v <= 6 for t in tiradas for v in t))
+            dado.sembrar(3)
+            self.assertEqual(tiradas, [dado.tirar() for _ in range(20)])
+
+    def test_parametros_invalidos(self):
+        """Verifica los errores de configuración del generador."""
+        import random
+        with self.assertRaises(ValueError):
+            Dado(rng=random.Random(1), semilla=1)
+        with self.assertRaises(ValueError):
+            Dado(lote=-1)
+        with self.assertRaises(TypeError):
+            Dado(rng=object())
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
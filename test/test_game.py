@@ -2,6 +2,7 @@ from core.game import Game
 import unittest
 from unittest.mock import patch, MagicMock
 from core.checker import Ficha # <--- ¡ESTA LÍNEA ES CRUCIAL!
+from test.posiciones import cargar
 
 class TestGame(unittest.TestCase):
     """Pruebas unitarias para la clase Game (estable)."""
@@ -36,13 +37,20 @@ class TestGame(unittest.TestCase):
             self.assertEqual(resultado, (4, 4))
             self.assertEqual(self.juego.__movimientos_disponibles__, [4, 4, 4, 4])
 
+    def test_dados_inyectados_con_semilla(self):
+        from core.dice import Dado
+        juego1 = Game("A", "B", Dado(semilla=11))
+        juego2 = Game("A", "B", Dado(semilla=11))
+        self.assertEqual([juego1.mostrar_dados().tirar() for _ in range(5)],
+                         [juego2.mostrar_dados().tirar() for _ in range(5)])
+
     def test_mover_ficha_valido_con_dados(self):
         self.juego.__movimientos_disponibles__ = [5]
         # Ponemos una ficha 'B' en el origen para que sea válido
-        self.juego.__tablero__.__puntos__[18] = [Ficha('B')]
+        self.juego.__tablero__.__puntos__[13] = [Ficha('B')]
         with patch.object(self.juego.__tablero__, 'mover_ficha') as mock_mover:
-            self.juego.mover_ficha(18, 13)
-            mock_mover.assert_called_with(18, 13, 'B')
+            self.juego.mover_ficha(13, 18)
+            mock_mover.assert_called_with(13, 18, 'B')
         self.assertEqual(self.juego.__movimientos_disponibles__, [])
 
     def test_mover_ficha_juego_terminado(self):
@@ -59,35 +67,35 @@ class TestGame(unittest.TestCase):
     def test_mover_ficha_direccion_incorrecta(self):
         self.juego.__movimientos_disponibles__ = [5, 6]
         # Ponemos una ficha 'B' en el origen
-        self.juego.__tablero__.__puntos__[18] = [Ficha('B')]
+        self.juego.__tablero__.__puntos__[13] = [Ficha('B')]
         with self.assertRaises(ValueError) as context:
-            self.juego.mover_ficha(18, 23) 
-        self.assertIn("solo pueden moverse a puntos menores", str(context.exception))
+            self.juego.mover_ficha(13, 8)
+        self.assertIn("solo pueden moverse a puntos mayores", str(context.exception))
         
         self.juego.cambiar_turno()
         self.juego.__movimientos_disponibles__ = [5, 6]
-        # (El punto 5 ya tiene fichas 'N' por defecto, así que no hace falta setup)
+        # (El punto 12 ya tiene fichas 'N' por defecto, así que no hace falta setup)
         with self.assertRaises(ValueError) as context:
-            self.juego.mover_ficha(5, 0)
-        self.assertIn("solo pueden moverse a puntos mayores", str(context.exception))
+            self.juego.mover_ficha(12, 17)
+        self.assertIn("solo pueden moverse a puntos menores", str(context.exception))
 
     def test_mover_ficha_dado_incorrecto(self):
         self.juego.__movimientos_disponibles__ = [3, 5]
-        self.juego.__tablero__.__puntos__[18] = [Ficha('B')] # Setup de origen
+        self.juego.__tablero__.__puntos__[13] = [Ficha('B')] # Setup de origen
         with self.assertRaises(ValueError) as context:
-            self.juego.mover_ficha(18, 17) # Necesita dado 1
+            self.juego.mover_ficha(13, 14) # Necesita dado 1
         self.assertIn("no está permitido por los dados", str(context.exception))
 
     # --- TEST CORREGIDO ---
     def test_mover_ficha_destino_bloqueado_desde_game(self):
         self.juego.__movimientos_disponibles__ = [1]
         # 1. Pone la ficha 'B' correcta en el origen
-        self.juego.__tablero__.__puntos__[18] = [Ficha('B')]
+        self.juego.__tablero__.__puntos__[13] = [Ficha('B')]
         # 2. Bloquea el destino
-        self.juego.__tablero__.__puntos__[17] = [Ficha('N'), Ficha('N')]
+        self.juego.__tablero__.__puntos__[14] = [Ficha('N'), Ficha('N')]
         
         with self.assertRaises(ValueError) as context:
-            self.juego.mover_ficha(18, 17)
+            self.juego.mover_ficha(13, 14)
         # 3. Ahora SÍ debe fallar por el bloqueo
         self.assertIn("punto de destino está bloqueado", str(context.exception))
 
@@ -340,10 +348,10 @@ class TestGame(unittest.TestCase):
 
     def test_autopass_sin_movimientos_y_sin_barra(self):
         self._limpiar_tablero()
-        # Una blanca en 18, y bloquear destinos 17 y 16
-        self.juego.__tablero__.__puntos__[18] = [Ficha('B')]
-        self.juego.__tablero__.__puntos__[17] = [Ficha('N'), Ficha('N')]
-        self.juego.__tablero__.__puntos__[16] = [Ficha('N'), Ficha('N')]
+        # Una blanca en 10, y bloquear destinos 11 y 12
+        self.juego.__tablero__.__puntos__[10] = [Ficha('B')]
+        self.juego.__tablero__.__puntos__[11] = [Ficha('N'), Ficha('N')]
+        self.juego.__tablero__.__puntos__[12] = [Ficha('N'), Ficha('N')]
         with patch('core.dice.random.randint', side_effect=[1, 2]):
             turno_inicial = self.juego.mostrar_jugador_actual()
             self.juego.tirar_dados()
@@ -364,9 +372,9 @@ class TestGame(unittest.TestCase):
 
     def test_no_autopass_si_hay_movimiento_normal(self):
         self._limpiar_tablero()
-        # Blanca en 18 con 17 libre; dado 1
-        self.juego.__tablero__.__puntos__[18] = [Ficha('B')]
-        self.juego.__tablero__.__puntos__[17] = []
+        # Blanca en 10 con 11 libre; dado 1
+        self.juego.__tablero__.__puntos__[10] = [Ficha('B')]
+        self.juego.__tablero__.__puntos__[11] = []
         with patch('core.dice.random.randint', side_effect=[1, 3]):
             turno_inicial = self.juego.mostrar_jugador_actual()
             self.juego.tirar_dados()
@@ -402,5 +410,11 @@ class TestGame(unittest.TestCase):
         self.assertNotEqual(self.juego.mostrar_jugador_actual(), turno_inicial)
         self.assertEqual(self.juego.consumir_motivo_auto_pase(), 'barra-bloqueada')
 
+    def test_hay_movimiento_legal_sacar_aunque_el_destino_este_bloqueado(self):
+        # Blanca sola en 20 (todas en casa); 20-4=16 bloqueado, pero el 4 la saca
+        cargar(self.juego.__tablero__, {20: 1, 16: -2}, fuera=(14, 13))
+        self.juego.__movimientos_disponibles__ = [4]
+        self.assertTrue(self.juego.__hay_movimiento_legal__())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,110 @@
+import unittest
+from core.board import Tablero, BARRA, FUERA
+from core.game import Game
+from core.moves import generar_jugadas, submovimientos
+from test.posiciones import cargar
+
+
+class TestMoves(unittest.TestCase):
+    """Pruebas unitarias para el generador de jugadas legales."""
+
+    def setUp(self):
+        self.tablero = Tablero()
+
+    def _cargar(self, puntos, barra=(0, 0), fuera=(0, 0)):
+        cargar(self.tablero, puntos, barra, fuera)
+
+    def _aplicar_con_game(self, jugada, color, dados):
+        """Aplica la jugada con los métodos validados de Game (falla si es ilegal)."""
+        juego = Game("A", "B")
+        juego.obtener_tablero().cargar_posicion(
+            self.tablero.obtener_conteos(), self.tablero.obtener_barra(), self.tablero.obtener_fuera())
+        if color == 'N':
+            juego.cambiar_turno()
+        juego.__movimientos_disponibles__ = list(dados)
+        for origen, destino, dado in jugada:
+            if origen == BARRA:
+                juego.reincorporar_ficha_desde_barra(destino)
+            elif destino == FUERA:
+                # Game elige el dado al sacar: forzar el que indica la jugada
+                restantes = list(juego.__movimientos_disponibles__)
+                restantes.remove(dado)
+                juego.__movimientos_disponibles__ = [dado]
+                juego.sacar_ficha_del_tablero(origen)
+                juego.__movimientos_disponibles__ = restantes
+            else:
+                juego.mover_ficha(origen, destino)
+        return juego.obtener_tablero().obtener_hash()
+
+    def test_posicion_inicial_jugadas_distintas_y_validas(self):
+        hash_inicial = self.tablero.obtener_hash()
+        jugadas = generar_jugadas(self.tablero, 'B', [3, 5])
+        self.assertEqual(self.tablero.obtener_hash(), hash_inicial)
+        self.assertTrue(jugadas)
+        finales = set()
+        for jugada in jugadas:
+            self.assertEqual(len(jugada), 2)
+            finales.add(self._aplicar_con_game(jugada, 'B', [3, 5]))
+        self.assertEqual(len(finales), len(jugadas))
+
+    def test_dobles_usan_cuatro_submovimientos(self):
+        jugadas = generar_jugadas(self.tablero, 'N', [2, 2, 2, 2])
+        self.assertTrue(jugadas)
+        for jugada in jugadas:
+            self.assertEqual(len(jugada), 4)
+            self._aplicar_con_game(jugada, 'N', [2, 2, 2, 2])
+
+    def test_reingreso_desde_barra_obligatorio(self):
+        self._cargar({0: -2, 23: 3}, barra=(1, 0))
+        jugadas = generar_jugadas(self.tablero, 'B', [1, 4])
+        # El 1 entra en 0 (bloqueado); sólo puede entrar con el 4
+        for jugada in jugadas:
+            self.assertEqual(jugada[0][:2], (BARRA, 3))
+        self.assertEqual(submovimientos(self.tablero, 'B', 1), [])
+
+    def test_regla_del_dado_mayor(self):
+        # Una blanca en 10: con 6 va a 16, con 2 va a 12; el 18 está bloqueado
+        self._cargar({10: 1, 18: -2}, fuera=(14, 13))
+        jugadas = generar_jugadas(self.tablero, 'B', [2, 6])
+        self.assertEqual(jugadas, [((10, 16, 6),)])
+
+    def test_sacar_con_dado_mayor_desde_la_mas_lejana(self):
+        self._cargar({20: 1, 22: 1}, fuera=(13, 15))
+        jugadas = generar_jugadas(self.tablero, 'B', [6, 5])
+        sacan_ambas = [j for j in jugadas if all(d == FUERA for _, d, _ in j)]
+        self.assertEqual(len(sacan_ambas), 1)
+        for jugada in jugadas:
+            self._aplicar_con_game(jugada, 'B', [6, 5])
+
+    def test_sin_movimientos_devuelve_jugada_vacia(self):
+        self._cargar({0: -2, 1: -2}, barra=(1, 0))
+        self.assertEqual(generar_jugadas(self.tablero, 'B', [1, 2]), [()])
+        self.assertEqual(generar_jugadas(self.tablero, 'B', []), [()])
+
+    def test_game_generar_y_aplicar_jugada(self):
+        juego = Game("A", "B")
+        juego.__movimientos_disponibles__ = [3, 5]
+        jugadas = juego.generar_jugadas_legales()
+        juego.aplicar_jugada(jugadas[0])
+        self.assertEqual(juego.obtener_movimientos_disponibles(), [])
+        self.assertEqual(juego.obtener_tablero().movimientos_aplicados(), 0)
+
+    def test_game_aplicar_jugada_ilegal(self):
+        juego = Game("A", "B")
+        juego.__movimientos_disponibles__ = [3, 5]
+        hash_inicial = juego.obtener_tablero().obtener_hash()
+        with self.assertRaises(ValueError):
+            juego.aplicar_jugada(((5, 2, 3),))
+        with self.assertRaises(ValueError):
+            # Sólo un submovimiento cuando se pueden usar los dos dados
+            juego.aplicar_jugada(((0, 3, 3),))
+        with self.assertRaises(ValueError):
+            juego.aplicar_jugada(((0, 4, 4),))
+        self.assertEqual(juego.obtener_tablero().obtener_hash(), hash_inicial)
+        juego.__juego_terminado__ = True
+        with self.assertRaises(ValueError):
+            juego.aplicar_jugada(())
+
+
+if __name__ == '__main__':
+    unittest.main()
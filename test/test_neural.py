@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from core.board import Tablero, FUERA
+from core.moves import generar_jugadas
+from engine.evaluation import evaluar_carrera
+from engine.neural import RedNeuronal, codificar, codificar_lote, ENTRADAS, SALIDAS
+from engine.policies import crear_politica
+from test.posiciones import cargar
+
+
+class TestNeural(unittest.TestCase):
+    """Pruebas unitarias para el evaluador con red neuronal."""
+
+    def setUp(self):
+        self.tablero = Tablero()
+        self.red = RedNeuronal(ocultas=16, semilla=1)
+
+    def test_codificacion(self):
+        x = codificar(self.tablero, 'B')
+        self.assertEqual(x.shape, (ENTRADAS,))
+        # Punto 1 (índice 0): 2 blancas -> unidades 1, 1, 0, 0
+        self.assertEqual(list(x[0:4]), [1.0, 1.0, 0.0, 0.0])
+        # Punto 12 (índice 11): 5 blancas -> (5 - 3) / 2 = 1
+        self.assertEqual(list(x[11 * 4:11 * 4 + 4]), [1.0, 1.0, 1.0, 1.0])
+        # Punto 13 (índice 12): 5 negras en el bloque de 'N'
+        self.assertEqual(list(x[99 + 12 * 4:99 + 12 * 4 + 4]), [1.0, 1.0, 1.0, 1.0])
+        self.assertEqual((x[98], x[197]), (1.0, 0.0))
+        self.assertEqual((codificar(self.tablero, 'N')[98], codificar(self.tablero, 'N')[197]), (0.0, 1.0))
+        self.assertEqual(codificar_lote([self.tablero, self.tablero], 'B').shape, (2, ENTRADAS))
+
+    def test_probabilidades_y_equidad(self):
+        probabilidades = self.red.probabilidades(self.tablero, 'B')
+        self.assertEqual(probabilidades.shape, (SALIDAS,))
+        self.assertTrue(np.all((probabilidades > 0) & (probabilidades < 1)))
+        equidad = self.red.evaluar(self.tablero, 'B')
+        esperado = (2 * probabilidades[0] - 1 + probabilidades[1] - probabilidades[3]
+                    + probabilidades[2] - probabilidades[4])
+        self.assertAlmostEqual(equidad, esperado)
+        self.assertAlmostEqual(self.red(self.tablero, 'B'), equidad)
+
+    def test_lote_igual_a_una_por_una(self):
+        jugadas = generar_jugadas(self.tablero, 'B', [6, 5])
+        equidades = self.red.evaluar_jugadas(self.tablero, 'B', jugadas)
+        self.assertEqual(self.tablero.movimientos_aplicados(), 0)
+        for jugada, valor in zip(jugadas, equidades):
+            for origen, destino, _ in jugada:
+                self.tablero.aplicar('B', origen, destino)
+            self.assertAlmostEqual(valor, -self.red.evaluar(self.tablero, 'N'))
+            for _ in jugada:
+                self.tablero.deshacer()
+
+    def test_jugada_ganadora_vale_el_final(self):
+        cargar(self.tablero, {23: 1, 0: -1}, fuera=(14, 14))
+        jugadas = [((23, FUERA, 1),), ((23, 22, 1),)]
+        self.assertEqual(self.red.evaluar_jugadas(self.tablero, 'B', jugadas)[0], 1.0)
+        politica = crear_politica('red', red=self.red)
+        self.assertEqual(politica.elegir(self.tablero, 'B', [1], jugadas), jugadas[0])
+
+    def test_carreras_sin_red(self):
+        cargar(self.tablero, {20: 2, 3: -2}, fuera=(13, 13))
+        self.assertEqual(self.red.evaluar(self.tablero, 'B'), evaluar_carrera(self.tablero, 'B'))
+        jugadas = generar_jugadas(self.tablero, 'B', [1, 2])
+        equidades = self.red.evaluar_jugadas(self.tablero, 'B', jugadas)
+        for jugada, valor in zip(jugadas, equidades):
+            for origen, destino, _ in jugada:
+                self.tablero.aplicar('B', origen, destino)
+            self.assertAlmostEqual(valor, -self.red.evaluar(self.tablero, 'N'))
+            for _ in jugada:
+                self.tablero.deshacer()
+        self.red.carreras = False
+        self.assertNotEqual(self.red.evaluar(self.tablero, 'B'), evaluar_carrera(self.tablero, 'B'))
+
+    def test_entrenar_lote_reduce_la_perdida(self):
+        x = np.stack([codificar(self.tablero, 'B'), codificar(self.tablero, 'N')])
+        objetivos = np.array([[1.0, 0, 0, 0, 0], [0.0, 0, 0, 1, 0]])
+        primera = self.red.entrenar_lote(x, objetivos, alfa=1.0)
+        for _ in range(20):
+            ultima = self.red.entrenar_lote(x, objetivos, alfa=1.0)
+        self.assertLess(ultima, primera)
+        parametros = self.red.obtener_parametros()
+        self.assertEqual(parametros.shape, (self.red.cantidad_parametros(),))
+        copia = RedNeuronal(ocultas=16, semilla=7)
+        copia.fijar_parametros(parametros)
+        self.assertAlmostEqual(copia.evaluar(self.tablero, 'B'), self.red.evaluar(self.tablero, 'B'))
+
+    def test_guardar_y_cargar(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'red.npz')
+            self.red.guardar(ruta)
+            cargada = RedNeuronal.cargar(ruta)
+            self.assertEqual(cargada.obtener_ocultas(), 16)
+            self.assertAlmostEqual(cargada.evaluar(self.tablero, 'N'), self.red.evaluar(self.tablero, 'N'))
+            np.savez(ruta, w1=np.zeros((3, 3)), b1=np.zeros(3), w2=np.zeros((3, 5)), b2=np.zeros(5))
+            with self.assertRaises(ValueError):
+                RedNeuronal.cargar(ruta)
+        with self.assertRaises(ValueError):
+            RedNeuronal(ocultas=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
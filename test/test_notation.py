@@ -0,0 +1,29 @@
+import unittest
+from core.board import BARRA, FUERA
+from core.notation import leer_jugada, texto_jugada
+
+
+class TestNotation(unittest.TestCase):
+    """Pruebas unitarias para la notación de jugadas de la CLI."""
+
+    def test_texto_jugada(self):
+        self.assertEqual(texto_jugada([(11, 5, 6), (16, 11, 5)]), "12/6 17/12")
+        self.assertEqual(texto_jugada([(BARRA, 20, 4), (18, FUERA, 6)]), "barra/21 19/fuera")
+        self.assertEqual(texto_jugada([(11, 5)]), "12/6")
+        self.assertEqual(texto_jugada([]), "")
+
+    def test_leer_jugada(self):
+        self.assertEqual(leer_jugada("12/6 17/12"), [(11, 5), (16, 11)])
+        self.assertEqual(leer_jugada("Barra/21 19/fuera"), [(BARRA, 20), (18, FUERA)])
+        self.assertEqual(leer_jugada(""), [])
+        for texto in ("12-6", "25/3", "x/3", "12/6/1"):
+            with self.assertRaises(ValueError):
+                leer_jugada(texto)
+
+    def test_ida_y_vuelta(self):
+        texto = "barra/21 13/7 19/fuera"
+        self.assertEqual(texto_jugada(leer_jugada(texto)), texto)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest.mock import patch
+from core.board import Tablero
+from core.moves import generar_jugadas
+from engine.opening import LibroAperturas, JugadaLibro, clave_tirada, generar_libro, guardar_libro, main
+from engine.policies import crear_politica
+from engine.search import Buscador
+
+
+class TestOpening(unittest.TestCase):
+    """Pruebas unitarias para el libro de aperturas."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directorio = tempfile.TemporaryDirectory()
+        cls.ruta = os.path.join(cls.directorio.name, 'aperturas.bin')
+        # Una sola candidata: las jugadas salen del evaluador estático, sin rollouts
+        cls.entradas = generar_libro(cls.ruta, profundidad=2, candidatos=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directorio.cleanup()
+
+    def test_clave_tirada(self):
+        self.assertEqual(clave_tirada([6, 5]), (5, 6))
+        self.assertEqual(clave_tirada([3, 3, 3, 3]), (3, 3))
+        self.assertIsNone(clave_tirada([5]))
+        self.assertIsNone(clave_tirada([3, 3, 3]))
+
+    def test_primera_tirada_y_respuestas(self):
+        libro = LibroAperturas(self.ruta)
+        self.assertEqual(len(libro), self.entradas)
+        tablero = Tablero()
+        for dados in ([6, 5], [1, 2], [4, 4, 4, 4]):
+            entrada = libro.consultar(tablero, 'B', dados)
+            self.assertIn(entrada.jugada, generar_jugadas(tablero, 'B', dados))
+        # Respuesta del rival tras la jugada del libro
+        for origen, destino, _ in libro.consultar(tablero, 'B', [3, 1]).jugada:
+            tablero.aplicar('B', origen, destino)
+        respuesta = libro.consultar(tablero, 'N', [6, 2])
+        self.assertIn(respuesta.jugada, generar_jugadas(tablero, 'N', [6, 2]))
+        # Fuera del libro: el rival no tiene otra tirada guardada en esa posición
+        self.assertIsNone(libro.consultar(tablero, 'B', [6, 2]))
+        self.assertIsNone(libro.consultar(Tablero(), 'B', [5]))
+        self.assertEqual((libro.aciertos, libro.fallos), (5, 2))
+
+    def test_carga_diferida_y_serializable(self):
+        libro = LibroAperturas(os.path.join(self.directorio.name, 'no_existe.bin'))
+        copia = pickle.loads(pickle.dumps(libro))
+        with self.assertRaises(FileNotFoundError):
+            copia.consultar(Tablero(), 'B', [6, 5])
+        ruta = os.path.join(self.directorio.name, 'redondeo.bin')
+        jugada = ((0, 6, 6), (6, 11, 5))
+        guardar_libro(ruta, {(Tablero().obtener_hash('B'), (5, 6)): JugadaLibro(jugada, 0.1234)})
+        self.assertEqual(LibroAperturas(ruta).consultar(Tablero(), 'B', [5, 6]), (jugada, 0.123))
+
+    def test_jugadas_elegidas_con_rollouts(self):
+        ruta = os.path.join(self.directorio.name, 'rollouts.bin')
+        self.assertEqual(generar_libro(ruta, profundidad=1, candidatos=2, pruebas=2), 21)
+        libro = LibroAperturas(ruta)
+        for tirada in ([6, 5], [2, 1], [3, 3, 3, 3]):
+            entrada = libro.consultar(Tablero(), 'B', tirada)
+            self.assertIn(entrada.jugada, generar_jugadas(Tablero(), 'B', tirada))
+            self.assertTrue(-3.0 <= entrada.equidad <= 3.0)
+
+    def test_rollouts_truncados_no_se_guardan(self):
+        # Un turno nunca alcanza para terminar: ninguna posición tiene pruebas terminadas
+        ruta = os.path.join(self.directorio.name, 'truncado.bin')
+        self.assertEqual(generar_libro(ruta, profundidad=2, candidatos=2, pruebas=2, truncamiento=1), 0)
+        self.assertEqual(len(LibroAperturas(ruta)), 0)
+
+    def test_buscador_consulta_el_libro(self):
+        tablero = Tablero()
+        libro = LibroAperturas(self.ruta)
+        buscador = Buscador(profundidad=3, libro=libro)
+        jugada, valor = buscador.buscar(tablero, 'B', [6, 5])
+        self.assertEqual((jugada, valor), tuple(libro.consultar(tablero, 'B', [6, 5])))
+        self.assertEqual(buscador.obtener_estadisticas().aciertos_libro, 1)
+        self.assertEqual(buscador.obtener_estadisticas().nodos, 0)
+        politica = crear_politica('busqueda', profundidad=1, libro=libro)
+        self.assertEqual(politica.elegir(tablero, 'B', [6, 5], generar_jugadas(tablero, 'B', [6, 5])), jugada)
+
+    def test_archivo_invalido(self):
+        ruta = os.path.join(self.directorio.name, 'roto.bin')
+        with open(ruta, 'wb') as archivo:
+            archivo.write(b'BGA1' + bytes(10))
+        with self.assertRaises(ValueError):
+            LibroAperturas(ruta).consultar(Tablero(), 'B', [6, 5])
+        with self.assertRaises(ValueError):
+            generar_libro(ruta, profundidad=0)
+        with self.assertRaises(ValueError):
+            generar_libro(ruta, candidatos=0)
+        with open(ruta, 'wb') as archivo:
+            archivo.write(b'BGA1')
+        with self.assertRaises(ValueError):
+            len(LibroAperturas(ruta))
+        larga = tuple((5, 4, 1) for _ in range(5))
+        with self.assertRaises(ValueError):
+            guardar_libro(ruta, {(1, (1, 1)): JugadaLibro(larga, 0.0)})
+
+    @patch('builtins.print')
+    def test_main(self, mock_print):
+        ruta = os.path.join(self.directorio.name, 'main.bin')
+        main(['--ruta', ruta, '--profundidad', '1', '--candidatos', '1', '--pruebas', '1',
+              '--truncamiento', '1', '--procesos', '1'])
+        self.assertTrue(any('Posiciones' in str(c.args[0]) for c in mock_print.call_args_list))
+        self.assertIn("21 entradas", mock_print.call_args.args[0])
+        self.assertEqual(len(LibroAperturas(ruta)), 21)
+
+
+if __name__ == '__main__':
+    unittest.main()
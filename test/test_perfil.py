@@ -0,0 +1,86 @@
+import json
+import os
+import tempfile
+import unittest
+from core.game import Game
+from pygame_ui.perfil import Instrumentacion, LlamadasMedidas, percentil
+
+
+class TestPerfil(unittest.TestCase):
+    """Pruebas unitarias para la instrumentación de rendimiento de la interfaz."""
+
+    def test_percentil(self):
+        muestras = list(range(1, 101))
+        self.assertEqual(percentil(muestras, 50), 50)
+        self.assertEqual(percentil(muestras, 95), 95)
+        self.assertEqual(percentil(muestras, 99), 99)
+        self.assertEqual(percentil(muestras, 100), 100)
+        self.assertEqual(percentil(muestras, 0), 1)
+        self.assertEqual(percentil([7.5], 99), 7.5)
+        self.assertEqual(percentil([1, 2, 3, 4], 50), 2)
+        self.assertEqual(percentil([], 50), 0.0)
+
+    def test_resumen_y_ventana(self):
+        instrumentacion = Instrumentacion(ventana=10)
+        for valor in range(1, 26):
+            instrumentacion.agregar('fichas', float(valor))
+        instrumentacion.agregar('ui', 3.0)
+        resumen = instrumentacion.resumen()
+        # Sólo quedan las últimas 10 muestras (16..25)
+        self.assertEqual(resumen['fichas'], {'n': 10, 'p50': 20.0, 'p95': 25.0, 'p99': 25.0})
+        self.assertEqual(resumen['ui']['n'], 1)
+        with instrumentacion.medir('ui'):
+            pass
+        self.assertEqual(instrumentacion.resumen()['ui']['n'], 2)
+        lineas = instrumentacion.lineas()
+        self.assertTrue(lineas[0].startswith("FPS"))
+        self.assertTrue(lineas[2].endswith("fichas"))
+        self.assertTrue(lineas[3].endswith("ui"))
+
+    def test_fps(self):
+        instrumentacion = Instrumentacion(ventana=5)
+        self.assertEqual(instrumentacion.fps(), 0.0)
+        for _ in range(8):
+            instrumentacion.cuadro(1.0)
+        self.assertEqual(instrumentacion.resumen()['cuadro']['n'], 5)
+        self.assertGreater(instrumentacion.fps(), 0.0)
+
+    def test_registro_jsonl(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'perfil.jsonl')
+            instrumentacion = Instrumentacion(ruta_registro=ruta, intervalo_registro=0.0)
+            instrumentacion.agregar('tablero', 2.0)
+            instrumentacion.cuadro(4.0)
+            instrumentacion.cuadro(6.0)
+            with open(ruta, encoding='utf-8') as archivo:
+                lineas = [json.loads(linea) for linea in archivo]
+        self.assertEqual(len(lineas), 2)
+        for linea in lineas:
+            self.assertEqual(set(linea), {'tiempo', 'fps', 'etapas'})
+        self.assertEqual(lineas[-1]['etapas']['cuadro'], {'n': 2, 'p50': 4.0, 'p95': 6.0, 'p99': 6.0})
+        self.assertEqual(lineas[-1]['etapas']['tablero']['n'], 1)
+
+    def test_sin_ruta_no_registra(self):
+        instrumentacion = Instrumentacion(intervalo_registro=0.0)
+        instrumentacion.cuadro(1.0)
+        instrumentacion.registrar()
+        self.assertEqual(instrumentacion.resumen()['cuadro']['n'], 1)
+
+    def test_llamadas_medidas(self):
+        instrumentacion = Instrumentacion()
+        original = Game("Ana", "Beto")
+        juego = LlamadasMedidas(original, instrumentacion, 'core')
+        dados = juego.tirar_dados()
+        self.assertEqual(len(dados), 2)
+        juego.obtener_movimientos_disponibles()
+        juego.obtener_movimientos_disponibles()
+        resumen = instrumentacion.resumen()
+        self.assertEqual(set(resumen), {'core.tirar_dados', 'core.obtener_movimientos_disponibles'})
+        self.assertEqual(resumen['core.obtener_movimientos_disponibles']['n'], 2)
+        # Los atributos que no son métodos se devuelven sin medir
+        self.assertIs(juego.__tablero__, original.obtener_tablero())
+        self.assertEqual(set(instrumentacion.resumen()), set(resumen))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import base64
+import unittest
+from core.board import Tablero
+from core.game import Game
+from core.position_id import (
+    codificar_id_posicion, decodificar_id_posicion, tablero_desde_id, LARGO_ID
+)
+from test.posiciones import conteos_de
+
+
+class TestPositionId(unittest.TestCase):
+    """Pruebas unitarias para el ID compacto de posición."""
+
+    def setUp(self):
+        self.tablero = Tablero()
+
+    def test_ida_y_vuelta_posicion_inicial(self):
+        clave = codificar_id_posicion(self.tablero, 'B', [3, 5])
+        self.assertEqual(len(clave), LARGO_ID)
+        conteos, barra, fuera, color, dados = decodificar_id_posicion(clave)
+        self.assertEqual(conteos, self.tablero.obtener_conteos())
+        self.assertEqual(barra, (0, 0))
+        self.assertEqual(fuera, (0, 0))
+        self.assertEqual(color, 'B')
+        self.assertEqual(dados, [3, 5])
+
+    def test_ida_y_vuelta_con_barra_fuera_y_dobles(self):
+        conteos = conteos_de({18: 10, 3: -14})
+        self.tablero.cargar_posicion(conteos, barra=(2, 1), fuera=(3, 0))
+        clave = codificar_id_posicion(self.tablero, 'N', [4, 4, 4])
+        nuevo = tablero_desde_id(clave)
+        self.assertEqual(nuevo.obtener_conteos(), conteos)
+        self.assertEqual(nuevo.obtener_fichas_barra('B'), 2)
+        self.assertEqual(nuevo.obtener_fichas_barra('N'), 1)
+        self.assertEqual(nuevo.obtener_fichas_fuera('B'), 3)
+        self.assertEqual(nuevo.obtener_hash(), self.tablero.obtener_hash())
+        _, _, _, color, dados = decodificar_id_posicion(clave)
+        self.assertEqual((color, dados), ('N', [4, 4, 4]))
+
+    def test_sin_dados_y_un_dado(self):
+        self.assertEqual(decodificar_id_posicion(codificar_id_posicion(self.tablero))[4], [])
+        self.assertEqual(decodificar_id_posicion(codificar_id_posicion(self.tablero, 'B', [6]))[4], [6])
+
+    def test_codificar_rechaza_parametros_invalidos(self):
+        with self.assertRaises(ValueError):
+            codificar_id_posicion(self.tablero, 'X')
+        with self.assertRaises(ValueError):
+            codificar_id_posicion(self.tablero, 'B', [7])
+        with self.assertRaises(ValueError):
+            codificar_id_posicion(self.tablero, 'B', [1, 2, 3])
+
+    def test_decodificar_rechaza_ids_invalidos(self):
+        for clave in ("corto", "!!!!!!!!!!!!!!!!", "////////////////", "AAAAAAAAAAAAAAAA" + "AAAA"):
+            with self.assertRaises(ValueError):
+                decodificar_id_posicion(clave)
+        # Cabecera con 7 dados
+        bits = 7 << 1
+        with self.assertRaises(ValueError):
+            decodificar_id_posicion(self._id_desde_bits(bits))
+        # Dado con valor 0
+        with self.assertRaises(ValueError):
+            decodificar_id_posicion(self._id_desde_bits(1 << 1))
+        # Mismo punto ocupado por ambos colores (1 'B' y 1 'N' en el punto 0)
+        bits = 1 << 10
+        bits_n = 1 << (10 + 1 + 25 + 1)
+        with self.assertRaises(ValueError):
+            decodificar_id_posicion(self._id_desde_bits(bits | bits_n))
+
+    def test_decodificar_rechaza_mas_de_15_fichas(self):
+        bits = ((1 << 16) - 1) << 10
+        with self.assertRaises(ValueError):
+            decodificar_id_posicion(self._id_desde_bits(bits))
+
+    def test_cargar_posicion_valida_cantidades(self):
+        with self.assertRaises(ValueError):
+            self.tablero.cargar_posicion([0] * 23)
+        with self.assertRaises(ValueError):
+            self.tablero.cargar_posicion([16] + [0] * 23)
+        with self.assertRaises(ValueError):
+            self.tablero.cargar_posicion([0] * 24, barra=(-1, 0))
+        # Válido para el tablero, pero no representable como ID
+        self.tablero.cargar_posicion([15] + [0] * 23, barra=(1, 0))
+        with self.assertRaises(ValueError):
+            codificar_id_posicion(self.tablero)
+
+    def test_game_obtener_y_cargar_id(self):
+        juego = Game("A", "B")
+        juego.cambiar_turno()
+        juego.__movimientos_disponibles__ = [2, 6]
+        clave = juego.obtener_id_posicion()
+        otro = Game("C", "D")
+        otro.cargar_id_posicion(clave)
+        self.assertEqual(otro.mostrar_jugador_actual(), otro.mostrar_jugador2())
+        self.assertEqual(otro.obtener_movimientos_disponibles(), [2, 6])
+        self.assertEqual(otro.obtener_estado_tablero(), juego.obtener_estado_tablero())
+        self.assertEqual(otro.obtener_id_posicion(), clave)
+        otro.cargar_id_posicion(clave, cargar_dados=False)
+        self.assertEqual(otro.obtener_movimientos_disponibles(), [])
+        self.assertEqual(otro.obtener_estado_tablero(), juego.obtener_estado_tablero())
+
+    @staticmethod
+    def _id_desde_bits(bits):
+        return base64.b64encode(bits.to_bytes(12, 'little')).decode('ascii')
+
+
+if __name__ == '__main__':
+    unittest.main()
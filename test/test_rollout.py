@@ -0,0 +1,81 @@
+import unittest
+from core.board import Tablero, FUERA
+from core.game import Game
+from core.moves import generar_jugadas
+from engine.rollout import rollout, rollout_juego, ResultadoRollout
+from test.posiciones import cargar
+
+
+class TestRollout(unittest.TestCase):
+    """Pruebas unitarias para los rollouts Monte Carlo."""
+
+    def setUp(self):
+        self.tablero = Tablero()
+        cargar(self.tablero, {18: 2, 20: 2, 22: 1, 5: -2, 3: -2, 1: -1}, fuera=(10, 10))
+
+    def test_resultados_ordenados_con_intervalos(self):
+        resultados = rollout(self.tablero, 'B', [6, 2], pruebas=72, tamano_ronda=36)
+        medias = [r.media for r in resultados]
+        self.assertEqual(medias, sorted(medias, reverse=True))
+        mejor = resultados[0]
+        self.assertEqual(mejor.pruebas, 72)
+        self.assertEqual(mejor.truncadas, 0)
+        self.assertFalse(mejor.podada)
+        inferior, superior = mejor.intervalo()
+        self.assertLessEqual(inferior, mejor.media)
+        self.assertGreaterEqual(superior, mejor.media)
+        self.assertEqual(self.tablero.movimientos_aplicados(), 0)
+
+    def test_poda_detiene_candidatas_peores(self):
+        resultados = rollout(self.tablero, 'B', [1, 2], pruebas=144, tamano_ronda=36)
+        podadas = [r for r in resultados if r.podada]
+        self.assertTrue(podadas)
+        self.assertTrue(all(r.pruebas < 144 for r in podadas))
+        sin_poda = rollout(self.tablero, 'B', [6, 2], pruebas=72, podar=False)
+        self.assertTrue(all(r.pruebas == 72 and not r.podada for r in sin_poda))
+
+    def test_jugada_ganadora_sin_varianza(self):
+        cargar(self.tablero, {23: 1, 0: -1}, fuera=(14, 14))
+        resultados = rollout(self.tablero, 'B', jugadas=[((23, FUERA, 1),)], pruebas=10)
+        self.assertEqual(resultados[0].media, 1.0)
+        self.assertEqual(resultados[0].error_estandar(), 0.0)
+
+    def test_determinista_e_independiente_de_los_procesos(self):
+        opciones = dict(pruebas=36, truncamiento=2, podar=False, semilla=9)
+        en_serie = rollout(self.tablero, 'B', [4, 1], **opciones)
+        en_paralelo = rollout(self.tablero, 'B', [4, 1], procesos=2, **opciones)
+        self.assertEqual([r.jugada for r in en_serie], [r.jugada for r in en_paralelo])
+        for a, b in zip(en_serie, en_paralelo):
+            self.assertAlmostEqual(a.media, b.media)
+            self.assertEqual((a.pruebas, a.truncadas), (b.pruebas, b.truncadas))
+            self.assertAlmostEqual(a.media_truncadas, b.media_truncadas)
+
+    def test_partidas_con_contacto_terminan(self):
+        # Desde la posición inicial las pruebas se juegan hasta el final
+        tablero = Tablero()
+        jugadas = generar_jugadas(tablero, 'B', [3, 1])[:2]
+        resultados = rollout(tablero, 'B', jugadas=jugadas, pruebas=4, podar=False)
+        for resultado in resultados:
+            self.assertEqual((resultado.pruebas, resultado.truncadas), (4, 0))
+            self.assertTrue(-3.0 <= resultado.media <= 3.0)
+
+    def test_rollout_juego_y_errores(self):
+        juego = Game("A", "B")
+        juego.__movimientos_disponibles__ = [3, 1]
+        resultados = rollout_juego(juego, pruebas=4, truncamiento=1)
+        self.assertIsInstance(resultados[0], ResultadoRollout)
+        self.assertEqual(len(resultados), len(juego.generar_jugadas_legales()))
+        # Un turno no alcanza para terminar: todas las pruebas se cuentan como truncadas
+        for resultado in resultados:
+            self.assertEqual((resultado.pruebas, resultado.truncadas), (0, 4))
+            self.assertEqual(resultado.media, 0.0)
+        medias = [r.media_truncadas for r in resultados]
+        self.assertEqual(medias, sorted(medias, reverse=True))
+        with self.assertRaises(ValueError):
+            rollout(self.tablero, 'B')
+        with self.assertRaises(ValueError):
+            rollout(self.tablero, 'B', [6, 2], procesos=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
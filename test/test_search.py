@@ -0,0 +1,170 @@
+import unittest
+from core.board import Tablero, FUERA
+from engine.search import Buscador, TIRADAS, dados_de_tirada
+from engine.evaluation import evaluar_estatico, evaluar_carrera, conteo_efectivo, probabilidad_carrera, valor_final
+from test.posiciones import cargar, conteos_de
+
+
+class TestSearch(unittest.TestCase):
+    """Pruebas unitarias para el motor expectiminimax."""
+
+    def setUp(self):
+        # Carrera corta sin contacto: 'B' (hacia índices mayores) ya pasó a 'N'
+        self.tablero = Tablero()
+        cargar(self.tablero, {20: 2, 22: 1, 3: -2, 1: -1}, fuera=(12, 12))
+
+    def test_tiradas_suman_uno(self):
+        self.assertEqual(len(TIRADAS), 21)
+        self.assertAlmostEqual(sum(p for _, p in TIRADAS), 1.0)
+        self.assertEqual(dados_de_tirada((3, 3)), [3, 3, 3, 3])
+        self.assertEqual(dados_de_tirada((2, 5)), [2, 5])
+
+    def test_poda_no_cambia_el_valor(self):
+        # Posición con contacto (la inicial) para que los nodos de azar se expandan
+        tablero = Tablero()
+        sin_poda = Buscador(profundidad=2, star1=False, carreras=False)
+        con_star1 = Buscador(profundidad=2, star2=False, carreras=False)
+        con_star2 = Buscador(profundidad=2, carreras=False)
+        valores = []
+        for buscador in (sin_poda, con_star1, con_star2):
+            _, valor = buscador.buscar(tablero, 'B', [6, 1])
+            valores.append(valor)
+        self.assertAlmostEqual(valores[0], valores[1])
+        self.assertAlmostEqual(valores[0], valores[2])
+        self.assertLessEqual(con_star2.obtener_estadisticas().nodos,
+                             sin_poda.obtener_estadisticas().nodos)
+
+    def test_elige_la_jugada_ganadora(self):
+        cargar(self.tablero, {22: 1, 23: 1, 5: -2}, fuera=(13, 13))
+        jugada, valor = Buscador(profundidad=2).buscar(self.tablero, 'B', [2, 1])
+        self.assertTrue(all(destino == FUERA for _, destino, _ in jugada))
+        self.assertEqual(valor, 1.0)
+
+    def test_tablero_queda_intacto_y_estadisticas(self):
+        hash_inicial = self.tablero.obtener_hash()
+        buscador = Buscador(profundidad=2)
+        resultados = buscador.evaluar_jugadas(self.tablero, 'N', [4, 2])
+        self.assertEqual(self.tablero.obtener_hash(), hash_inicial)
+        self.assertEqual(self.tablero.movimientos_aplicados(), 0)
+        valores = [v for _, v in resultados]
+        self.assertEqual(valores, sorted(valores, reverse=True))
+        stats = buscador.obtener_estadisticas()
+        self.assertGreater(stats.nodos, 0)
+        self.assertGreater(stats.nodos_por_segundo(), 0)
+        self.assertFalse(stats.tiempo_agotado)
+        self.assertIn('cortes_star1', stats.como_dict())
+
+    def test_tiempo_limite_devuelve_alguna_jugada(self):
+        tablero = Tablero()
+        buscador = Buscador(profundidad=3, tiempo_limite=1e-9)
+        jugada, _ = buscador.buscar(tablero, 'B', [6, 5])
+        self.assertTrue(jugada)
+        self.assertTrue(buscador.obtener_estadisticas().tiempo_agotado)
+        self.assertEqual(tablero.movimientos_aplicados(), 0)
+        self.assertEqual(tablero.obtener_hash(), Tablero().obtener_hash())
+
+    def test_evaluador_de_carreras(self):
+        # 'B': 2 en el índice 20 y 1 en el 22; 'N': 2 en el 3 y 1 en el 1
+        self.assertFalse(self.tablero.hay_contacto())
+        self.assertEqual(self.tablero.obtener_pips('B'), 10)
+        # Puntos 5 y 6 del final del recorrido vacíos: +2 de desperdicio
+        self.assertEqual(conteo_efectivo(self.tablero, 'B'), 12)
+        self.assertEqual(conteo_efectivo(self.tablero, 'N'), 12)
+        # Posición simétrica: tener el turno es ventaja
+        self.assertGreater(probabilidad_carrera(self.tablero, 'B'), 0.5)
+        self.assertAlmostEqual(evaluar_carrera(self.tablero, 'B'), 2 * probabilidad_carrera(self.tablero, 'B') - 1)
+        conteos = conteos_de({23: 15, 0: -15})
+        self.tablero.cargar_posicion(conteos)
+        # Pips iguales, pero 14 fichas de más en el punto 1 desperdician 28 pips
+        self.assertEqual(conteo_efectivo(self.tablero, 'B') - self.tablero.obtener_pips('B'), 31)
+        conteos[0] = 0
+        conteos[5] = -15
+        self.tablero.cargar_posicion(conteos)
+        self.assertGreater(probabilidad_carrera(self.tablero, 'B'), probabilidad_carrera(self.tablero, 'N'))
+
+    def test_la_carrera_se_juega_hasta_el_final(self):
+        # Sin contacto ninguna jugada vuelve a cruzar las fichas y alguien termina sacando todas
+        buscador = Buscador(profundidad=1)
+        color = 'B'
+        for tirada, _ in TIRADAS * 2:
+            jugada, _ = buscador.buscar(self.tablero, color, dados_de_tirada(tirada))
+            for origen, destino, _ in jugada:
+                self.tablero.aplicar(color, origen, destino)
+            self.assertFalse(self.tablero.hay_contacto())
+            if self.tablero.hay_ganador(color):
+                break
+            color = 'N' if color == 'B' else 'B'
+        self.assertTrue(self.tablero.hay_ganador(color))
+        self.assertEqual(self.tablero.obtener_pips(color), 0)
+
+    def test_buscador_evalua_las_carreras_sin_buscar(self):
+        buscador = Buscador(profundidad=3)
+        _, valor = buscador.buscar(self.tablero, 'B', [6, 1])
+        estadisticas = buscador.obtener_estadisticas()
+        self.assertGreater(estadisticas.carreras, 0)
+        self.assertEqual(estadisticas.nodos_azar, 0)
+        self.assertTrue(-1.0 <= valor <= 1.0)
+        # Con contacto se busca normalmente
+        buscador.buscar(Tablero(), 'B', [6, 1], profundidad=2)
+        self.assertEqual(buscador.obtener_estadisticas().carreras, 0)
+        self.assertGreater(buscador.obtener_estadisticas().nodos_azar, 0)
+
+    def test_profundizacion_iterativa(self):
+        tablero = Tablero()
+        buscador = Buscador(profundidad=2)
+        resultados, profundidad = buscador.profundizar(tablero, 'B', [6, 5])
+        self.assertEqual(profundidad, 2)
+        self.assertFalse(buscador.obtener_estadisticas().tiempo_agotado)
+        esperados = Buscador(profundidad=2).evaluar_jugadas(tablero, 'B', [6, 5])
+        self.assertAlmostEqual(resultados[0][1], esperados[0][1])
+        self.assertEqual(len(resultados), len(esperados))
+        # Sin tiempo ni para la primera iteración: todas las jugadas con el evaluador estático
+        buscador = Buscador(profundidad=3)
+        resultados, profundidad = buscador.profundizar(tablero, 'B', [6, 5], tiempo_limite=1e-9)
+        self.assertEqual(profundidad, 0)
+        self.assertTrue(buscador.obtener_estadisticas().tiempo_agotado)
+        self.assertEqual(len(resultados), len(esperados))
+        valores = [v for _, v in resultados]
+        self.assertEqual(valores, sorted(valores, reverse=True))
+        self.assertEqual(tablero.movimientos_aplicados(), 0)
+
+    def test_profundizar_respeta_el_plazo(self):
+        # Posición con contacto y profundidad alta: el plazo corta la búsqueda
+        tablero = Tablero()
+        buscador = Buscador(profundidad=4)
+        resultados, _ = buscador.profundizar(tablero, 'B', [2, 1], tiempo_limite=0.2)
+        self.assertTrue(resultados)
+        self.assertLess(buscador.obtener_estadisticas().segundos, 0.3)
+        self.assertEqual(tablero.movimientos_aplicados(), 0)
+
+    def test_profundidad_invalida(self):
+        with self.assertRaises(ValueError):
+            Buscador(profundidad=0)
+
+    def test_buscar_en_juego(self):
+        from core.game import Game
+        juego = Game("A", "B")
+        juego.__movimientos_disponibles__ = [3, 1]
+        jugada, _ = Buscador(profundidad=1).buscar_en_juego(juego)
+        self.assertIn(jugada, juego.generar_jugadas_legales())
+
+    def test_evaluacion_estatica_y_final(self):
+        self.assertGreater(evaluar_estatico(self.tablero, 'B'), -1.0)
+        self.assertAlmostEqual(evaluar_estatico(self.tablero, 'B'), -evaluar_estatico(self.tablero, 'N'))
+        conteos = conteos_de({20: -15})
+        self.tablero.cargar_posicion(conteos, fuera=(15, 0))
+        self.assertEqual(valor_final(self.tablero, 'B'), 3.0)
+        self.assertEqual(evaluar_estatico(self.tablero, 'B'), 3.0)
+        self.assertEqual(evaluar_estatico(self.tablero, 'N'), -3.0)
+        conteos[20] = 0
+        conteos[10] = -15
+        self.tablero.cargar_posicion(conteos, fuera=(15, 0))
+        self.assertEqual(valor_final(self.tablero, 'B'), 2.0)
+        self.tablero.cargar_posicion([0] * 24, barra=(0, 15), fuera=(15, 0))
+        self.assertEqual(valor_final(self.tablero, 'B'), 3.0)
+        self.tablero.cargar_posicion([0] * 24, barra=(0, 14), fuera=(15, 1))
+        self.assertEqual(valor_final(self.tablero, 'B'), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from core.board import Tablero
+from core.position_id import codificar_id_posicion
+from engine.policies import crear_politica, Politica, PoliticaAleatoria, PoliticaGolosa
+from engine.simulator import simular, jugar_partida, semilla_partida, Resumen, main
+from test.posiciones import cargar
+
+
+class TestSimulator(unittest.TestCase):
+    """Pruebas unitarias para el simulador de partidas sin interfaz."""
+
+    def setUp(self):
+        # Final de partida: a cada color le queda una ficha en casa
+        tablero = Tablero()
+        cargar(tablero, {23: 1, 0: -1}, fuera=(14, 14))
+        self.posicion = codificar_id_posicion(tablero, 'B')
+
+    def test_golosa_gana_en_el_primer_turno(self):
+        resultado = jugar_partida(PoliticaGolosa(), PoliticaAleatoria(), semilla=5, posicion=self.posicion)
+        self.assertEqual(resultado.ganador, 'B')
+        self.assertEqual(resultado.turnos, 1)
+        self.assertEqual(resultado.puntos, 1)
+        self.assertEqual(resultado.tipo_victoria(), 'simple')
+        self.assertEqual(resultado.como_dict()['tipo_victoria'], 'simple')
+
+    def test_partida_completa_desde_la_posicion_inicial(self):
+        for semilla in range(3):
+            resultado = jugar_partida(PoliticaGolosa(), PoliticaAleatoria(), semilla=semilla)
+            self.assertIn(resultado.ganador, ('B', 'N'))
+            self.assertIn(resultado.puntos, (1, 2, 3))
+            self.assertLess(resultado.turnos, 1000)
+
+    def test_tope_de_turnos_sin_ganador(self):
+        resultado = jugar_partida(PoliticaAleatoria(), PoliticaAleatoria(), semilla=1, max_turnos=5)
+        self.assertIsNone(resultado.ganador)
+        self.assertEqual(resultado.puntos, 0)
+        self.assertEqual(resultado.turnos, 5)
+        self.assertIsNone(resultado.tipo_victoria())
+
+    def test_resultados_deterministas_e_independientes_de_los_procesos(self):
+        en_serie = sorted(simular(12, 'aleatoria', 'aleatoria', procesos=1, semilla=3,
+                                  max_turnos=60, posicion=self.posicion))
+        en_paralelo = sorted(simular(12, 'aleatoria', 'aleatoria', procesos=2, semilla=3,
+                                     max_turnos=60, posicion=self.posicion))
+        self.assertEqual(en_serie, en_paralelo)
+        self.assertEqual([r.indice for r in en_serie], list(range(12)))
+        self.assertEqual(en_serie[4].semilla, semilla_partida(3, 4))
+
+    def test_resumen(self):
+        resumen = Resumen()
+        for resultado in simular(6, 'golosa', ('busqueda', {'profundidad': 1}), semilla=2,
+                                 max_turnos=40, posicion=self.posicion):
+            resumen.agregar(resultado)
+        datos = resumen.como_dict()
+        self.assertEqual(datos['partidas'], 6)
+        self.assertEqual(sum(datos['victorias'].values()) + datos['sin_ganador'], 6)
+        self.assertEqual(sum(datos['tipos'].values()), sum(datos['victorias'].values()))
+        self.assertGreater(resumen.partidas_por_segundo(), 0)
+
+    @patch('builtins.print')
+    def test_main(self, mock_print):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'resultados.jsonl')
+            main(['--partidas', '4', '--procesos', '2', '--blancas', 'golosa', '--negras', 'aleatoria',
+                  '--semilla', '7', '--salida', ruta])
+            with open(ruta, encoding='utf-8') as archivo:
+                resultados = [json.loads(linea) for linea in archivo]
+        self.assertEqual(sorted(r['indice'] for r in resultados), [0, 1, 2, 3])
+        resumen = json.loads(mock_print.call_args.args[0])
+        self.assertEqual(resumen['partidas'], 4)
+        # Desde la posición inicial todas las partidas terminan con un ganador
+        self.assertEqual(resumen['sin_ganador'], 0)
+        self.assertEqual(sum(resumen['victorias'].values()), 4)
+
+    @patch('builtins.print')
+    def test_main_sin_partidas_terminadas(self, mock_print):
+        # Dos turnos desde la posición inicial no alcanzan para terminar: se informa en vez del resumen
+        with patch('sys.stderr') as mock_stderr:
+            with self.assertRaises(SystemExit) as contexto:
+                main(['--partidas', '2', '--procesos', '1', '--max-turnos', '2'])
+        self.assertEqual(contexto.exception.code, 1)
+        self.assertIn("Ninguna de las 2 partidas", mock_stderr.write.call_args.args[0])
+        mock_print.assert_not_called()
+
+    def test_parametros_invalidos(self):
+        with self.assertRaises(ValueError):
+            crear_politica('inexistente')
+        with self.assertRaises(ValueError):
+            list(simular(1, procesos=0))
+        with self.assertRaises(ValueError):
+            list(simular(-1))
+        # La interfaz base es abstracta: hay que implementar elegir
+        with self.assertRaises(TypeError):
+            Politica()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from core.tables import (
+    INDICE_COLOR, DESTINO, SALIDA, SALIDA_EXACTA, SALIDA_CON_MAYOR,
+    ENTRADA, DADO_ENTRADA, DADO_SALIDA, PIPS, PUNTO_SALIDA,
+)
+
+
+class TestTables(unittest.TestCase):
+    """Pruebas unitarias para las tablas de movimiento precalculadas."""
+
+    def test_destinos_respetan_direccion(self):
+        b, n = INDICE_COLOR['B'], INDICE_COLOR['N']
+        self.assertEqual(DESTINO[b][5][13], 18)
+        self.assertIsNone(DESTINO[b][3][22])
+        self.assertEqual(DESTINO[n][5][5], 0)
+        self.assertIsNone(DESTINO[n][3][2])
+
+    def test_entradas_y_dados_de_entrada(self):
+        for dado in range(1, 7):
+            self.assertEqual(ENTRADA[0][dado], dado - 1)
+            self.assertEqual(ENTRADA[1][dado], 24 - dado)
+            self.assertEqual(DADO_ENTRADA[0][dado - 1], dado)
+            self.assertEqual(DADO_ENTRADA[1][24 - dado], dado)
+        self.assertIsNone(DADO_ENTRADA[0][10])
+        self.assertIsNone(DADO_ENTRADA[1][10])
+
+    def test_salidas(self):
+        self.assertEqual(DADO_SALIDA[0][23], 1)
+        self.assertEqual(DADO_SALIDA[1][5], 6)
+        self.assertIsNone(DADO_SALIDA[0][5])
+        self.assertEqual(SALIDA[0][1][23], SALIDA_EXACTA)
+        self.assertEqual(SALIDA[0][6][20], SALIDA_CON_MAYOR)
+        self.assertIsNone(SALIDA[0][2][18])
+        self.assertEqual(SALIDA[1][4][3], SALIDA_EXACTA)
+        self.assertIsNone(SALIDA[1][6][10])
+
+    def test_pips_coinciden_con_los_movimientos(self):
+        for c in (0, 1):
+            self.assertEqual(sorted(PIPS[c]), list(range(1, 25)))
+            for dado in range(1, 7):
+                self.assertEqual(DADO_SALIDA[c][PUNTO_SALIDA[c][dado]], dado)
+                self.assertEqual(PIPS[c][ENTRADA[c][dado]], 25 - dado)
+                for origen, destino in enumerate(DESTINO[c][dado]):
+                    if destino is not None:
+                        self.assertEqual(PIPS[c][origen] - PIPS[c][destino], dado)
+
+
+if __name__ == '__main__':
+    unittest.main()
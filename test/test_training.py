@@ -0,0 +1,157 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from core.board import Tablero
+from core.position_id import codificar_id_posicion
+from engine.neural import RedNeuronal, SALIDAS
+from engine.training import (
+    Entrenador, PesosCompartidos, entrenar, invertir, jugar_autojuego, main, objetivos_lambda,
+)
+from test.posiciones import cargar
+
+
+class TestTraining(unittest.TestCase):
+    """Pruebas unitarias para el entrenamiento TD(λ) por autojuego."""
+
+    def setUp(self):
+        # Final corto (ambos colores sacando fichas) para que las partidas terminen rápido.
+        tablero = Tablero()
+        cargar(tablero, {23: 2, 22: 1, 0: -2, 1: -1}, fuera=(12, 12))
+        self.posicion = codificar_id_posicion(tablero, 'B')
+        self.red = RedNeuronal(ocultas=8, semilla=2)
+
+    def test_invertir_es_involucion(self):
+        p = np.array([0.7, 0.2, 0.05, 0.1, 0.01])
+        self.assertTrue(np.allclose(invertir(p), [0.3, 0.1, 0.01, 0.2, 0.05]))
+        self.assertTrue(np.allclose(invertir(invertir(p)), p))
+
+    def test_objetivos_lambda(self):
+        predicciones = np.array([[0.5, 0, 0, 0, 0], [0.6, 0, 0, 0, 0], [0.2, 0, 0, 0, 0]])
+        resultado = np.array([1.0, 0, 0, 0, 0])
+        # λ = 1: cada posición aprende el resultado final visto desde su turno
+        objetivos, entrenables = objetivos_lambda(predicciones, resultado, 1.0)
+        self.assertEqual(entrenables, 3)
+        self.assertEqual(list(objetivos[:, 0]), [1.0, 0.0, 1.0])
+        # λ = 0: TD(0), cada posición aprende la predicción siguiente invertida
+        objetivos, _ = objetivos_lambda(predicciones, resultado, 0.0)
+        self.assertTrue(np.allclose(objetivos[:2, 0], [0.4, 0.8]))
+        # Partida cortada: la última posición sólo sirve de arranque
+        objetivos, entrenables = objetivos_lambda(predicciones, None, 0.0)
+        self.assertEqual(entrenables, 2)
+        self.assertTrue(np.allclose(objetivos[:, 0], [0.4, 0.8]))
+
+    def test_autojuego(self):
+        trayectoria = jugar_autojuego(self.red, semilla=4, posicion=self.posicion)
+        self.assertIsNotNone(trayectoria.resultado)
+        self.assertEqual(trayectoria.resultado.shape, (SALIDAS,))
+        self.assertEqual(trayectoria.conteos.shape, (len(trayectoria), 24))
+        self.assertFalse(trayectoria.turno_negro[0])
+        self.assertEqual(trayectoria.codificar().shape[0], len(trayectoria))
+        repetida = jugar_autojuego(self.red, semilla=4, posicion=self.posicion)
+        self.assertTrue(np.array_equal(trayectoria.conteos, repetida.conteos))
+        cortada = jugar_autojuego(self.red, semilla=4, max_turnos=3)
+        self.assertIsNone(cortada.resultado)
+        self.assertEqual(len(cortada), 4)
+        # Con exploración total las jugadas salen del generador, no de la red
+        explorada = jugar_autojuego(self.red, semilla=4, max_turnos=6, exploracion=1.0)
+        self.assertEqual(len(explorada), 7)
+        self.assertTrue(np.array_equal(explorada.conteos[0], cortada.conteos[0]))
+
+    def test_autojuego_desde_la_posicion_inicial_termina(self):
+        entradas = []
+        entrenar(2, RedNeuronal(ocultas=8, semilla=1), partidas_por_lote=1, registrar_cada=1,
+                 informar=entradas.append)
+        self.assertGreater(entradas[-1]['terminadas'], 0)
+        trayectoria = jugar_autojuego(self.red, semilla=1)
+        self.assertIsNotNone(trayectoria.resultado)
+        # La recompensa terminal es una victoria de quien movió último
+        self.assertEqual(trayectoria.resultado[0], 1.0)
+        self.assertLess(len(trayectoria), 500)
+
+    def test_entrenador_actualiza_por_lotes(self):
+        entrenador = Entrenador(self.red, alfa=0.5, partidas_por_lote=2)
+        antes = self.red.obtener_parametros()
+        self.assertFalse(entrenador.agregar(jugar_autojuego(self.red, 1, posicion=self.posicion)))
+        self.assertTrue(entrenador.agregar(jugar_autojuego(self.red, 2, posicion=self.posicion)))
+        self.assertEqual(entrenador.actualizaciones, 1)
+        self.assertIsNotNone(entrenador.ultima_perdida)
+        self.assertFalse(np.array_equal(antes, self.red.obtener_parametros()))
+        self.assertIs(entrenador.obtener_red(), self.red)
+        with self.assertRaises(ValueError):
+            Entrenador(self.red, lam=2.0)
+        with self.assertRaises(ValueError):
+            Entrenador(self.red, partidas_por_lote=0)
+
+    def test_pesos_compartidos(self):
+        import multiprocessing
+        pesos = PesosCompartidos(self.red.cantidad_parametros(), bloqueo=multiprocessing.Lock())
+        try:
+            pesos.publicar(self.red)
+            self.assertEqual(pesos.version(), 1)
+            copia = RedNeuronal(ocultas=8, semilla=9)
+            self.assertEqual(pesos.copiar_a(copia), 1)
+            self.assertTrue(np.array_equal(copia.obtener_parametros(), self.red.obtener_parametros()))
+        finally:
+            pesos.cerrar()
+
+    def test_trabajador_cierra_los_pesos(self):
+        import multiprocessing
+        from engine import training
+        pesos = PesosCompartidos(self.red.cantidad_parametros(), bloqueo=multiprocessing.Lock())
+        try:
+            pesos.publicar(self.red)
+            configuracion = {'max_turnos': 10, 'posicion': None, 'exploracion': 0.0}
+            training._iniciar_trabajador(pesos.obtener_nombre(), multiprocessing.Lock(), 8, configuracion)
+            trabajador = training._TRABAJADOR
+            self.assertEqual(len(training._jugar_en_trabajador(1)), len(jugar_autojuego(self.red, 1, 10)))
+            self.assertEqual(trabajador['version'], 1)
+            trabajador['cierre']()
+            self.assertIsNone(trabajador['pesos'].__memoria__.buf)
+            self.assertEqual(pesos.version(), 1)
+        finally:
+            training._TRABAJADOR.clear()
+            pesos.cerrar()
+
+    def test_entrenar_con_checkpoints_y_registro(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            for procesos in (1, 2):
+                carpeta = os.path.join(directorio, str(procesos))
+                red = entrenar(8, RedNeuronal(ocultas=8, semilla=0), procesos=procesos, partidas_por_lote=4,
+                               posicion=self.posicion, directorio=carpeta, checkpoint_cada=4, registrar_cada=4)
+                self.assertTrue(os.path.exists(os.path.join(carpeta, 'red_4.npz')))
+                self.assertEqual(RedNeuronal.cargar(os.path.join(carpeta, 'red_ultima.npz')).obtener_ocultas(), 8)
+                with open(os.path.join(carpeta, 'registro.jsonl'), encoding='utf-8') as archivo:
+                    registro = [json.loads(linea) for linea in archivo]
+                self.assertEqual(registro[-1]['partidas'], 8)
+                self.assertEqual(registro[-1]['terminadas'], 8)
+                self.assertEqual(registro[-1]['actualizaciones'], 2)
+                self.assertIsNotNone(registro[-1]['perdida'])
+                self.assertGreater(registro[-1]['partidas_por_segundo'], 0)
+                self.assertEqual(red.obtener_ocultas(), 8)
+        with self.assertRaises(ValueError):
+            entrenar(1, procesos=0)
+        with self.assertRaises(ValueError):
+            entrenar(-1)
+
+    @patch('builtins.print')
+    def test_main(self, mock_print):
+        with tempfile.TemporaryDirectory() as directorio:
+            argumentos = ['--partidas', '4', '--procesos', '1', '--ocultas', '8', '--lote', '2',
+                          '--posicion', self.posicion, '--directorio', directorio]
+            main(argumentos)
+            ultima = os.path.join(directorio, 'red_ultima.npz')
+            self.assertEqual(RedNeuronal.cargar(ultima).obtener_ocultas(), 8)
+            # Continuar desde los pesos guardados
+            main(argumentos[:4] + argumentos[6:] + ['--desde', ultima])
+            with open(os.path.join(directorio, 'registro.jsonl'), encoding='utf-8') as archivo:
+                registro = [json.loads(linea) for linea in archivo]
+        self.assertEqual([entrada['partidas'] for entrada in registro], [4, 4])
+        self.assertIn("4 partidas", mock_print.call_args.args[0])
+        self.assertIn("partidas/s", mock_print.call_args.args[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+from core.board import Tablero
+from engine.search import Buscador
+from engine.transposition import (TablaTransposicion, EXACTA, INFERIOR, SUPERIOR,
+                                  valor_utilizable, tipo_de_valor)
+from test.posiciones import cargar
+
+
+class TestTablaTransposicion(unittest.TestCase):
+    """Pruebas unitarias para la tabla de transposición acotada."""
+
+    def test_guardar_y_buscar_cuenta_aciertos_y_fallos(self):
+        tabla = TablaTransposicion(capacidad=4)
+        self.assertIsNone(tabla.buscar(1))
+        tabla.guardar(1, 2, 0.5, EXACTA, ((5, 0, 5),))
+        entrada = tabla.buscar(1)
+        self.assertEqual(entrada.profundidad, 2)
+        self.assertEqual(entrada.valor, 0.5)
+        self.assertEqual(entrada.jugada, ((5, 0, 5),))
+        self.assertEqual((tabla.aciertos, tabla.fallos), (1, 1))
+        self.assertAlmostEqual(tabla.tasa_aciertos(), 0.5)
+
+    def test_no_reemplaza_con_menor_profundidad(self):
+        tabla = TablaTransposicion(capacidad=4)
+        tabla.guardar(1, 3, 0.5)
+        tabla.guardar(1, 1, -0.5)
+        self.assertEqual(tabla.buscar(1).valor, 0.5)
+        tabla.guardar(1, 3, 0.25)
+        self.assertEqual(tabla.buscar(1).valor, 0.25)
+
+    def test_lru_desaloja_la_menos_usada(self):
+        tabla = TablaTransposicion(capacidad=2, politica='lru')
+        tabla.guardar('a', 1, 0.1)
+        tabla.guardar('b', 1, 0.2)
+        tabla.buscar('a')
+        tabla.guardar('c', 1, 0.3)
+        self.assertEqual(len(tabla), 2)
+        self.assertEqual(tabla.desalojos, 1)
+        self.assertIsNotNone(tabla.buscar('a'))
+        self.assertIsNone(tabla.buscar('b'))
+
+    def test_profundidad_conserva_las_entradas_profundas(self):
+        tabla = TablaTransposicion(capacidad=2, politica='profundidad')
+        tabla.guardar('a', 3, 0.1)
+        tabla.guardar('b', 3, 0.2)
+        tabla.guardar('c', 1, 0.3)
+        self.assertEqual(tabla.descartes, 1)
+        self.assertIsNone(tabla.buscar('c'))
+        tabla.guardar('d', 3, 0.4)
+        self.assertEqual(len(tabla), 2)
+        self.assertEqual(tabla.desalojos, 1)
+        self.assertIsNotNone(tabla.buscar('d'))
+
+    def test_parametros_invalidos_y_limpiar(self):
+        with self.assertRaises(ValueError):
+            TablaTransposicion(capacidad=0)
+        with self.assertRaises(ValueError):
+            TablaTransposicion(politica='fifo')
+        tabla = TablaTransposicion(capacidad=2)
+        tabla.guardar(1, 0, 0.0)
+        tabla.buscar(1)
+        tabla.limpiar()
+        self.assertEqual(len(tabla), 0)
+        self.assertEqual(tabla.como_dict()['aciertos'], 0)
+
+    def test_cotas(self):
+        self.assertEqual(tipo_de_valor(-0.5, -0.2, 0.2), SUPERIOR)
+        self.assertEqual(tipo_de_valor(0.5, -0.2, 0.2), INFERIOR)
+        self.assertEqual(tipo_de_valor(0.0, -0.2, 0.2), EXACTA)
+        tabla = TablaTransposicion()
+        tabla.guardar(1, 2, 0.5, INFERIOR)
+        entrada = tabla.buscar(1)
+        self.assertEqual(valor_utilizable(entrada, 2, -1.0, 0.4), 0.5)
+        self.assertIsNone(valor_utilizable(entrada, 2, -1.0, 0.6))
+        self.assertIsNone(valor_utilizable(entrada, 3, -1.0, 0.4))
+
+    def test_busqueda_con_tabla_da_el_mismo_valor(self):
+        tablero = Tablero()
+        cargar(tablero, {3: 2, 1: 1, 20: -2, 22: -1}, fuera=(12, 12))
+        # Sin el atajo de carreras para que la búsqueda recorra la tabla
+        sin_tabla = Buscador(profundidad=2, capacidad_tabla=0, carreras=False)
+        _, esperado = sin_tabla.buscar(tablero, 'B', [6, 1])
+        self.assertIsNone(sin_tabla.obtener_tabla())
+        for politica in ('lru', 'profundidad'):
+            buscador = Buscador(profundidad=2, capacidad_tabla=64, politica_tabla=politica, carreras=False)
+            _, valor = buscador.buscar(tablero, 'B', [6, 1])
+            self.assertAlmostEqual(valor, esperado)
+            tabla = buscador.obtener_tabla()
+            self.assertLessEqual(len(tabla), 64)
+            self.assertGreater(tabla.aciertos, 0)
+            # La segunda búsqueda reutiliza la tabla
+            _, valor = buscador.buscar(tablero, 'B', [6, 1])
+            self.assertAlmostEqual(valor, esperado)
+            self.assertGreater(buscador.obtener_estadisticas().cortes_tabla, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import os, sys, time
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from core.board import Tablero
+from core.moves import generar_jugadas
+
+# Benchmark del generador de jugadas: posiciones exploradas por segundo
+# (cada submovimiento aplicado cuenta como una posición) sobre las 21 tiradas.
+TIRADAS = [(a, b) for a in range(1, 7) for b in range(a, 7)]
+
+tablero = Tablero()
+contador = {'posiciones': 0}
+aplicar_original = tablero.aplicar
+
+def aplicar_contando(color, origen, destino):
+    contador['posiciones'] += 1
+    return aplicar_original(color, origen, destino)
+
+tablero.aplicar = aplicar_contando
+
+inicio = time.perf_counter()
+jugadas_totales = 0
+for _ in range(20):
+    for color in ('B', 'N'):
+        for a, b in TIRADAS:
+            dados = [a] * 4 if a == b else [a, b]
+            jugadas_totales += len(generar_jugadas(tablero, color, dados))
+transcurrido = time.perf_counter() - inicio
+
+print(f"Jugadas generadas: {jugadas_totales}")
+print(f"Posiciones exploradas: {contador['posiciones']}")
+print(f"Posiciones por segundo: {contador['posiciones'] / transcurrido:,.0f}")